@@ -0,0 +1,284 @@
+import hashlib, json, re, sqlite3, threading, time
+from importlib import metadata
+
+# Bump when resume extraction or normalization changes, so cached resume text is extracted again
+RESUME_EXTRACTOR_VERSION = 1
+
+
+def normalize_question(question_text):
+    """Lowercase, collapse whitespace and drop trailing punctuation/required markers."""
+    text = re.sub(r'\s+', ' ', str(question_text).lower()).strip()
+    return re.sub(r'[\s*?:.!]+$', '', text)
+
+
+def context_hash(context):
+    return hashlib.sha256(context.encode('utf-8')).hexdigest()[:16]
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def normalize_resume_text(text):
+    """Collapse whitespace within lines and runs of blank lines, as sent in prompts."""
+    lines = [' '.join(line.split()) for line in text.splitlines()]
+    return re.sub(r'\n{3,}', '\n\n', '\n'.join(lines)).strip()
+
+
+def extract_resume_text(path, pdf):
+    """Return the text of a resume file, read page by page with pypdf if pdf is True."""
+    if not pdf:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    from pypdf import PdfReader  # only needed when the text is not cached yet
+    return "\n".join(page.extract_text() or '' for page in PdfReader(path).pages)
+
+
+def resume_parser_version():
+    try:
+        pypdf_version = metadata.version('pypdf')
+    except metadata.PackageNotFoundError:
+        pypdf_version = 'unknown'
+    return f"{RESUME_EXTRACTOR_VERSION}/pypdf-{pypdf_version}"
+
+
+class ResponseCache:
+    """
+    Disk-backed cache of AI answers to application questions.
+
+    Entries are keyed by the normalized question, the response type, the option list and a hash
+    of the candidate context, so editing the resume or personal info invalidates them. Entries
+    expire after ttl_days and the least recently used ones are evicted beyond max_entries.
+    """
+
+    def __init__(self, path="ai_cache.db", ttl_days=90, max_entries=5000):
+        self.path = path
+        self.ttl = ttl_days * 24 * 3600 if ttl_days else None
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, "
+            "question TEXT NOT NULL, "
+            "response_type TEXT NOT NULL, "
+            "options TEXT, "
+            "context_hash TEXT, "
+            "answer TEXT NOT NULL, "
+            "created_at REAL NOT NULL, "
+            "last_used REAL NOT NULL, "
+            "hits INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(question_text, response_type, options, candidate_hash):
+        option_texts = [str(text).strip().lower() for _, text in options] if options else []
+        raw = json.dumps([normalize_question(question_text), response_type, option_texts, candidate_hash])
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, question_text, response_type, options, candidate_hash):
+        """Return (True, answer) on a hit, (False, None) on a miss or an expired entry."""
+        key = self.make_key(question_text, response_type, options, candidate_hash)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT answer, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None and self.ttl and now - row[1] > self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return False, None
+            self._conn.execute("UPDATE responses SET last_used = ?, hits = hits + 1 WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return True, json.loads(row[0])
+
+    def put(self, question_text, response_type, options, candidate_hash, answer):
+        key = self.make_key(question_text, response_type, options, candidate_hash)
+        now = time.time()
+        option_texts = json.dumps([text for _, text in options]) if options else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, question, response_type, options, context_hash, answer, created_at, last_used, hits) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)",
+                (key, normalize_question(question_text), response_type, option_texts, candidate_hash,
+                 json.dumps(answer), now, now)
+            )
+            if self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    "SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                )
+            self._conn.commit()
+
+    def stats(self):
+        with self._lock:
+            entries, total_hits, oldest = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(hits), 0), MIN(created_at) FROM responses").fetchone()
+        return {
+            'entries': entries,
+            'stored_hits': total_hits,
+            'oldest': time.strftime('%Y-%m-%d %H:%M', time.localtime(oldest)) if oldest else None,
+            'session_hits': self.hits,
+            'session_misses': self.misses,
+        }
+
+    def entries(self, limit=50, pattern=None):
+        """Return (question, response_type, answer, hits, last_used) rows, most used first."""
+        query = "SELECT question, response_type, answer, hits, last_used FROM responses"
+        params = []
+        if pattern:
+            query += " WHERE question LIKE ?"
+            params.append(f"%{pattern.lower()}%")
+        query += " ORDER BY hits DESC, last_used DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            return self._conn.execute(query, params).fetchall()
+
+    def purge(self, older_than_days=None, pattern=None):
+        """Delete entries (all, older than N days, and/or whose question contains pattern). Returns the count."""
+        conditions, params = [], []
+        if older_than_days is not None:
+            conditions.append("created_at < ?")
+            params.append(time.time() - older_than_days * 24 * 3600)
+        if pattern:
+            conditions.append("question LIKE ?")
+            params.append(f"%{pattern.lower()}%")
+        query = "DELETE FROM responses" + (" WHERE " + " AND ".join(conditions) if conditions else "")
+        with self._lock:
+            deleted = self._conn.execute(query, params).rowcount
+            self._conn.commit()
+        return deleted
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class FitVerdictCache:
+    """
+    Persisted APPLY/SKIP verdicts from the job-fit evaluation.
+
+    Verdicts are looked up by LinkedIn job ID (so a job reached again through another search
+    costs nothing, not even reading its description) and by a hash of the job description
+    (so reposts under a new ID are recognized). Both are scoped to the candidate context hash.
+    """
+
+    def __init__(self, path="ai_cache.db"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS job_fit ("
+            "job_id INTEGER, "
+            "description_hash TEXT NOT NULL, "
+            "context_hash TEXT NOT NULL, "
+            "apply INTEGER NOT NULL, "
+            "reason TEXT, "
+            "created_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS job_fit_job_id ON job_fit (job_id, context_hash)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS job_fit_description ON job_fit (description_hash, context_hash)")
+        self._conn.commit()
+
+    @staticmethod
+    def description_hash(job_title, job_description):
+        text = re.sub(r'\s+', ' ', f"{job_title}\n{job_description}".lower()).strip()
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def get(self, candidate_hash, job_id=None, description_hash=None):
+        """Return (apply, reason) for a known job or description, otherwise None."""
+        with self._lock:
+            row = None
+            if job_id is not None:
+                row = self._conn.execute(
+                    "SELECT apply, reason FROM job_fit WHERE job_id = ? AND context_hash = ? "
+                    "ORDER BY created_at DESC LIMIT 1", (job_id, candidate_hash)).fetchone()
+            if row is None and description_hash is not None:
+                row = self._conn.execute(
+                    "SELECT apply, reason FROM job_fit WHERE description_hash = ? AND context_hash = ? "
+                    "ORDER BY created_at DESC LIMIT 1", (description_hash, candidate_hash)).fetchone()
+        if row is None:
+            return None
+        return bool(row[0]), row[1]
+
+    def put(self, candidate_hash, job_id, description_hash, apply, reason=None):
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO job_fit (job_id, description_hash, context_hash, apply, reason, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, description_hash, candidate_hash, int(apply), reason, time.time())
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class ResumeTextCache:
+    """
+    Text extracted from resume files, keyed by a hash of the file's content and the parser
+    version, so a resume is only parsed again when it (or pypdf) changes. The raw text and the
+    whitespace-normalized text used in prompts are both stored. Runs in parallel share the
+    cache through the same SQLite file.
+    """
+
+    def __init__(self, path="ai_cache.db"):
+        self.path = path
+        self.parser_version = resume_parser_version()
+        self._lock = threading.Lock()
+        # Other processes may be writing the same file, so wait for their locks instead of failing
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS resume_text ("
+            "content_hash TEXT NOT NULL, "
+            "parser_version TEXT NOT NULL, "
+            "source TEXT, "
+            "text TEXT NOT NULL, "
+            "normalized TEXT NOT NULL, "
+            "created_at REAL NOT NULL, "
+            "PRIMARY KEY (content_hash, parser_version))"
+        )
+        self._conn.commit()
+
+    def load(self, path, pdf):
+        """
+        Return (text, normalized, cached) for the resume at path, extracting and storing it on a
+        miss. Raises OSError if the file cannot be read.
+        """
+        content_hash = file_hash(path)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text, normalized FROM resume_text WHERE content_hash = ? AND parser_version = ?",
+                (content_hash, self.parser_version)).fetchone()
+        if row is not None:
+            return row[0], row[1], True
+        text = extract_resume_text(path, pdf)
+        normalized = normalize_resume_text(text)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO resume_text "
+                "(content_hash, parser_version, source, text, normalized, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (content_hash, self.parser_version, path, text, normalized, time.time())
+            )
+            self._conn.commit()
+        return text, normalized, False
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
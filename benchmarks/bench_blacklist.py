@@ -0,0 +1,101 @@
+"""
+Micro-benchmark: per-card cost of the blacklist checks as the blacklists grow.
+
+Usage: python benchmarks/bench_blacklist.py [--sizes 10,100,1000,10000,50000] [--cards 2000]
+
+For each size, company, title and poster blacklists of that many generated entries are checked
+against the same cards, with the original list scans and with BlacklistIndex. The index is
+built once per size (as the bot does at startup); its build time is reported separately.
+"""
+import argparse, os, random, sys, time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from blacklist import BlacklistIndex
+
+TITLES = [
+    "Senior Python Developer", "Software Engineer II", "Sr. Data Engineer (Remote)", "Staff Backend Engineer, Payments",
+    "Machine Learning Engineer - NLP", "Full Stack Developer", "DevOps Engineer", "Engineering Manager, Platform",
+    "Junior Frontend Developer", "Principal Software Architect", "QA Automation Engineer", "Site Reliability Engineer",
+]
+COMPANIES = ["Acme, Inc.", "Globex Corporation", "Initech LLC", "Umbrella Corp", "Hooli", "Stark Industries",
+             "Wayne Enterprises", "Soylent GmbH", "Cyberdyne Systems", "Tyrell Corporation"]
+POSTERS = ["", "", "Jane Doe", "John Smith", "Alex Kim", "Maria Garcia"]
+
+
+class LegacyBlacklist:
+    """The list scans as they were before BlacklistIndex, kept here only for comparison."""
+
+    def __init__(self, companies, titles, posters):
+        self.company_blacklist = companies
+        self.title_blacklist = titles
+        self.poster_blacklist = posters
+
+    def reasons(self, job_title, company, poster):
+        contains_blacklisted_keywords = False
+        blacklisted_word_found = ""
+        job_title_parsed = job_title.lower().split(' ')
+        for word in self.title_blacklist:
+            if word.lower() in job_title_parsed:
+                contains_blacklisted_keywords = True
+                blacklisted_word_found = word
+                break
+
+        reasons = []
+        if contains_blacklisted_keywords:
+            reasons.append(f"job title contains blacklisted keyword '{blacklisted_word_found}'")
+        if company.lower() in [word.lower() for word in self.company_blacklist]:
+            reasons.append(f"company '{company}' is blacklisted")
+        if poster.lower() in [word.lower() for word in self.poster_blacklist]:
+            reasons.append(f"poster '{poster}' is blacklisted")
+        return reasons
+
+
+def blacklists(size, rng):
+    """Generated entries that never match the cards, plus one real entry per list at the end (the worst case for a scan)."""
+    companies = [f"Company {index} Holdings" for index in range(size - 1)] + ["Hooli"]
+    titles = [f"keyword{index}" for index in range(size - 1)] + ["junior"]
+    posters = [f"Person {index}" for index in range(size - 1)] + ["John Smith"]
+    rng.shuffle(companies)
+    return companies, titles, posters
+
+
+def cards(count, rng):
+    return [(rng.choice(TITLES), rng.choice(COMPANIES), rng.choice(POSTERS)) for _ in range(count)]
+
+
+def measure(checker, corpus, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for title, company, poster in corpus:
+            checker.reasons(title, company, poster)
+        best = min(best, time.perf_counter() - started)
+    return best / len(corpus)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='10,100,1000,10000,50000')
+    parser.add_argument('--cards', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    corpus = cards(args.cards, rng)
+    print(f"{args.cards} cards per pass, best of {args.repeat}")
+    print(f"{'entries':>8}{'list scan us/card':>20}{'index us/card':>16}{'index build ms':>16}")
+    for size in (int(size) for size in args.sizes.split(',')):
+        companies, titles, posters = blacklists(size, rng)
+        legacy = LegacyBlacklist(companies, titles, posters)
+        started = time.perf_counter()
+        index = BlacklistIndex(companies, titles, posters)
+        build_time = time.perf_counter() - started
+        # Scans get slow with big lists; fewer cards keep the run short without changing the per-card cost
+        scan_corpus = corpus[:max(20, args.cards * 100 // size)]
+        legacy_time = measure(legacy, scan_corpus, args.repeat)
+        index_time = measure(index, corpus, args.repeat)
+        print(f"{size:>8}{legacy_time * 1e6:>20.1f}{index_time * 1e6:>16.2f}{build_time * 1000:>16.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark: page-load latency and memory of the 'standard' and 'lean' browser profiles.
+
+Usage: python benchmarks/bench_browser_profile.py [--url URL ...] [--repeat 3]
+
+Each profile is started through main.init_browser with a throwaway user-data directory, loads
+every URL --repeat times, and reports the median time driver.get() blocked for, the median
+DOMContentLoaded time, bytes transferred and the resident memory of the whole Chrome process
+tree (chromedriver plus all of its children) after the last load. Requires psutil.
+Pass logged-in LinkedIn search URLs for realistic numbers; public pages work without a session.
+"""
+import argparse, os, shutil, statistics, sys, tempfile, time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import psutil
+from main import init_browser
+
+DEFAULT_URLS = [
+    'https://www.linkedin.com/jobs/search/?keywords=python%20developer',
+    'https://www.linkedin.com/jobs/',
+]
+
+PAGE_STATS_SCRIPT = """
+const navigation = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+return {
+    dom_content_loaded: navigation ? navigation.domContentLoadedEventEnd : 0,
+    transferred: resources.reduce((sum, entry) => sum + (entry.transferSize || 0), navigation ? navigation.transferSize : 0),
+    resources: resources.length
+};
+"""
+
+
+def tree_rss(pid):
+    process = psutil.Process(pid)
+    total = 0
+    for member in [process] + process.children(recursive=True):
+        try:
+            total += member.memory_info().rss
+        except psutil.NoSuchProcess:
+            pass
+    return total
+
+
+def run_profile(name, urls, repeat, port):
+    profile_dir = tempfile.mkdtemp(prefix=f'bench_{name}_')
+    driver = init_browser(profile_dir, port, {'profile': name})
+    try:
+        blocked, dom_loaded, transferred = [], [], []
+        for _ in range(repeat):
+            for url in urls:
+                started = time.perf_counter()
+                driver.get(url)
+                blocked.append(time.perf_counter() - started)
+                stats = driver.execute_script(PAGE_STATS_SCRIPT)
+                dom_loaded.append(stats['dom_content_loaded'] / 1000)
+                transferred.append(stats['transferred'])
+        rss = tree_rss(driver.service.process.pid)
+    finally:
+        driver.quit()
+        shutil.rmtree(profile_dir, ignore_errors=True)
+    return {
+        'get': statistics.median(blocked),
+        'dom': statistics.median(dom_loaded),
+        'kb': statistics.median(transferred) / 1024,
+        'rss': rss / (1024 * 1024),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--url', action='append', dest='urls')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    urls = args.urls or DEFAULT_URLS
+
+    results = {}
+    for port, name in enumerate(['standard', 'lean'], start=9300):
+        results[name] = run_profile(name, urls, args.repeat, port)
+
+    print(f"{len(urls)} URLs x {args.repeat} loads per profile")
+    print(f"{'profile':<10}{'get() p50':>12}{'DCL p50':>12}{'KB p50':>12}{'RSS MB':>10}")
+    for name, result in results.items():
+        print(f"{name:<10}{result['get']:>11.2f}s{result['dom']:>11.2f}s{result['kb']:>12.0f}{result['rss']:>10.0f}")
+    standard, lean = results['standard'], results['lean']
+    print(f"lean vs standard: get() {lean['get'] / standard['get']:.2f}x, "
+          f"RSS {lean['rss'] / standard['rss']:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
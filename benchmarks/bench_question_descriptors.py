@@ -0,0 +1,105 @@
+"""
+Benchmark: reading the questions of an Easy Apply step, per-element probing versus the single
+QUESTIONS_SCRIPT call.
+
+Usage: python benchmarks/bench_question_descriptors.py [--url URL] [--questions 12] [--repeat 10]
+                                                       [--implicit-wait 1]
+
+Without --url the recorded fixture benchmarks/fixtures/easy_apply_step.html is used, with its
+questions cloned until the form holds --questions of them. 'probing' classifies and reads each
+question the way the bot used to: up to five find_elements probes per question, then the label,
+options and id of the field element by element. The driver keeps the bot's implicit wait, which
+every probe that finds nothing pays in full. Reports the time per modal step and per question.
+"""
+import argparse, os, sys, time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import Select
+from linkedineasyapply import QUESTIONS_SCRIPT
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'easy_apply_step.html')
+
+# Clones the form's questions in turn (with fresh ids) until it holds arguments[0] of them
+GROW_FORM_SCRIPT = """
+const form = document.querySelector('.jobs-easy-apply-modal__content form');
+const originals = Array.from(form.querySelectorAll('.fb-dash-form-element'));
+for (let i = originals.length; i < arguments[0]; i++) {
+    const copy = originals[i % originals.length].cloneNode(true);
+    for (const el of copy.querySelectorAll('[id]')) el.id += '-' + i;
+    for (const el of copy.querySelectorAll('[for]')) el.htmlFor += '-' + i;
+    for (const el of copy.querySelectorAll('[name]')) el.name += '-' + i;
+    form.appendChild(copy);
+}
+"""
+
+
+def probing(form):
+    """The per-element reads the question handlers did before QUESTIONS_SCRIPT."""
+    questions = []
+    for question in form.find_elements(By.CLASS_NAME, 'fb-dash-form-element'):
+        if question.find_elements(By.TAG_NAME, 'fieldset'):
+            fieldset = question.find_element(By.TAG_NAME, 'fieldset')
+            label = fieldset.find_element(By.CLASS_NAME, 'fb-dash-form-element__label').find_elements(By.TAG_NAME, 'span')[0].text
+            questions.append(('radio', label, [option.text for option in fieldset.find_elements(By.TAG_NAME, 'label')]))
+        elif question.find_elements(By.TAG_NAME, 'input') or question.find_elements(By.TAG_NAME, 'textarea'):
+            label = question.find_element(By.TAG_NAME, 'label').text
+            try:
+                field = question.find_element(By.TAG_NAME, 'input')
+            except Exception:
+                field = question.find_element(By.TAG_NAME, 'textarea')
+            questions.append(('text', label, [field.get_attribute('value'), field.get_attribute('id')]))
+        elif question.find_elements(By.CLASS_NAME, 'artdeco-datepicker__input'):
+            questions.append(('date', '', []))
+        elif question.find_elements(By.TAG_NAME, 'select'):
+            label = question.find_element(By.TAG_NAME, 'label').text
+            select = Select(question.find_element(By.TAG_NAME, 'select'))
+            questions.append(('dropdown', label, [option.text for option in select.options]))
+        elif question.find_elements(By.XPATH, ".//label[input[@type='checkbox']]"):
+            questions.append(('checkbox', question.find_element(By.TAG_NAME, 'label').text, []))
+    return questions
+
+
+def descriptors(form):
+    return form.parent.execute_script(QUESTIONS_SCRIPT, form)
+
+
+def measure(driver, read, repeat):
+    timings, count = [], 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        form = driver.find_element(By.CSS_SELECTOR, '.jobs-easy-apply-modal__content form')
+        count = len(read(form))
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return count, timings[len(timings) // 2], timings[int(len(timings) * 0.95) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--url', default='file://' + FIXTURE)
+    parser.add_argument('--questions', type=int, default=12)
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--implicit-wait', type=float, default=1)
+    args = parser.parse_args()
+
+    options = Options()
+    options.add_argument('--headless=new')
+    driver = webdriver.Chrome(options=options)
+    try:
+        driver.get(args.url)
+        driver.execute_script(GROW_FORM_SCRIPT, args.questions)
+        driver.implicitly_wait(args.implicit_wait)
+
+        print(f"{'method':<12}{'questions':>11}{'p50 ms/step':>14}{'p95 ms/step':>14}{'ms/question':>14}")
+        for name, read in (('probing', probing), ('script', descriptors)):
+            count, p50, p95 = measure(driver, read, args.repeat)
+            print(f"{name:<12}{count:>11}{p50 * 1000:>14.1f}{p95 * 1000:>14.1f}{p50 * 1000 / max(count, 1):>14.1f}")
+    finally:
+        driver.quit()
+
+
+if __name__ == '__main__':
+    main()
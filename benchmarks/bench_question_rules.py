@@ -0,0 +1,392 @@
+"""
+Micro-benchmark: question rule engine versus the original if/elif answer chains.
+
+Usage: python benchmarks/bench_question_rules.py [question_catalog.db | questions.csv] [--repeat 20]
+
+The corpus is the distinct questions of the question catalog or of a CSV of [type, question]
+rows when available, plus the built-in sample questions and a few thousand generated from the
+usual screening question templates; no question appears twice. Lookups are
+reported unmemoized (the engine's match cache cleared before each pass, so every lookup runs the
+matcher) and memoized (every question already seen once), next to the old if/elif chains.
+"""
+import argparse, csv, os, sqlite3, sys, time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from question_rules import QuestionRuleEngine, DEFAULT_QUESTION_RULES
+
+SAMPLE_QUESTIONS = [
+    ('radio', "do you have a valid driver's license?"),
+    ('radio', "are you hispanic or latino?"),
+    ('radio', "do you identify as transgender?"),
+    ('radio', "are you willing to complete an assessment?"),
+    ('radio', "do you have an active security clearance?"),
+    ('radio', "have you previously been employed by this company?"),
+    ('radio', "do you hold a cpa certificate?"),
+    ('radio', "are you comfortable commuting to this job's location?"),
+    ('radio', "are you comfortable working in a remote setting?"),
+    ('radio', "are you willing to undergo a background check?"),
+    ('radio', "have you completed the following level of education: bachelor's degree?"),
+    ('radio', "will you now or in the future require sponsorship for employment visa status?"),
+    ('radio', "are you legally authorized to work in the united states?"),
+    ('text', "first name"),
+    ('text', "last name"),
+    ('text', "what are your preferred pronouns?"),
+    ('text', "mobile phone number"),
+    ('text', "linkedin profile"),
+    ('text', "portfolio / website url"),
+    ('text', "what is your current location?"),
+    ('text', "what is your desired salary?"),
+    ('text', "cover letter"),
+    ('text', "why do you want to work here?"),
+    ('numeric', "how many years of work experience do you have with python?"),
+    ('numeric', "what is your notice period in weeks?"),
+    ('numeric', "what are your compensation expectations?"),
+    ('numeric', "how many years of experience do you have with react.js?"),
+    ('dropdown', "what is your level of proficiency in english?"),
+    ('dropdown', "phone country code"),
+    ('dropdown', "are you above 18 years of age?"),
+    ('dropdown', "gender"),
+    ('dropdown', "are you comfortable working in a hybrid setting?"),
+    ('dropdown', "how did you hear about us?"),
+    ('radio', "do you have a valid driver's licence and access to a vehicle?"),
+    ('radio', "do you identify as a person with a disability?"),
+    ('radio', "are you an aboriginal or torres strait islander person?"),
+    ('radio', "have you ever worked in north korea?"),
+    ('radio', "are you available to start immediately for this urgent role?"),
+    ('radio', "are you willing to take a drug test?"),
+    ('radio', "do you consent to our data retention policy?"),
+    ('radio', "are you able to work onsite three days a week?"),
+    ('radio', "do you hold a professional qualification in project management?"),
+    ('radio', "are you a chartered accountant?"),
+    ('radio', "have you completed the following level of education: master's degree?"),
+    ('radio', "do you have experience with kubernetes?"),
+    ('radio', "are you willing to relocate?"),
+    ('radio', "can you work overtime when required?"),
+    ('radio', "do you have experience leading a team of engineers?"),
+    ('text', "what is your grade point average?"),
+    ('text', "preferred name"),
+    ('text', "phone"),
+    ('text', "github profile url"),
+    ('text', "message to hiring manager"),
+    ('text', "city, state of current location"),
+    ('text', "what is the earliest date you can start?"),
+    ('text', "please describe your experience with distributed systems"),
+    ('text', "who referred you to this position?"),
+    ('numeric', "how many years of experience do you have with aws?"),
+    ('numeric', "what is your expected salary in usd?"),
+    ('numeric', "how many weeks notice do you need to give?"),
+    ('numeric', "how many years of experience do you have in customer service?"),
+    ('numeric', "how many people have you managed?"),
+    ('dropdown', "what is your level of proficiency in spanish?"),
+    ('dropdown', "do you have an active secret clearance?"),
+    ('dropdown', "are you comfortable commuting to our office?"),
+    ('dropdown', "have you previously been employed by us?"),
+    ('dropdown', "race/ethnicity"),
+    ('dropdown', "are you a protected veteran?"),
+    ('dropdown', "what is your highest level of education?"),
+    ('dropdown', "which time zone do you work in?"),
+]
+# Screening questions are mostly a handful of templates filled in with a skill, tool, place or
+# language; these generate a few thousand distinct ones in roughly the mix seen on applications,
+# where most questions match no rule (years of experience with a skill) and the rest hit one.
+SKILLS = [
+    'python', 'java', 'javascript', 'typescript', 'c#', 'c++', 'go', 'rust', 'ruby', 'php', 'scala', 'kotlin', 'swift',
+    'sql', 'postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch', 'kafka', 'spark', 'hadoop', 'airflow', 'dbt',
+    'snowflake', 'databricks', 'aws', 'azure', 'google cloud', 'docker', 'kubernetes', 'terraform', 'ansible', 'jenkins',
+    'gitlab ci', 'linux', 'bash', 'react', 'angular', 'vue.js', 'node.js', 'django', 'flask', 'spring boot', '.net',
+    'graphql', 'rest apis', 'microservices', 'machine learning', 'deep learning', 'pytorch', 'tensorflow', 'nlp',
+    'computer vision', 'data analysis', 'data modeling', 'etl', 'power bi', 'tableau', 'looker', 'excel', 'salesforce',
+    'sap', 'oracle', 'workday', 'servicenow', 'jira', 'confluence', 'agile', 'scrum', 'kanban', 'project management',
+    'product management', 'stakeholder management', 'b2b sales', 'account management', 'customer success',
+    'technical support', 'help desk', 'itil', 'network administration', 'cisco', 'firewalls', 'penetration testing',
+    'siem', 'incident response', 'iso 27001', 'soc 2', 'gdpr', 'accounting', 'bookkeeping', 'payroll', 'quickbooks',
+    'financial modeling', 'budgeting', 'auditing', 'recruiting', 'onboarding', 'figma', 'adobe photoshop',
+    'ux research', 'seo', 'google ads', 'content marketing', 'copywriting', 'autocad', 'solidworks', 'matlab',
+    'plc programming', 'six sigma', 'lean manufacturing', 'supply chain', 'procurement', 'logistics', 'forklift operation',
+    'warehouse operations', 'customer service', 'call center', 'retail', 'food safety', 'patient care', 'ehr systems',
+    'medical billing', 'teaching', 'curriculum development', 'public speaking', 'people management', 'mentoring',
+]
+PLACES = [
+    'austin', 'boston', 'chicago', 'dallas', 'denver', 'houston', 'los angeles', 'miami', 'new york', 'phoenix',
+    'portland', 'san diego', 'san francisco', 'seattle', 'atlanta', 'toronto', 'vancouver', 'london', 'berlin', 'dublin',
+    'amsterdam', 'paris', 'madrid', 'sydney', 'melbourne', 'singapore', 'bangalore', 'hyderabad', 'sao paulo', 'mexico city',
+]
+LANGUAGES = ['english', 'spanish', 'french', 'german', 'portuguese', 'italian', 'dutch', 'mandarin', 'japanese', 'korean',
+             'hindi', 'arabic', 'russian', 'polish', 'turkish']
+TEMPLATES = [
+    ('numeric', "how many years of work experience do you have with {skill}?"),
+    ('numeric', "how many years of experience do you have in {skill}?"),
+    ('numeric', "how many years of professional {skill} experience do you have?"),
+    ('radio', "do you have experience with {skill}?"),
+    ('radio', "have you used {skill} in a production environment?"),
+    ('radio', "are you certified in {skill}?"),
+    ('text', "describe a project where you used {skill}."),
+    ('dropdown', "what is your level of expertise in {skill}?"),
+    ('numeric', "on a scale of 1 to 10, how would you rate your {skill} skills?"),
+    ('radio', "do you have hands-on experience with {skill}?"),
+    ('radio', "have you led a team working with {skill}?"),
+    ('radio', "have you completed any formal training in {skill}?"),
+    ('text', "what tools do you use alongside {skill}?"),
+    ('dropdown', "how would you describe your knowledge of {skill}?"),
+    ('numeric', "how many years have you used {skill} in a commercial setting?"),
+    ('radio', "are you able to work on a hybrid schedule in {place}?"),
+    ('radio', "are you legally authorized to work in {place}?"),
+    ('numeric', "what are your compensation expectations for {place}?"),
+    ('radio', "are you comfortable commuting to our {place} office?"),
+    ('radio', "are you willing to work onsite in {place}?"),
+    ('radio', "do you live within 50 miles of {place}?"),
+    ('radio', "are you willing to relocate to {place}?"),
+    ('text', "what is your expected salary for this role in {place}?"),
+    ('dropdown', "what is your level of proficiency in {language}?"),
+    ('radio', "can you read and write {language} fluently?"),
+]
+
+
+def generated_questions():
+    values = {'skill': SKILLS, 'place': PLACES, 'language': LANGUAGES}
+    for field_type, template in TEMPLATES:
+        name = next(key for key in values if '{' + key + '}' in template)
+        for value in values[name]:
+            yield field_type, template.format(**{name: value})
+
+
+RADIO_OPTIONS = ['yes', 'no', 'prefer not to say']
+DROPDOWN_OPTIONS = ['Select an option', 'Yes', 'No', 'Native or bilingual', 'United States (+1)', 'I don\'t wish to answer']
+
+PARAMETERS = {
+    'checkboxes': {
+        'driversLicence': True, 'requireVisa': False, 'legallyAuthorized': True, 'certifiedProfessional': True,
+        'urgentFill': True, 'commute': True, 'remote': True, 'drugTest': True, 'assessment': True,
+        'securityClearance': False, 'degreeCompleted': ['High School Diploma', 'Bachelor\'s Degree'],
+        'backgroundCheck': True,
+    },
+    'personalInfo': {
+        'Pronouns': 'Mr.', 'First Name': 'Jane', 'Last Name': 'Doe', 'Phone Country Code': 'United States (+1)',
+        'Mobile Phone Number': '5550100', 'Linkedin': 'https://linkedin.com/in/janedoe',
+        'Website': 'https://github.com/janedoe', 'MessageToManager': 'Hi',
+    },
+    'languages': {'english': 'Native or bilingual'},
+    'universityGpa': 3.5,
+    'noticePeriod': 2,
+    'salaryMinimum': 90000,
+}
+
+
+class LegacyChains:
+    """The answer chains as they were before the rule engine, kept here only for comparison."""
+
+    def __init__(self, parameters):
+        self.checkboxes = parameters['checkboxes']
+        self.personal_info = parameters['personalInfo']
+        self.languages = parameters['languages']
+        self.university_gpa = parameters['universityGpa']
+        self.notice_period = parameters['noticePeriod']
+        self.salary_minimum = parameters['salaryMinimum']
+
+    def get_answer(self, question):
+        return 'yes' if self.checkboxes[question] else 'no'
+
+    def radio(self, radio_text, radio_options):
+        if 'driver\'s licence' in radio_text or 'driver\'s license' in radio_text:
+            return self.get_answer('driversLicence')
+        elif any(keyword in radio_text.lower() for keyword in [
+            'aboriginal', 'native', 'indigenous', 'tribe', 'first nations',
+            'native american', 'native hawaiian', 'inuit', 'metis', 'maori',
+            'aborigine', 'ancestral', 'native peoples', 'original people',
+            'first people', 'gender', 'race', 'disability', 'latino', 'torres',
+            'do you identify'
+        ]):
+            negative_keywords = ['prefer', 'decline', 'don\'t', 'specified', 'none', 'no']
+            for option in radio_options:
+                if any(neg_keyword in option[1].lower() for neg_keyword in negative_keywords):
+                    return option[1]
+        elif 'assessment' in radio_text:
+            return self.get_answer("assessment")
+        elif 'clearance' in radio_text:
+            return self.get_answer("securityClearance")
+        elif 'north korea' in radio_text:
+            return 'no'
+        elif 'previously employ' in radio_text or 'previous employ' in radio_text:
+            return 'no'
+        elif any(keyword in radio_text.lower() for keyword in [
+            'certified', 'certificate', 'cpa', 'chartered accountant', 'qualification'
+        ]):
+            return self.get_answer('certifiedProfessional')
+        elif 'urgent' in radio_text:
+            return self.get_answer('urgentFill')
+        elif 'commut' in radio_text or 'on-site' in radio_text or 'hybrid' in radio_text or 'onsite' in radio_text:
+            return self.get_answer('commute')
+        elif 'remote' in radio_text:
+            return self.get_answer('remote')
+        elif 'background check' in radio_text:
+            return self.get_answer('backgroundCheck')
+        elif 'drug test' in radio_text:
+            return self.get_answer('drugTest')
+        elif 'level of education' in radio_text:
+            for degree in self.checkboxes['degreeCompleted']:
+                if degree.lower() in radio_text:
+                    return "yes"
+        elif 'data retention' in radio_text:
+            return 'no'
+        return None
+
+    def text(self, question_text, text_field_type):
+        if 'grade point average' in question_text:
+            return self.university_gpa
+        elif 'first name' in question_text and 'last name' not in question_text:
+            return self.personal_info['First Name']
+        elif 'last name' in question_text and 'first name' not in question_text:
+            return self.personal_info['Last Name']
+        elif 'location' in question_text:
+            return 'Houston, Texas, United States'
+        elif 'name' in question_text:
+            return self.personal_info['First Name'] + " " + self.personal_info['Last Name']
+        elif 'pronouns' in question_text:
+            return self.personal_info['Pronouns']
+        elif 'phone' in question_text:
+            return self.personal_info['Mobile Phone Number']
+        elif 'linkedin' in question_text:
+            return self.personal_info['Linkedin']
+        elif 'message to hiring' in question_text or 'cover letter' in question_text:
+            return self.personal_info['MessageToManager']
+        elif 'website' in question_text or 'github' in question_text or 'portfolio' in question_text:
+            return self.personal_info['Website']
+        elif 'notice' in question_text or 'weeks' in question_text:
+            return int(self.notice_period) if text_field_type == 'numeric' else str(self.notice_period)
+        elif 'salary' in question_text or 'expectation' in question_text or 'compensation' in question_text or 'CTC' in question_text:
+            return int(self.salary_minimum) if text_field_type == 'numeric' else float(self.salary_minimum)
+        return None
+
+    def dropdown(self, question_text, options):
+        if 'proficiency' in question_text:
+            for language in self.languages:
+                if language.lower() in question_text:
+                    return self.languages[language]
+        elif 'clearance' in question_text or 'assessment' in question_text or 'commut' in question_text or 'on-site' in question_text or 'hybrid' in question_text or 'onsite' in question_text:
+            answer = self.get_answer('securityClearance' if 'clearance' in question_text else 'assessment' if 'assessment' in question_text else 'commute')
+            for option in options:
+                if answer.lower() in option.lower():
+                    return option
+        elif 'country code' in question_text:
+            return self.personal_info['Phone Country Code']
+        elif 'north korea' in question_text or 'previously employed' in question_text or 'previous employment' in question_text:
+            for option in options:
+                if 'no' in option.lower():
+                    return option
+        elif 'above 18' in question_text:
+            for option in options:
+                if 'yes' in option.lower():
+                    return option
+            return options[0]
+        elif any(keyword in question_text.lower() for keyword in [
+            'aboriginal', 'native', 'indigenous', 'tribe', 'first nations',
+            'native american', 'native hawaiian', 'inuit', 'metis', 'maori',
+            'aborigine', 'ancestral', 'native peoples', 'original people',
+            'first people', 'gender', 'race', 'disability', 'latino'
+        ]):
+            negative_keywords = ['prefer', 'decline', 'don\'t', 'specified', 'none']
+            for option in options:
+                if any(neg_keyword in option.lower() for neg_keyword in negative_keywords):
+                    return option
+        return None
+
+
+def load_corpus(path):
+    corpus = []
+    if path and os.path.isfile(path) and path.endswith('.db'):
+        connection = sqlite3.connect(path)
+        corpus += connection.execute("SELECT field_type, question FROM questions").fetchall()
+        connection.close()
+    elif path and os.path.isfile(path):
+        with open(path, newline='', encoding='utf-8', errors='replace') as f:
+            for row in csv.reader(f):
+                if len(row) >= 2 and row[0] in ('radio', 'text', 'numeric', 'dropdown'):
+                    corpus.append((row[0], row[1].lower()))
+    corpus += SAMPLE_QUESTIONS
+    corpus += generated_questions()
+    return [(field_type, question) for field_type, question in dict.fromkeys(corpus)
+            if field_type in ('radio', 'text', 'numeric', 'dropdown')]
+
+
+def run_legacy(legacy, corpus):
+    results = []
+    for field_type, text in corpus:
+        if field_type == 'radio':
+            results.append(legacy.radio(text, list(enumerate(RADIO_OPTIONS))))
+        elif field_type == 'dropdown':
+            results.append(legacy.dropdown(text, DROPDOWN_OPTIONS))
+        else:
+            results.append(legacy.text(text, field_type))
+    return results
+
+
+def run_engine(engine, corpus):
+    results = []
+    for field_type, text in corpus:
+        if field_type == 'radio':
+            results.append(engine.answer(text, 'radio', RADIO_OPTIONS))
+        elif field_type == 'dropdown':
+            results.append(engine.answer(text, 'dropdown', DROPDOWN_OPTIONS))
+        else:
+            results.append(engine.answer(text, field_type))
+    return results
+
+
+def measure(functions, repeat):
+    """
+    Time each (function, setup) pass repeat times, taking turns so machine noise hits them all
+    alike. Returns the best time and the last results of each.
+    """
+    best = [float('inf')] * len(functions)
+    results = [None] * len(functions)
+    for _ in range(repeat):
+        for index, (function, setup) in enumerate(functions):
+            if setup:
+                setup()
+            started = time.perf_counter()
+            results[index] = function()
+            best[index] = min(best[index], time.perf_counter() - started)
+    return best, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('corpus', nargs='?', default='question_catalog.db')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+    legacy = LegacyChains(PARAMETERS)
+    started = time.perf_counter()
+    engine = QuestionRuleEngine(DEFAULT_QUESTION_RULES, PARAMETERS)
+    compile_time = time.perf_counter() - started
+
+    (legacy_time, cold_time, warm_time), (legacy_results, engine_results, _) = measure([
+        (lambda: run_legacy(legacy, corpus), None),
+        (lambda: run_engine(engine, corpus), engine._matches.clear),
+        (lambda: run_engine(engine, corpus), lambda: run_engine(engine, corpus)),
+    ], args.repeat)
+    mismatches = [(corpus[i], legacy_results[i], engine_results[i])
+                  for i in range(len(corpus)) if legacy_results[i] != engine_results[i]]
+    # The questions a rule answers cost the engine more than one search; timed on their own too
+    answered = [question for question, result in zip(corpus, legacy_results) if result is not None]
+    (answered_legacy_time, answered_cold_time), _ = measure([
+        (lambda: run_legacy(legacy, answered), None),
+        (lambda: run_engine(engine, answered), engine._matches.clear),
+    ], args.repeat)
+
+    print(f"Corpus: {len(corpus)} distinct questions ({len(answered)} answered by a rule), "
+          f"engine compiled in {compile_time * 1000:.2f} ms")
+    print(f"if/elif chains:          {len(corpus) / legacy_time:12,.0f} lookups/sec")
+    print(f"rule engine, unmemoized: {len(corpus) / cold_time:12,.0f} lookups/sec")
+    print(f"rule engine, memoized:   {len(corpus) / warm_time:12,.0f} lookups/sec (every question already seen)")
+    print(f"Only the {len(answered)} questions answered by a rule:")
+    print(f"  if/elif chains:          {len(answered) / answered_legacy_time:12,.0f} lookups/sec")
+    print(f"  rule engine, unmemoized: {len(answered) / answered_cold_time:12,.0f} lookups/sec")
+    print(f"Answers differing from the chains: {len(mismatches)}")
+    for (field_type, text), old, new in mismatches[:10]:
+        print(f"  [{field_type}] {text!r}: chains={old!r} engine={new!r}")
+
+
+if __name__ == '__main__':
+    main()
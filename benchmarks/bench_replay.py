@@ -0,0 +1,218 @@
+"""
+Benchmark: the full search-and-apply flow offline, against the replay server.
+
+Usage: python benchmarks/bench_replay.py [--jobs 25] [--latency 0.15] [--headed] [--discovery http]
+                                         [--baseline benchmarks/replay_baseline.json] [--save-baseline]
+                                         [--threshold 0.2]
+
+Starts benchmarks/replay_server.py, points the bot at it through linkedinBaseUrl and runs
+run_search (next_job_page, apply_jobs, apply_to_job for every card) followed by
+apply_single_job on one job page. Sleeps and scrolling are skipped, AI calls and the job-fit
+check are off, and the answers come from config.yaml. Reports per-phase latency, WebDriver commands per
+job, browser page loads per application and jobs per minute. --discovery http runs the search
+with HTTP discovery instead of browsing the results pages (use a separate baseline file).
+
+With --save-baseline the results are written to the baseline file. Otherwise, if the baseline
+exists, the run fails (exit code 1) when jobs/minute drops, or commands per job or the median
+of a phase rises, by more than --threshold, or when not every job was applied to.
+"""
+import argparse, json, os, re, shutil, statistics, sys, tempfile, time
+from collections import defaultdict
+
+BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS, '..'))
+sys.path.insert(0, BENCHMARKS)
+import yaml
+import linkedineasyapply, waits
+from linkedineasyapply import LinkedinEasyApply
+from job_store import JobStore
+from waits import RunPacer
+from main import init_browser
+from replay_server import ReplayServer, load_jobs
+
+CONFIG = os.path.join(BENCHMARKS, '..', 'config.yaml')
+DEFAULT_BASELINE = os.path.join(BENCHMARKS, 'replay_baseline.json')
+
+# Bot methods timed as phases; waits are reported per condition as 'wait: <description>'
+PHASES = ['next_job_page', 'extract_job_cards', 'click_job_card', 'apply_to_job', 'fill_up', 'form_errors',
+          'apply_single_job', 'apply_harvested_jobs']
+
+# Phases faster than this (in ms) are too noisy to fail a run on
+MIN_PHASE_MS = 5
+
+REPLAY_PERSONAL_INFO = {
+    'First Name': 'Replay',
+    'Last Name': 'Candidate',
+    'Phone Country Code': 'United States (+1)',
+    'Mobile Phone Number': '5555550100',
+}
+
+
+class NoSleep:
+    """Stands in for the time module in the bot's modules: everything but sleep() is passed through."""
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+    def sleep(self, seconds):
+        pass
+
+
+def replay_parameters(base_url, workdir, discovery):
+    with open(CONFIG, encoding='utf-8') as f:
+        parameters = yaml.safe_load(f)
+    resume = os.path.join(workdir, 'resume.pdf')
+    with open(resume, 'wb') as f:
+        f.write(b'%PDF-1.4\n% replay resume\n')
+    personal_info = dict(parameters.get('personalInfo') or {})
+    for key, value in REPLAY_PERSONAL_INFO.items():
+        if not personal_info.get(key):
+            personal_info[key] = value
+    parameters['personalInfo'] = personal_info
+    parameters.update({
+        'linkedinBaseUrl': base_url,
+        'discovery': discovery,
+        'openaiApiKey': None,
+        'evaluateJobFit': False,
+        'aiCache': False,
+        'testSingleUrl': None,
+        'disableAntiLock': True,
+        'companyBlacklist': [],
+        'titleBlacklist': [],
+        'posterBlacklist': [],
+        'uploads': {'resume': resume},
+        'textResume': '',
+        'pacing': {'minDelay': 0, 'maxDelay': 0, 'timeout': 10, 'scrollBudget': 0},
+    })
+    return parameters
+
+
+def time_phases(bot, timings):
+    for name in PHASES:
+        method = getattr(bot, name)
+
+        def timed(*args, method=method, name=name, **kwargs):
+            started = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                timings[name].append(time.perf_counter() - started)
+        setattr(bot, name, timed)
+
+    until = bot.waits.until
+
+    def timed_until(condition, description, timeout=None):
+        started = time.perf_counter()
+        try:
+            return until(condition, description, timeout)
+        finally:
+            timings['wait: ' + re.sub(r'\d+', 'N', description)].append(time.perf_counter() - started)
+    bot.waits.until = timed_until
+
+
+def run(args, workdir):
+    server = ReplayServer(load_jobs(args.jobs), args.latency).start()
+    driver = init_browser(os.path.join(workdir, 'profile'), 9400, {'profile': 'standard' if args.headed else 'lean'})
+    try:
+        parameters = replay_parameters(server.url, workdir, args.discovery)
+        bot = LinkedinEasyApply(parameters, driver, job_store=JobStore(os.path.join(workdir, 'seen_jobs.db')),
+                                pacer=RunPacer(minimum_time=0))
+        timings = defaultdict(list)
+        time_phases(bot, timings)
+        page_loads = []
+        get = driver.get
+
+        def counting_get(url):
+            page_loads.append(url)
+            return get(url)
+        driver.get = counting_get
+
+        started = time.perf_counter()
+        bot.run_search('python developer', 'Replay City')
+        search_page_loads = len(page_loads)
+        single_url = f"{server.url}/jobs/view/{server.jobs[0]['id']}/"
+        driver.get(single_url)
+        bot.waits.until(bot.waits.details_loaded(server.jobs[0]['id']), "the single job page")
+        single_applied = bot.apply_single_job(single_url)
+        elapsed = time.perf_counter() - started
+    finally:
+        driver.quit()
+        server.stop()
+
+    jobs = len(server.jobs) + 1
+    applied = bot.applications + bool(single_applied)
+    return {
+        'jobs': jobs,
+        'applied': applied,
+        'seconds': round(elapsed, 2),
+        'jobs_per_minute': round(applied / elapsed * 60, 2),
+        'commands_per_job': round(bot.command_counter.total / jobs, 1),
+        'page_loads_per_application': round(search_page_loads / max(bot.applications, 1), 2),
+        'phases': {name: {'count': len(values),
+                          'p50_ms': round(statistics.median(values) * 1000, 1),
+                          'p95_ms': round(sorted(values)[max(int(len(values) * 0.95) - 1, 0)] * 1000, 1)}
+                   for name, values in sorted(timings.items())},
+    }
+
+
+def regressions(result, baseline, threshold):
+    found = []
+    if result['applied'] < result['jobs']:
+        found.append(f"applied to {result['applied']} of {result['jobs']} jobs")
+    if result['jobs_per_minute'] < baseline['jobs_per_minute'] * (1 - threshold):
+        found.append(f"jobs/minute {result['jobs_per_minute']} vs baseline {baseline['jobs_per_minute']}")
+    if result['commands_per_job'] > baseline['commands_per_job'] * (1 + threshold):
+        found.append(f"commands/job {result['commands_per_job']} vs baseline {baseline['commands_per_job']}")
+    if result['page_loads_per_application'] > baseline.get('page_loads_per_application', float('inf')) * (1 + threshold):
+        found.append(f"page loads/application {result['page_loads_per_application']} vs baseline {baseline['page_loads_per_application']}")
+    for name, phase in result['phases'].items():
+        base = baseline['phases'].get(name)
+        if base and phase['p50_ms'] > max(base['p50_ms'] * (1 + threshold), MIN_PHASE_MS):
+            found.append(f"{name} p50 {phase['p50_ms']} ms vs baseline {base['p50_ms']} ms")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--jobs', type=int, default=25, help="Jobs on the replayed results page(s)")
+    parser.add_argument('--latency', type=float, default=0.15, help="Seconds the replay takes to answer each interaction")
+    parser.add_argument('--headed', action='store_true', help="Use the standard browser profile instead of the lean one")
+    parser.add_argument('--discovery', choices=['browser', 'http'], default='browser')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--threshold', type=float, default=0.2)
+    args = parser.parse_args()
+
+    linkedineasyapply.time = NoSleep()
+    waits.time = NoSleep()
+    workdir = tempfile.mkdtemp(prefix='bench_replay_')
+    cwd = os.getcwd()
+    os.chdir(workdir)  # output.csv and the other logs the bot writes land in the scratch directory
+    try:
+        result = run(args, workdir)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"\nApplied to {result['applied']} of {result['jobs']} jobs in {result['seconds']}s: "
+          f"{result['jobs_per_minute']} jobs/minute, {result['commands_per_job']} WebDriver commands per job, "
+          f"{result['page_loads_per_application']} browser page loads per application")
+    print(f"{'phase':<48}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}")
+    for name, phase in result['phases'].items():
+        print(f"{name:<48}{phase['count']:>7}{phase['p50_ms']:>10}{phase['p95_ms']:>10}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=1)
+        print(f"Saved baseline to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            found = regressions(result, json.load(f), args.threshold)
+        if found:
+            print("Regressions beyond the threshold:\n  " + "\n  ".join(found))
+            sys.exit(1)
+        print("No regressions against the baseline.")
+
+
+if __name__ == '__main__':
+    main()
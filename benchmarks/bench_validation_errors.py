@@ -0,0 +1,73 @@
+"""
+Benchmark: validation-error detection per Easy Apply step, page_source scan versus the
+targeted FORM_ERRORS_SCRIPT query.
+
+Usage: python benchmarks/bench_validation_errors.py [--url URL] [--padding-kb 2000] [--repeat 20]
+
+Without --url the recorded fixture benchmarks/fixtures/easy_apply_step.html is used. LinkedIn's
+job pages serialize to a few megabytes, so the fixture is padded with filler markup by default.
+"""
+import argparse, json, os, sys, time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from linkedineasyapply import FORM_ERRORS_SCRIPT, VALIDATION_ERROR_MESSAGES, VALIDATION_ERROR_PATTERN
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'easy_apply_step.html')
+
+PADDING_SCRIPT = """
+const filler = document.createElement('div');
+const chunk = '<div class="feed-shared-update"><span class="visually-hidden">' + 'x'.repeat(900) + '</span></div>';
+filler.innerHTML = chunk.repeat(arguments[0]);
+document.getElementById('main').appendChild(filler);
+"""
+
+
+def page_source_check(driver):
+    page_source = driver.page_source
+    found = any(error in page_source.lower() for error in VALIDATION_ERROR_MESSAGES)
+    return found, len(page_source.encode('utf-8'))
+
+
+def targeted_check(driver):
+    errors = driver.execute_script(FORM_ERRORS_SCRIPT)
+    found = [error for error in errors if error['inline'] or VALIDATION_ERROR_PATTERN.search(error['message'].lower())]
+    return bool(found), len(json.dumps(errors).encode('utf-8'))
+
+
+def measure(driver, check, repeat):
+    timings, size, found = [], 0, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        found, size = check(driver)
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return found, size, timings[len(timings) // 2], timings[int(len(timings) * 0.95) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--url', default='file://' + FIXTURE)
+    parser.add_argument('--padding-kb', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    options = Options()
+    options.add_argument('--headless=new')
+    driver = webdriver.Chrome(options=options)
+    try:
+        driver.get(args.url)
+        if args.padding_kb:
+            driver.execute_script(PADDING_SCRIPT, args.padding_kb)
+
+        print(f"{'method':<14}{'errors':>8}{'bytes/step':>14}{'p50 ms':>10}{'p95 ms':>10}")
+        for name, check in (('page_source', page_source_check), ('targeted', targeted_check)):
+            found, size, p50, p95 = measure(driver, check, args.repeat)
+            print(f"{name:<14}{str(found):>8}{size:>14,}{p50 * 1000:>10.1f}{p95 * 1000:>10.1f}")
+    finally:
+        driver.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,192 @@
+// Client side of the replay fixtures: renders the recorded jobs with LinkedIn's markup and plays
+// the job details pane and the Easy Apply modal (contact info, resume, additional questions,
+// review) back with a fixed latency per interaction, standing in for LinkedIn's XHR round trips.
+(function () {
+    const state = window.REPLAY;
+    const later = fn => setTimeout(fn, state.latency);
+    const esc = value => String(value).replace(/[&<>"]/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'}[c]));
+    const jobsById = {};
+    for (const job of state.jobs) jobsById[job.id] = job;
+
+    // Only the first tiles are rendered up front; the rest fill in when scrolled into view
+    const EAGER_TILES = 7;
+
+    function cardHtml(job) {
+        return `<div class="job-card-container job-card-list" data-job-id="${job.id}">
+            <a class="job-card-list__title job-card-container__link" href="/jobs/view/${job.id}/?refId=replay">${esc(job.title)}</a>
+            <div class="artdeco-entity-lockup__subtitle"><span>${esc(job.company)}</span></div>
+            <ul><li class="job-card-container__metadata-item">${esc(job.location)}</li></ul>
+            ${job.poster ? `<span>${esc(job.poster)} is hiring for this</span>` : ''}
+            <ul><li class="job-card-container__footer-item">Easy Apply</li></ul>
+        </div>`;
+    }
+
+    function renderResults() {
+        const list = document.getElementById('results');
+        if (!state.jobs.length) {
+            list.insertAdjacentHTML('afterend',
+                '<div class="jobs-search-two-pane__no-results-banner--expand"><h2>No matching jobs found.</h2></div>');
+            return;
+        }
+        if (state.total !== null) {
+            list.insertAdjacentHTML('beforebegin',
+                `<div class="jobs-search-results-list__subtitle"><span>${state.total.toLocaleString('en-US')} results</span></div>`);
+        }
+        const observer = new IntersectionObserver(entries => {
+            for (const entry of entries) {
+                if (entry.isIntersecting && !entry.target.firstElementChild) {
+                    entry.target.innerHTML = cardHtml(jobsById[entry.target.dataset.occludableJobId]);
+                    observer.unobserve(entry.target);
+                }
+            }
+        });
+        state.jobs.forEach((job, index) => {
+            const tile = document.createElement('li');
+            tile.className = 'scaffold-layout__list-item';
+            tile.dataset.occludableJobId = job.id;
+            if (index < EAGER_TILES) tile.innerHTML = cardHtml(job);
+            else observer.observe(tile);
+            list.appendChild(tile);
+        });
+        list.addEventListener('click', event => {
+            const link = event.target.closest('a[href*="/jobs/view/"]');
+            if (!link) return;
+            event.preventDefault();
+            const id = link.closest('[data-occludable-job-id]').dataset.occludableJobId;
+            const url = new URL(location.href);
+            url.searchParams.set('currentJobId', id);
+            history.replaceState(null, '', url);
+            document.getElementById('details').innerHTML = '';
+            later(() => renderDetails(jobsById[id]));
+        });
+    }
+
+    function renderDetails(job) {
+        document.getElementById('details').innerHTML = `
+            <div class="job-details-jobs-unified-top-card__job-title"><h1><a href="/jobs/view/${job.id}/?trk=replay">${esc(job.title)}</a></h1></div>
+            <div class="job-details-jobs-unified-top-card__company-name"><a href="#">${esc(job.company)}</a></div>
+            <div class="job-details-jobs-unified-top-card__primary-description-container">
+                <span class="tvm__text tvm__text--low-emphasis">${esc(job.location)}</span>
+            </div>
+            <div class="jobs-apply-button--top-card"><button class="jobs-apply-button artdeco-button">Easy Apply</button></div>
+            ${job.hiring_team ? `<h2>Meet the hiring team</h2>
+                <div class="hirer-card__hirer-information"><a href="/in/replay-recruiter-${job.id}/">Recruiter</a></div>` : ''}
+            <div id="job-details">${job.description.map(paragraph => `<p>${esc(paragraph)}</p>`).join('')}</div>`;
+        document.querySelector('.jobs-apply-button').addEventListener('click', () => later(() => openModal(job)));
+    }
+
+    const STEPS = {
+        contact: {button: 'Next', html: job => `
+            <h3>Contact info</h3>
+            <div class="form-group"><label for="first-name">First name</label><input id="first-name" data-required></div>
+            <div class="form-group"><label for="last-name">Last name</label><input id="last-name" data-required></div>
+            <div class="form-group"><label for="country-code">Phone country code</label>
+                <select id="country-code"><option>Select an option</option><option>United States (+1)</option>
+                <option>Canada (+1)</option><option>United Kingdom (+44)</option><option>Italy (+39)</option></select></div>
+            <div class="form-group"><label for="single-line-text-form-component-formElement-urn-li-jobs-applyformcommon-easyApplyFormElement-${job.id}-phoneNumber-nationalNumber">Mobile phone number</label>
+                <input id="single-line-text-form-component-formElement-urn-li-jobs-applyformcommon-easyApplyFormElement-${job.id}-phoneNumber-nationalNumber" data-required></div>`},
+        resume: {button: 'Next', html: () => `
+            <h3>Resume</h3>
+            <div class="jobs-document-upload"><label class="jobs-document-upload__title--is-required">Upload resume</label>
+                <div><input type="file" name="file" data-required></div></div>`},
+        questions: {button: 'Review', html: job => `
+            <h3>Additional Questions</h3>
+            <div class="fb-dash-form-element"><fieldset data-required>
+                <legend class="fb-dash-form-element__label"><span>Are you legally authorized to work in the United States?</span></legend>
+                <div><input type="radio" name="q-auth-${job.id}" id="q-auth-yes"><label for="q-auth-yes">Yes</label></div>
+                <div><input type="radio" name="q-auth-${job.id}" id="q-auth-no"><label for="q-auth-no">No</label></div>
+            </fieldset></div>
+            <div class="fb-dash-form-element"><fieldset data-required>
+                <legend class="fb-dash-form-element__label"><span>Will you now or in the future require sponsorship for employment visa status?</span></legend>
+                <div><input type="radio" name="q-visa-${job.id}" id="q-visa-yes"><label for="q-visa-yes">Yes</label></div>
+                <div><input type="radio" name="q-visa-${job.id}" id="q-visa-no"><label for="q-visa-no">No</label></div>
+            </fieldset></div>
+            <div class="fb-dash-form-element"><label for="single-line-text-form-component-${job.id}-python-numeric">How many years of work experience do you have with Python?</label>
+                <input id="single-line-text-form-component-${job.id}-python-numeric" data-required data-numeric></div>
+            <div class="fb-dash-form-element"><label for="text-entity-list-form-component-${job.id}-english">What is your level of proficiency in English?</label>
+                <select id="text-entity-list-form-component-${job.id}-english" data-required><option>Select an option</option>
+                <option>None</option><option>Conversational</option><option>Professional</option><option>Native or bilingual</option></select></div>`},
+        review: {button: 'Submit application', html: () => `
+            <h3>Review your application</h3>
+            <p>The employer will also receive a copy of your profile.</p>
+            <label><input type="checkbox" checked> Follow the company to stay up to date with their page.</label>`}
+    };
+    const STEP_ORDER = ['contact', 'resume', 'questions', 'review'];
+
+    function openModal(job) {
+        const modal = document.createElement('div');
+        modal.className = 'artdeco-modal jobs-easy-apply-modal';
+        modal.setAttribute('role', 'dialog');
+        modal.innerHTML = `<button class="artdeco-modal__dismiss" aria-label="Dismiss">&times;</button>
+            <div class="jobs-easy-apply-modal__content"><progress max="100"></progress><form></form></div>
+            <footer><button class="artdeco-button artdeco-button--primary"></button></footer>`;
+        document.body.appendChild(modal);
+        let step = 0;
+
+        function show() {
+            const name = STEP_ORDER[step];
+            modal.querySelector('form').innerHTML = STEPS[name].html(job);
+            modal.querySelector('progress').setAttribute('value', Math.round(step * 100 / STEP_ORDER.length));
+            modal.querySelector('.artdeco-button--primary').innerText = STEPS[name].button;
+        }
+
+        function fieldError(field) {
+            if (field.matches('fieldset')) return field.querySelector('input:checked') ? '' : 'Please make a selection';
+            if (field.matches('select')) return field.selectedIndex > 0 ? '' : 'Please make a selection';
+            if (field.type === 'file') return field.files.length ? '' : 'A file is required';
+            if (!field.value.trim()) return 'Please enter a valid answer';
+            if ('numeric' in field.dataset && !/^\d{1,2}$/.test(field.value.trim())) return 'Enter a whole number between 0 and 99';
+            return '';
+        }
+
+        function validate() {
+            modal.querySelectorAll('.artdeco-inline-feedback').forEach(el => el.remove());
+            let valid = true;
+            for (const field of modal.querySelectorAll('[data-required]')) {
+                const message = fieldError(field);
+                if (!message) continue;
+                valid = false;
+                field.closest('.form-group, .fb-dash-form-element, .jobs-document-upload').insertAdjacentHTML('beforeend',
+                    `<div class="artdeco-inline-feedback artdeco-inline-feedback--error" role="alert">
+                        <span class="artdeco-inline-feedback__message">${message}</span></div>`);
+            }
+            return valid;
+        }
+
+        modal.querySelector('.artdeco-button--primary').addEventListener('click', event => {
+            event.preventDefault();
+            if (!validate()) return;
+            later(() => {
+                if (++step < STEP_ORDER.length) return show();
+                modal.remove();
+                document.body.insertAdjacentHTML('beforeend', `<div class="artdeco-modal" role="dialog" id="post-apply">
+                    <button class="artdeco-modal__dismiss" aria-label="Dismiss">&times;</button>
+                    <h2>Your application was sent to ${esc(job.company)}</h2></div>`);
+                document.querySelector('#post-apply .artdeco-modal__dismiss').addEventListener('click',
+                    () => document.getElementById('post-apply').remove());
+            });
+        });
+
+        modal.querySelector('.artdeco-modal__dismiss').addEventListener('click', () => {
+            document.body.insertAdjacentHTML('beforeend', `<div class="artdeco-modal artdeco-modal--layer-confirmation" role="alertdialog" id="discard">
+                <h2>Save this application?</h2>
+                <button class="artdeco-modal__confirm-dialog-btn">Discard</button>
+                <button class="artdeco-modal__confirm-dialog-btn">Save</button></div>`);
+            document.querySelectorAll('#discard .artdeco-modal__confirm-dialog-btn').forEach(button =>
+                button.addEventListener('click', () => {
+                    document.getElementById('discard').remove();
+                    modal.remove();
+                }));
+        });
+
+        show();
+    }
+
+    if (state.job) {
+        state.jobs = [];
+        jobsById[state.job.id] = state.job;
+        renderDetails(state.job);
+    } else {
+        renderResults();
+    }
+})();
@@ -0,0 +1,153 @@
+"""
+Local HTTP server replaying recorded LinkedIn pages from benchmarks/fixtures/replay.
+
+Serves /jobs/search/ (25 recorded job cards per page, selected with &start=), /jobs/view/<id>/
+(a single job page) and /feed/, plus the job listing endpoints used by HTTP discovery (10 cards
+per page), so the bot can run against it with linkedinBaseUrl pointed at the server. Every
+interaction in the page (opening a job, moving through the Easy Apply modal) is answered after
+a fixed latency that stands in for LinkedIn's own requests.
+
+Usage: python benchmarks/replay_server.py [--port 8000] [--latency 0.15] [--jobs 25]
+"""
+import argparse, html, json, os, re, threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'replay')
+PAGE_SIZE = 25
+GUEST_PAGE_SIZE = 10
+
+
+def load_jobs(count=None):
+    """Return the recorded jobs, cycled with fresh job IDs up to count jobs."""
+    with open(os.path.join(FIXTURES, 'jobs.json'), encoding='utf-8') as f:
+        recorded = json.load(f)
+    count = count or len(recorded)
+    jobs = []
+    for index in range(count):
+        job = dict(recorded[index % len(recorded)])
+        job['id'] = recorded[0]['id'] + index
+        jobs.append(job)
+    return jobs
+
+
+class ReplayServer:
+    def __init__(self, jobs=None, latency=0.15, host='127.0.0.1', port=0):
+        self.jobs = jobs if jobs is not None else load_jobs()
+        self.latency = latency
+        with open(os.path.join(FIXTURES, 'page.html'), encoding='utf-8') as f:
+            self.page = f.read()
+        with open(os.path.join(FIXTURES, 'replay.js'), encoding='utf-8') as f:
+            self.script = f.read()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def render(self, jobs=(), job=None, total=None):
+        state = {'jobs': list(jobs), 'job': job, 'total': total, 'latency': int(self.latency * 1000)}
+        # Keep '</script>' inside recorded text from closing the state block
+        return self.page.replace('{{STATE}}', json.dumps(state).replace('</', '<\\/'))
+
+    def guest_search(self, start):
+        cards = []
+        for job in self.jobs[start:start + GUEST_PAGE_SIZE]:
+            cards.append(f"""<li>
+<div class="base-card base-search-card job-search-card" data-entity-urn="urn:li:jobPosting:{job['id']}">
+  <a class="base-card__full-link" href="{self.url}/jobs/view/replay-{job['id']}?trk=public_jobs"><span class="sr-only">{html.escape(job['title'])}</span></a>
+  <div class="base-search-card__info">
+    <h3 class="base-search-card__title">{html.escape(job['title'])}</h3>
+    <h4 class="base-search-card__subtitle"><a class="hidden-nested-link">{html.escape(job['company'])}</a></h4>
+    <div class="base-search-card__metadata"><span class="job-search-card__location">{html.escape(job['location'])}</span></div>
+  </div>
+</div>
+</li>""")
+        return "\n".join(cards)
+
+    def guest_posting(self, job):
+        recruiter = ""
+        if job['poster']:
+            recruiter = f"""<div class="message-the-recruiter"><div class="base-main-card__info">
+  <h3 class="base-main-card__title">{html.escape(job['poster'])}</h3></div></div>"""
+        description = "".join(f"<p>{html.escape(paragraph)}</p>" for paragraph in job['description'])
+        return f"""<section class="top-card-layout">
+  <h2 class="top-card-layout__title">{html.escape(job['title'])}</h2>
+  <a class="topcard__org-name-link">{html.escape(job['company'])}</a>
+  <span class="topcard__flavor topcard__flavor--bullet">{html.escape(job['location'])}</span>
+</section>
+{recruiter}
+<section class="description"><div class="description__text">
+  <div class="show-more-less-html__markup show-more-less-html__markup--clamp-after-5">{description}</div>
+</div></section>"""
+
+    def find_job(self, job_id):
+        return next((job for job in self.jobs if job['id'] == job_id), None)
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                view = re.match(r'^/jobs/view/(\d+)', url.path)
+                posting = re.match(r'^/jobs-guest/jobs/api/jobPosting/(\d+)', url.path)
+                if url.path == '/replay.js':
+                    self.reply(server.script, 'application/javascript')
+                elif url.path.startswith('/jobs/search'):
+                    start = int(parse_qs(url.query).get('start', ['0'])[0])
+                    self.reply(server.render(server.jobs[start:start + PAGE_SIZE], total=len(server.jobs)))
+                elif url.path.startswith('/jobs-guest/jobs/api/seeMoreJobPostings/search'):
+                    self.reply(server.guest_search(int(parse_qs(url.query).get('start', ['0'])[0])))
+                elif posting or view:
+                    job = server.find_job(int((posting or view).group(1)))
+                    if job is None:
+                        self.send_error(404)
+                    else:
+                        self.reply(server.guest_posting(job) if posting else server.render(job=job))
+                elif url.path.startswith('/feed') or url.path in ('/', '/login'):
+                    self.reply(server.render())
+                else:
+                    self.send_error(404)
+
+            def reply(self, body, content_type='text/html'):
+                data = body.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', content_type + '; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency', type=float, default=0.15)
+    parser.add_argument('--jobs', type=int)
+    args = parser.parse_args()
+    server = ReplayServer(load_jobs(args.jobs), args.latency, port=args.port)
+    print(f"Replaying {len(server.jobs)} recorded jobs on {server.url} (set linkedinBaseUrl to this URL)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+import re, unicodedata
+
+# Legal-form suffixes dropped from company names, so "Acme, Inc." and "ACME LLC" are the same company
+COMPANY_SUFFIXES = {
+    'inc', 'incorporated', 'llc', 'l l c', 'ltd', 'limited', 'corp', 'corporation', 'plc', 'llp', 'lp', 'gmbh',
+    'ag', 'a g', 'sa', 's a', 'sas', 'sarl', 'srl', 'spa', 'bv', 'b v', 'nv', 'n v', 'ab', 'as', 'oy', 'pty', 'pvt',
+    'kk',
+}
+# Dropped only in front of one of the suffixes above ("Acme Co., Ltd."), since on their own they are often part of
+# the name ("Hugo & Co" is not "Hugo")
+LEADING_SUFFIXES = {'co', 'company'}
+REGEX_PREFIX = 'regex:'
+
+
+def normalize_text(text):
+    """Lowercase, strip accents, turn punctuation into spaces and collapse whitespace."""
+    text = unicodedata.normalize('NFKD', str(text)).encode('ascii', 'ignore').decode('ascii').lower()
+    text = text.replace('&', ' and ')
+    return ' '.join(re.sub(r'[^a-z0-9+#]+', ' ', text).split())
+
+
+def normalize_company(name):
+    """
+    normalize_text plus dropping trailing legal-form suffixes (Inc, LLC, GmbH, ...), and Co or
+    Company when they come right before one of those.
+    """
+    words = normalize_text(name).split()
+    stripped = False
+    while len(words) > 1:
+        if words[-1] in COMPANY_SUFFIXES or stripped and words[-1] in LEADING_SUFFIXES:
+            words.pop()
+        elif len(words) > 2 and ' '.join(words[-2:]) in COMPANY_SUFFIXES:
+            del words[-2:]
+        else:
+            break
+        stripped = True
+    return ' '.join(words)
+
+
+def _wildcard(entry, normalize):
+    """Translate a * / ? wildcard entry into a regex over normalized text."""
+    pieces = re.split(r'([*?])', entry)
+    return ''.join('.*' if piece == '*' else '.' if piece == '?' else re.escape(normalize(piece)) for piece in pieces)
+
+
+def _combine(patterns):
+    if not patterns:
+        return None
+    return re.compile('|'.join(f'(?P<p{index}>{pattern})' for index, pattern in enumerate(patterns)), re.IGNORECASE)
+
+
+class _List:
+    """
+    One compiled blacklist. Plain entries go into a dict keyed by their normalized form;
+    wildcard entries (matched against the normalized text) and 'regex:' entries (matched
+    against the text as shown on LinkedIn) are each combined into a single regular expression.
+    """
+
+    def __init__(self, entries, normalize, words=False):
+        self.exact = {}
+        wildcards, regexes = [], []
+        self.wildcard_entries, self.regex_entries = [], []
+        for entry in entries or []:
+            entry = str(entry).strip()
+            if not entry:
+                continue
+            if entry.lower().startswith(REGEX_PREFIX):
+                regexes.append(entry[len(REGEX_PREFIX):].strip())
+                self.regex_entries.append(entry)
+            elif '*' in entry or '?' in entry:
+                pattern = _wildcard(entry, normalize)
+                # Title wildcards match whole words anywhere in the title, names match the whole name
+                wildcards.append(rf'(?<![a-z0-9+#]){pattern}(?![a-z0-9+#])' if words else pattern)
+                self.wildcard_entries.append(entry)
+            elif normalize(entry):
+                self.exact.setdefault(normalize(entry), entry)
+        self.wildcards = _combine(wildcards)
+        self.regexes = _combine(regexes)
+        self.words = words
+
+    def __len__(self):
+        return len(self.exact) + len(self.wildcard_entries) + len(self.regex_entries)
+
+    def patterns(self, text, normalized):
+        """Return the first wildcard or regex entry matching, or None."""
+        if self.wildcards:
+            match = self.wildcards.search(normalized) if self.words else self.wildcards.fullmatch(normalized)
+            if match:
+                return self.wildcard_entries[int(match.lastgroup[1:])]
+        if self.regexes:
+            match = self.regexes.search(text)
+            if match:
+                return self.regex_entries[int(match.lastgroup[1:])]
+        return None
+
+
+class BlacklistIndex:
+    """
+    Company, title and poster blacklists compiled once into normalized hash sets.
+
+    Companies and posters must match a whole name; titles match an entry that appears as a word
+    or phrase anywhere in the title. Names are compared after normalize_company/normalize_text,
+    so 'Acme, Inc.' matches 'ACME' and 'Sr.' matches 'sr'. Plain entries are looked up per title
+    word n-gram in a dict, so the cost per job does not grow with the size of the lists.
+
+    Entries containing * or ? (e.g. '*staffing*') are wildcards and entries starting with
+    'regex:' are regular expressions searched in the text as shown. Each kind is combined into
+    one expression per list and checked after the lookups; their cost does grow with their count.
+    """
+
+    def __init__(self, companies=(), titles=(), posters=()):
+        self.companies = _List(companies, normalize_company)
+        self.titles = _List(titles, normalize_text, words=True)
+        self.posters = _List(posters, normalize_text)
+        self.longest_title_phrase = max((len(phrase.split()) for phrase in self.titles.exact), default=0)
+
+    def title_match(self, title):
+        """Return the blacklist entry found in the title, or None."""
+        normalized = normalize_text(title)
+        if self.titles.exact:
+            words = normalized.split()
+            for start in range(len(words)):
+                for length in range(1, min(self.longest_title_phrase, len(words) - start) + 1):
+                    entry = self.titles.exact.get(' '.join(words[start:start + length]))
+                    if entry is not None:
+                        return entry
+        return self.titles.patterns(str(title), normalized)
+
+    def company_match(self, company):
+        """Return the blacklist entry naming the company, or None."""
+        normalized = normalize_company(company)
+        return self.companies.exact.get(normalized) or self.companies.patterns(str(company), normalized)
+
+    def poster_match(self, poster):
+        """Return the blacklist entry naming the poster, or None."""
+        if not poster:
+            return None
+        normalized = normalize_text(poster)
+        return self.posters.exact.get(normalized) or self.posters.patterns(str(poster), normalized)
+
+    def reasons(self, title, company, poster):
+        """Return why a job is blacklisted (by title keyword, company or poster), or an empty list."""
+        reasons = []
+        keyword = self.title_match(title)
+        if keyword:
+            reasons.append(f"job title contains blacklisted keyword '{keyword}'")
+        if self.company_match(company):
+            reasons.append(f"company '{company}' is blacklisted")
+        if self.poster_match(poster):
+            reasons.append(f"poster '{poster}' is blacklisted")
+        return reasons
@@ -0,0 +1,160 @@
+import html, re
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+SEARCH_PATH = "/jobs-guest/jobs/api/seeMoreJobPostings/search"
+# Job cards per page of SEARCH_PATH; a shorter page is the last one of a search
+SEARCH_PAGE_SIZE = 10
+POSTING_PATH = "/jobs-guest/jobs/api/jobPosting/"
+# Small authenticated endpoint returning the signed-in member, used to check a session
+ME_PATH = "/voyager/api/me"
+JOB_URN_PATTERN = re.compile(r'data-entity-urn="urn:li:jobPosting:(\d+)"')
+
+
+class _ClassText(HTMLParser):
+    """Collects the text of the first element whose class attribute contains class_name."""
+
+    def __init__(self, class_name):
+        super().__init__()
+        self.class_name = class_name
+        self.depth = 0
+        self.done = False
+        self.parts = []
+
+    def handle_starttag(self, tag, attrs):
+        if self.done or tag in ('br', 'img', 'input', 'meta', 'link', 'hr'):
+            if tag == 'br' and self.depth:
+                self.parts.append("\n")
+            return
+        if self.depth:
+            self.depth += 1
+        elif self.class_name in (dict(attrs).get('class') or '').split():
+            self.depth = 1
+        if self.depth and tag in ('p', 'li', 'div'):
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if self.depth and tag not in ('br', 'img', 'input', 'meta', 'link', 'hr'):
+            self.depth -= 1
+            self.done = self.depth == 0
+
+    def handle_data(self, data):
+        if self.depth:
+            self.parts.append(data)
+
+
+def class_text(markup, class_name):
+    parser = _ClassText(class_name)
+    parser.feed(markup)
+    text = re.sub(r'[ \t\r\f\v]+', ' ', html.unescape(''.join(parser.parts)))
+    return re.sub(r'\s*\n\s*', '\n', text).strip()
+
+
+class JobHarvester:
+    """
+    Discovers jobs over plain HTTP instead of the browser.
+
+    Search results and job descriptions are fetched from LinkedIn's job listing endpoints with a
+    pooled requests session carrying the browser's cookies and user agent, and parsed into dicts
+    with the same keys as the job cards read from a results page (plus description). Only the
+    jobs that survive filtering need to be opened in the browser.
+    """
+
+    page_size = SEARCH_PAGE_SIZE
+
+    def __init__(self, base_url, cookies=(), user_agent=None, connections=4, timeout=15):
+        self.base_url = base_url.rstrip('/')
+        self.connections = connections
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=connections,
+                              max_retries=Retry(total=3, backoff_factor=2, status_forcelist=(429, 500, 502, 503, 504)))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        if user_agent:
+            self.session.headers['User-Agent'] = user_agent
+        for cookie in cookies:
+            self.session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'), path=cookie.get('path', '/'))
+            if cookie['name'] == 'JSESSIONID':
+                self.session.headers['csrf-token'] = cookie['value'].strip('"')
+        self.requests = 0
+
+    @classmethod
+    def from_browser(cls, driver, base_url, connections=4):
+        """Create a harvester sharing the logged-in browser's session cookies and user agent."""
+        return cls(base_url, driver.get_cookies(), driver.execute_script("return navigator.userAgent"), connections)
+
+    def _get(self, url):
+        self.requests += 1
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response.text
+
+    def logged_in(self):
+        """
+        Check the session with one small authenticated request. Returns True or False, or None if
+        the answer says neither (an unexpected status or a network error).
+        """
+        try:
+            response = self.session.get(f"{self.base_url}{ME_PATH}", timeout=self.timeout, allow_redirects=False)
+        except requests.RequestException as e:
+            print(f"Could not check the session: {e}")
+            return None
+        if response.status_code == 200:
+            return True
+        if response.status_code in (301, 302, 303, 307, 401, 403):
+            return False
+        return None
+
+    def search(self, query, start=0):
+        """
+        Return the job cards of one page of results, and the number of results the page listed
+        (cards without a job URN, such as promoted ones, are listed but left out of the jobs). query
+        is the search's query string (as built by get_base_search_url plus keywords and location);
+        start is the offset of the first job.
+        """
+        markup = self._get(f"{self.base_url}{SEARCH_PATH}{query}&start={start}")
+        jobs = []
+        chunks = re.split(r'<li[\s>]', markup)[1:]
+        for chunk in chunks:
+            job_id = JOB_URN_PATTERN.search(chunk)
+            if not job_id:
+                continue
+            job_id = int(job_id.group(1))
+            jobs.append({
+                'index': len(jobs),
+                'job_id': job_id,
+                'title': class_text(chunk, 'base-search-card__title'),
+                'link': f"{self.base_url}/jobs/view/{job_id}/",
+                'company': class_text(chunk, 'base-search-card__subtitle'),
+                'poster': '',
+                'location': class_text(chunk, 'job-search-card__location'),
+                'apply_method': '',
+                'badges': [],
+            })
+        return jobs, len(chunks)
+
+    def posting(self, job_id):
+        """Return the description and hiring team poster (if shown) of a job."""
+        markup = self._get(f"{self.base_url}{POSTING_PATH}{job_id}")
+        poster = class_text(markup, 'base-main-card__title') if 'message-the-recruiter' in markup else ''
+        return {'description': class_text(markup, 'show-more-less-html__markup'), 'poster': poster}
+
+    def add_postings(self, jobs):
+        """Fetch the postings of several jobs concurrently over the pooled connections and merge them in."""
+        with ThreadPoolExecutor(max_workers=self.connections) as executor:
+            postings = executor.map(self._safe_posting, [job['job_id'] for job in jobs])
+            for job, posting in zip(jobs, postings):
+                job['description'] = posting.get('description', '')
+                job['poster'] = job['poster'] or posting.get('poster', '')
+        return jobs
+
+    def _safe_posting(self, job_id):
+        try:
+            return self.posting(job_id)
+        except requests.RequestException as e:
+            print(f"Could not fetch the posting of job {job_id}: {e}")
+            return {}
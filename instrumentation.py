@@ -0,0 +1,155 @@
+import json, os, sys, time
+from selenium.common.exceptions import NoSuchElementException
+
+# Lookups that raise NoSuchElementException when nothing matches
+FIND_ONE_COMMANDS = {'findElement', 'findChildElement'}
+# Lookups that return an empty list when nothing matches
+FIND_ALL_COMMANDS = {'findElements', 'findChildElements'}
+
+
+class CommandCounter:
+    """
+    Counts every WebDriver command sent to chromedriver.
+
+    Both WebDriver and WebElement methods funnel through driver.execute, so wrapping that
+    single method on the driver instance is enough to see every round trip.
+    """
+
+    def __init__(self, driver):
+        self.total = 0
+        self.page = 0
+        self._execute = driver.execute
+        driver.execute = self._counting_execute
+
+    def _counting_execute(self, driver_command, params=None):
+        self.total += 1
+        self.page += 1
+        return self._execute(driver_command, params)
+
+    def reset_page(self):
+        """Start counting a new results page and return the count of the previous one."""
+        count = self.page
+        self.page = 0
+        return count
+
+
+class CommandProfiler(CommandCounter):
+    """
+    CommandCounter that also times every command and attributes it to the call site that issued
+    it: the nearest named function in one of the source_files (lambdas and comprehensions are
+    attributed to the function that defines them).
+
+    Lookups that find nothing are tallied as implicit-wait misses, since with an implicit wait
+    configured each of them blocks for the full wait before returning.
+    """
+
+    def __init__(self, driver, source_files=('linkedineasyapply.py',)):
+        super().__init__(driver)
+        self.source_files = set(source_files)
+        self.sites = {}
+        self.job_sites = {}
+        self.jobs = []
+        self.job_label = None
+        self._watched = {}
+
+    def _call_site(self):
+        frame = sys._getframe(2)
+        while frame is not None:
+            code = frame.f_code
+            watched = self._watched.get(code)
+            if watched is None:
+                watched = os.path.basename(code.co_filename) in self.source_files and not code.co_name.startswith('<')
+                self._watched[code] = watched
+            if watched:
+                return code.co_name, frame.f_lineno
+            frame = frame.f_back
+        return '<other>', 0
+
+    def _counting_execute(self, driver_command, params=None):
+        method, line = self._call_site()
+        missed = False
+        started = time.perf_counter()
+        try:
+            response = self._execute(driver_command, params)
+            missed = driver_command in FIND_ALL_COMMANDS and not response.get('value')
+            return response
+        except NoSuchElementException:
+            missed = driver_command in FIND_ONE_COMMANDS
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self.total += 1
+            self.page += 1
+            self._tally(self.sites, (method, line, driver_command), elapsed, missed)
+            self._tally(self.job_sites, (method, driver_command), elapsed, missed)
+
+    @staticmethod
+    def _tally(table, key, elapsed, missed):
+        stats = table.get(key)
+        if stats is None:
+            stats = table[key] = {'calls': 0, 'seconds': 0.0, 'max': 0.0, 'misses': 0, 'miss_seconds': 0.0}
+        stats['calls'] += 1
+        stats['seconds'] += elapsed
+        stats['max'] = max(stats['max'], elapsed)
+        if missed:
+            stats['misses'] += 1
+            stats['miss_seconds'] += elapsed
+
+    def start_job(self, label):
+        self.job_label = label
+        self.job_sites = {}
+
+    def end_job(self):
+        """Close the current job, keep its totals for the dump and return its summary table."""
+        rows = self.job_sites
+        self.jobs.append({
+            'job': self.job_label,
+            'commands': sum(stats['calls'] for stats in rows.values()),
+            'seconds': round(sum(stats['seconds'] for stats in rows.values()), 3),
+            'misses': sum(stats['misses'] for stats in rows.values()),
+            'miss_seconds': round(sum(stats['miss_seconds'] for stats in rows.values()), 3),
+        })
+        table = self.table(rows, limit=10, title=f"WebDriver commands for job {self.job_label}")
+        self.job_sites = {}
+        return table
+
+    def run_summary(self, limit=25):
+        """Summary table of the whole run, by calling method and command."""
+        by_method = {}
+        for (method, _, command), stats in self.sites.items():
+            merged = by_method.setdefault((method, command), {'calls': 0, 'seconds': 0.0, 'max': 0.0, 'misses': 0, 'miss_seconds': 0.0})
+            for key in ('calls', 'seconds', 'misses', 'miss_seconds'):
+                merged[key] += stats[key]
+            merged['max'] = max(merged['max'], stats['max'])
+        return self.table(by_method, limit=limit, title="WebDriver commands for this run")
+
+    @staticmethod
+    def table(rows, limit, title):
+        calls = sum(stats['calls'] for stats in rows.values())
+        seconds = sum(stats['seconds'] for stats in rows.values())
+        misses = sum(stats['misses'] for stats in rows.values())
+        miss_seconds = sum(stats['miss_seconds'] for stats in rows.values())
+        lines = [f"{title}: {calls} commands, {seconds:.2f}s, {misses} implicit-wait misses costing {miss_seconds:.2f}s",
+                 f"  {'call site':<34}{'command':<24}{'calls':>7}{'total s':>9}{'mean ms':>9}{'max ms':>9}{'misses':>8}{'miss s':>8}"]
+        for (method, command), stats in sorted(rows.items(), key=lambda item: item[1]['seconds'], reverse=True)[:limit]:
+            lines.append(f"  {method:<34}{command:<24}{stats['calls']:>7}{stats['seconds']:>9.2f}"
+                         f"{stats['seconds'] / stats['calls'] * 1000:>9.1f}{stats['max'] * 1000:>9.1f}"
+                         f"{stats['misses']:>8}{stats['miss_seconds']:>8.2f}")
+        return "\n".join(lines)
+
+    def dump(self, path):
+        """Write every call site (method, line, command) and the per-job totals as JSON."""
+        sites = [{'method': method, 'line': line, 'command': command, 'calls': stats['calls'],
+                  'seconds': round(stats['seconds'], 4), 'max_ms': round(stats['max'] * 1000, 1),
+                  'misses': stats['misses'], 'miss_seconds': round(stats['miss_seconds'], 4)}
+                 for (method, line, command), stats in self.sites.items()]
+        sites.sort(key=lambda site: site['seconds'], reverse=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'commands': self.total,
+                'seconds': round(sum(site['seconds'] for site in sites), 3),
+                'misses': sum(site['misses'] for site in sites),
+                'miss_seconds': round(sum(site['miss_seconds'] for site in sites), 3),
+                'sites': sites,
+                'jobs': self.jobs,
+            }, f, indent=1)
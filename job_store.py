@@ -0,0 +1,95 @@
+import re, sqlite3, threading
+from datetime import datetime
+
+JOB_ID_PATTERN = re.compile(r'/jobs/view/(\d+)|currentJobId=(\d+)')
+
+
+def parse_job_id(link):
+    """Return the numeric LinkedIn job ID contained in a job link, or None."""
+    if not link:
+        return None
+    match = JOB_ID_PATTERN.search(link)
+    if not match:
+        return None
+    return int(match.group(1) or match.group(2))
+
+
+class JobStore:
+    """
+    Persistent record of every job the bot has already handled, keyed by LinkedIn job ID.
+
+    The table is loaded once at startup into an in-memory dict (job ID -> status) so
+    membership checks before clicking a card are O(1) and never touch the disk.
+    """
+
+    APPLIED = 'applied'
+    FAILED = 'failed'
+    SKIPPED = 'skipped'
+
+    def __init__(self, path="seen_jobs.db"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "job_id INTEGER PRIMARY KEY, "
+            "status TEXT NOT NULL, "
+            "company TEXT, "
+            "title TEXT, "
+            "link TEXT, "
+            "updated_at TEXT)"
+        )
+        self._conn.commit()
+        self._statuses = {}
+        self._claimed = {}  # job ID -> ident of the thread working on it
+        for job_id, status in self._conn.execute("SELECT job_id, status FROM jobs"):
+            self._statuses[job_id] = status
+        print(f"Loaded {len(self._statuses)} previously seen jobs from {path}")
+
+    def __contains__(self, job_id):
+        return job_id in self._statuses
+
+    def __len__(self):
+        return len(self._statuses)
+
+    def status(self, job_id):
+        return self._statuses.get(job_id)
+
+    def claim(self, job_id):
+        """
+        Reserve a job for the calling worker. Returns False if the job was already handled or
+        another worker sharing this store is working on it. Jobs without an ID cannot be claimed
+        and are always allowed.
+        """
+        if job_id is None:
+            return True
+        with self._lock:
+            if job_id in self._statuses or job_id in self._claimed:
+                return False
+            self._claimed[job_id] = threading.get_ident()
+            return True
+
+    def release(self, job_id):
+        """Give up the calling worker's claim on a job. Claims held by other workers are left alone."""
+        with self._lock:
+            if self._claimed.get(job_id) == threading.get_ident():
+                del self._claimed[job_id]
+
+    def record(self, job_id, status, company="", title="", link=""):
+        """Insert or update the outcome for a job. Jobs without an ID are ignored."""
+        if job_id is None:
+            return
+        with self._lock:
+            self._statuses[job_id] = status
+            self._claimed.pop(job_id, None)
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, status, company, title, link, updated_at) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(job_id) DO UPDATE SET status=excluded.status, company=excluded.company, "
+                "title=excluded.title, link=excluded.link, updated_at=excluded.updated_at",
+                (job_id, status, company, title, link, datetime.now().isoformat(timespec='seconds'))
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
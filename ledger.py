@@ -0,0 +1,206 @@
+import atexit, csv, io, os, queue, sqlite3, threading, time
+from datetime import datetime
+from job_store import parse_job_id
+
+# Columns of each record kind, in file order. contacts keep the order of the file the bot wrote
+# before, so an existing hiring_team_contacts.csv still lines up.
+SCHEMAS = {
+    'applications': ('timestamp', 'status', 'job_id', 'company', 'title', 'link', 'location', 'search_location'),
+    'contacts': ('company', 'title', 'job_link', 'recruiter_profile_link', 'timestamp'),
+}
+FILE_NAMES = {'applications': 'applications', 'contacts': 'hiring_team_contacts'}
+INDEXES = {'applications': ('job_id', 'company', 'timestamp'), 'contacts': ('company',)}
+
+# Tells the writer thread to write what is left and stop
+_STOP = object()
+
+
+class _CsvBackend:
+    """
+    One CSV file per record kind. A file over max_bytes is renamed with a timestamp and a new one
+    started. Single-process only: a process still appending to a file another one has just renamed
+    would write its rows to the rotated file.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.files = {}
+        os.makedirs(directory, exist_ok=True)
+        if not os.access(directory, os.W_OK):
+            raise PermissionError(f"Cannot write the ledger to {directory}")
+
+    def path(self, kind):
+        return os.path.join(self.directory, FILE_NAMES[kind] + ".csv")
+
+    def _file(self, kind):
+        if kind not in self.files:
+            path = self.path(kind)
+            new = not os.path.isfile(path) or os.path.getsize(path) == 0
+            self.files[kind] = open(path, 'a', newline='', encoding='utf-8')
+            if new:
+                csv.writer(self.files[kind]).writerow(SCHEMAS[kind])
+        return self.files[kind]
+
+    def write(self, records):
+        batches = {}
+        for kind, fields in records:
+            buffer = batches.setdefault(kind, io.StringIO())
+            csv.writer(buffer).writerow([fields.get(column, '') for column in SCHEMAS[kind]])
+        for kind, buffer in batches.items():
+            f = self._file(kind)
+            # One write per batch, so a reader never sees half a row
+            f.write(buffer.getvalue())
+            f.flush()
+            if self.max_bytes and f.tell() >= self.max_bytes:
+                self.rotate(kind)
+
+    def rotate(self, kind):
+        f = self.files.pop(kind)
+        os.fsync(f.fileno())
+        f.close()
+        stamp = f"{datetime.now():%Y%m%d-%H%M%S}"
+        rotated, number = os.path.join(self.directory, f"{FILE_NAMES[kind]}.{stamp}.csv"), 1
+        while os.path.exists(rotated):
+            rotated, number = os.path.join(self.directory, f"{FILE_NAMES[kind]}.{stamp}-{number}.csv"), number + 1
+        os.replace(self.path(kind), rotated)
+
+    def sync(self):
+        for f in self.files.values():
+            os.fsync(f.fileno())
+
+    def close(self):
+        self.sync()
+        for f in self.files.values():
+            f.close()
+        self.files = {}
+
+
+class _SqliteBackend:
+    """One table per record kind in a single SQLite file, safe to share between processes."""
+
+    def __init__(self, path):
+        self.path = path
+        # Created by Ledger.__init__, then only used by the writer thread
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        for kind, columns in SCHEMAS.items():
+            self._conn.execute(f"CREATE TABLE IF NOT EXISTS {kind} (id INTEGER PRIMARY KEY, "
+                               + ", ".join(f"{column} {'INTEGER' if column == 'job_id' else 'TEXT'}" for column in columns) + ")")
+            for column in INDEXES[kind]:
+                self._conn.execute(f"CREATE INDEX IF NOT EXISTS {kind}_{column} ON {kind} ({column})")
+        self._conn.commit()
+
+    def write(self, records):
+        batches = {}
+        for kind, fields in records:
+            batches.setdefault(kind, []).append([fields.get(column) for column in SCHEMAS[kind]])
+        for kind, rows in batches.items():
+            columns = SCHEMAS[kind]
+            self._conn.executemany(f"INSERT INTO {kind} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})", rows)
+        self._conn.commit()
+
+    def sync(self):
+        pass  # every commit is already durable
+
+    def close(self):
+        self._conn.close()
+
+
+class Ledger:
+    """
+    Record of every application (with its status: applied, failed or skipped) and every hiring
+    team contact found. Unanswered questions are counted in the QuestionCatalog instead.
+
+    Records are queued and written in batches by a background thread, so the bot never waits on
+    the disk, and fsynced every fsync_interval seconds (checked every flush_interval). Workers
+    of one run share one Ledger. With backend 'csv' each kind goes to its own CSV file in
+    directory, rotated past max_bytes, which only one process may do at a time; with 'sqlite' they
+    go to tables in directory/ledger.db, indexed by job ID, company and date, which is also safe
+    for several runs at once.
+    """
+
+    def __init__(self, directory='.', backend='csv', flush_interval=1.0, fsync_interval=10.0, max_bytes=10 * 1024 * 1024):
+        self.directory = directory
+        self.backend_name = backend
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.max_bytes = max_bytes
+        self.written = 0
+        self._queue = queue.Queue()
+        self._closed = False
+        # Opened here so a directory or database that cannot be written stops the bot at startup,
+        # rather than killing the writer thread unnoticed
+        self._backend = self._open()
+        self._thread = threading.Thread(target=self._run, name="ledger-writer", daemon=True)
+        self._thread.start()
+        # Records still queued when the bot exits are written, not lost with the daemon thread
+        atexit.register(self.close)
+
+    def record(self, kind, **fields):
+        fields.setdefault('timestamp', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        self._queue.put((kind, fields))
+
+    def application(self, status, company, title, link, location, search_location):
+        self.record('applications', status=status, job_id=parse_job_id(link), company=company, title=title,
+                    link=link, location=location, search_location=search_location)
+
+    def contact(self, company, title, job_link, recruiter_profile_link):
+        self.record('contacts', company=company, title=title, job_link=job_link,
+                    recruiter_profile_link=recruiter_profile_link)
+
+    def flush(self):
+        """Block until everything recorded so far has been written."""
+        self._queue.join()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _open(self):
+        if self.backend_name == 'sqlite':
+            os.makedirs(self.directory, exist_ok=True)
+            return _SqliteBackend(os.path.join(self.directory, 'ledger.db'))
+        return _CsvBackend(self.directory, self.max_bytes)
+
+    def _run(self):
+        backend = self._backend
+        synced = time.time()
+        while True:
+            try:
+                items = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                items = []
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            records = [item for item in items if item is not _STOP]
+            stop = len(records) < len(items)
+            try:
+                if records:
+                    backend.write(records)
+                    self.written += len(records)
+                if stop or time.time() - synced >= self.fsync_interval:
+                    backend.sync()
+                    synced = time.time()
+            except Exception as e:
+                print(f"Failed to write {len(records)} records to the ledger: {e}")
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+            if stop:
+                backend.close()
+                return
+
+
+def ledger_from_parameters(parameters):
+    """Build the Ledger from the 'ledger' section of config.yaml."""
+    settings = parameters.get('ledger') or {}
+    return Ledger(settings.get('directory') or '.', settings.get('backend', 'csv'),
+                  fsync_interval=settings.get('fsyncInterval', 10),
+                  max_bytes=int(float(settings.get('maxFileSizeMb', 10)) * 1024 * 1024))
@@ -1,4 +1,4 @@
-import time, random, csv, pyautogui, traceback, os, re
+import time, random, traceback, os, re, threading
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
@@ -7,48 +7,372 @@ from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
-from datetime import date, datetime
+from datetime import date
 from itertools import product
-from pypdf import PdfReader
-from openai import OpenAI
+from job_store import JobStore, parse_job_id
+from ai_cache import ResponseCache, FitVerdictCache, ResumeTextCache, context_hash, extract_resume_text, normalize_resume_text
+from instrumentation import CommandCounter, CommandProfiler
+from waits import WaitEngine, RunPacer
+from metrics import metrics_from_parameters
+from ledger import ledger_from_parameters
+from pipeline import JobPipeline
+from blacklist import BlacklistIndex
+from question_rules import QuestionRuleEngine, DEFAULT_QUESTION_RULES
+from question_catalog import QuestionCatalog
 import sys
 import pdb  # Import the Python debugger
 
+# Extracts every job card of a results page in one round trip. Cards outside the viewport are
+# rendered lazily by LinkedIn, so empty tiles are scrolled into view before being read.
+JOB_CARDS_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const tiles = Array.from(document.querySelectorAll('li.scaffold-layout__list-item'));
+const frame = () => new Promise(resolve => setTimeout(resolve, 50));
+
+async function render(tile) {
+    for (let i = 0; i < 10 && !tile.querySelector('.job-card-container, .job-card-list, a'); i++) {
+        tile.scrollIntoView({block: 'center'});
+        await frame();
+    }
+}
+
+function text(tile, selector) {
+    const el = tile.querySelector(selector);
+    return el ? el.innerText.trim() : '';
+}
+
+(async () => {
+    const cards = [];
+    for (const [index, tile] of tiles.entries()) {
+        await render(tile);
+        const base = tile.querySelector('.job-card-container, .job-card-list');
+        const titleEl = base && base.querySelector('.job-card-list__title, .job-card-container__title');
+        const linkEl = (titleEl && titleEl.href) ? titleEl : (tile.querySelector('a[href*="/jobs/view/"]') || tile.querySelector('a'));
+        let poster = '';
+        for (const span of tile.querySelectorAll('span')) {
+            const position = span.innerText.indexOf(' is hiring for this');
+            if (position !== -1) {
+                poster = span.innerText.slice(0, position);
+                break;
+            }
+        }
+        cards.push({
+            index: index,
+            job_id: tile.getAttribute('data-occludable-job-id') || (base && base.getAttribute('data-job-id')) || '',
+            title: (titleEl || linkEl) ? (titleEl || linkEl).innerText.trim() : '',
+            link: linkEl && linkEl.href ? linkEl.href.split('?')[0] : '',
+            company: text(tile, '[class*="job-card-container__primary-description"], [class*="job-card-container__company-name"], .artdeco-entity-lockup__subtitle'),
+            poster: poster,
+            location: text(tile, '.job-card-container__metadata-item'),
+            apply_method: text(tile, '.job-card-container__apply-method'),
+            badges: Array.from(tile.querySelectorAll('.job-card-container__footer-item')).map(el => el.innerText.trim()).filter(Boolean)
+        });
+    }
+    return cards;
+})().then(done, () => done([]));
+"""
+
+# State of a results page, evaluated in the browser so no markup has to be transferred. total is the
+# result count of the search shown above the list ("1,234 results"), or null when it is not shown.
+RESULTS_STATE_SCRIPT = """
+const banner = document.querySelector('.jobs-search-two-pane__no-results-banner--expand');
+const header = document.querySelector('.jobs-search-results-list__text');
+const subtitle = document.querySelector('.jobs-search-results-list__subtitle');
+const count = subtitle && subtitle.innerText.replace(/[\\s,.]/g, '').match(/\\d+/);
+return {
+    no_results: !!banner && banner.innerText.indexOf('No matching jobs found') !== -1,
+    unavailable: document.body.innerText.toLowerCase().indexOf('unfortunately, things are') !== -1,
+    suggestions_only: !!header && header.innerText.indexOf('Jobs you may be interested in') !== -1,
+    total: count ? parseInt(count[0], 10) : null
+};
+"""
+
+# Job cards per results page (the &start= step), and the most results LinkedIn pages through for one search
+RESULTS_PAGE_SIZE = 25
+MAX_SEARCH_RESULTS = 1000
+
+# Collects the validation messages shown inside the Easy Apply modal, with the field they belong to
+FORM_ERRORS_SCRIPT = """
+const modal = document.querySelector('.jobs-easy-apply-modal, .artdeco-modal');
+if (!modal) return [];
+const errors = [];
+for (const el of modal.querySelectorAll('.artdeco-inline-feedback--error, [role="alert"]')) {
+    const message = el.innerText.trim();
+    if (!message || !el.offsetParent) continue;
+    const group = el.closest('.fb-dash-form-element, .jobs-easy-apply-form-element, .jobs-easy-apply-form-section__grouping, .form-group');
+    const label = group && group.querySelector('label, legend, .fb-dash-form-element__label');
+    const field = group && group.querySelector('input, select, textarea');
+    errors.push({
+        message: message,
+        inline: el.classList.contains('artdeco-inline-feedback--error'),
+        field: label ? label.innerText.trim() : '',
+        id: field ? field.id : ''
+    });
+}
+return errors;
+"""
+
+# Describes every question (fb-dash-form-element) of the form in arguments[0]: its type, label, input id,
+# current value, required flag and options, plus the elements an answer is written to ('field', and 'choices'
+# holding the labels to click for radio and checkbox questions). type is null for groups that are not questions.
+QUESTIONS_SCRIPT = """
+const text = el => el ? el.innerText.trim() : '';
+const questions = [];
+for (const group of arguments[0].querySelectorAll('.fb-dash-form-element')) {
+    const question = {type: null, label: text(group.querySelector('label')), id: '', value: '', options: [], choices: [], field: null,
+                      required: !!group.querySelector('[required], [aria-required="true"]')};
+    const fieldset = group.querySelector('fieldset');
+    const datepicker = group.querySelector('.artdeco-datepicker__input');
+    const checkbox = group.querySelector('label > input[type="checkbox"]');
+    const input = group.querySelector('input, textarea');
+    const select = group.querySelector('select');
+    if (fieldset) {
+        const heading = fieldset.querySelector('.fb-dash-form-element__label');
+        const labels = Array.from(fieldset.querySelectorAll('label'));
+        const checked = labels.find(label => label.control && label.control.checked);
+        Object.assign(question, {type: 'radio', label: text(heading && (heading.querySelector('span') || heading)), field: fieldset,
+                                 options: labels.map(text), choices: labels, value: checked ? text(checked) : ''});
+    } else if (datepicker) {
+        Object.assign(question, {type: 'date', id: datepicker.id, field: datepicker, value: datepicker.value});
+    } else if (checkbox) {
+        Object.assign(question, {type: 'checkbox', label: text(checkbox.parentElement), id: checkbox.id, field: checkbox,
+                                 choices: [checkbox.parentElement], value: checkbox.checked});
+    } else if (input) {
+        Object.assign(question, {type: 'text', id: input.id, field: input, value: input.value});
+    } else if (select) {
+        const options = Array.from(select.options);
+        Object.assign(question, {type: 'dropdown', id: select.id, field: select, options: options.map(option => option.text.trim()),
+                                 value: select.selectedIndex >= 0 ? text(options[select.selectedIndex]) : ''});
+    }
+    questions.push(question);
+}
+return questions;
+"""
+
+# Applies every queued answer of a modal step: arguments[0] is a list of [element, kind, value] with kind
+# 'text' or 'select' (value is the option's visible text) or 'click' (a label). Values go through the native
+# setter, so the form framework sees them, followed by the input and change events it listens for. Every field
+# is read back once all are set, as one field's events can re-render another; returns one flag per fill.
+FILL_FIELDS_SCRIPT = """
+const fills = arguments[0];
+const setters = [HTMLInputElement, HTMLTextAreaElement, HTMLSelectElement].map(type => [type, Object.getOwnPropertyDescriptor(type.prototype, 'value').set]);
+const squash = s => s.replace(/\\s+/g, ' ').trim();
+const expected = [];
+for (const [el, kind, value] of fills) {
+    try {
+        if (kind === 'click') {
+            el.click();
+            const input = el.control || el.querySelector('input');
+            expected.push(input ? () => input.checked : () => true);
+            continue;
+        }
+        let target = value;
+        if (kind === 'select') {
+            const option = Array.from(el.options).find(o => squash(o.text) === squash(value));
+            if (!option) { expected.push(() => false); continue; }
+            target = option.value;
+        }
+        el.focus();
+        setters.find(([type]) => el instanceof type)[1].call(el, target);
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+        el.blur();
+        expected.push(() => el.isConnected && el.value === target);
+    } catch (e) {
+        expected.push(() => false);
+    }
+}
+return expected.map(check => check());
+"""
+
+# Validation messages LinkedIn shows (in several languages) when an answer or upload is rejected
+VALIDATION_ERROR_MESSAGES = [
+    'enter a valid',
+    'enter a decimal',
+    'enter a whole number',
+    'enter a whole number between 0 and 99',
+    'file is required',
+    'whole number',
+    'make a selection',
+    'select checkbox to proceed',
+    'saisissez un numéro',
+    '请输入whole编号',
+    '请输入decimal编号',
+    '长度超过 0.0',
+    'numéro de téléphone',
+    'introduce un número de whole entre',
+    'inserisci un numero whole compreso',
+    'preguntas adicionales',
+    'insira um um número',
+    'cuántos años',
+    'use the format',
+    'a file is required',
+    '请选择',
+    '请 选 择',
+    'inserisci',
+    'wholenummer',
+    'wpisz liczb',
+    'zakresu od',
+    'tussen'
+]
+VALIDATION_ERROR_PATTERN = re.compile('|'.join(re.escape(message) for message in
+                                               sorted(VALIDATION_ERROR_MESSAGES, key=len, reverse=True)))
+
+# Instructions shared by every question. Together with the candidate context they form a
+# byte-identical prompt prefix, so OpenAI prompt caching can reuse it across calls; only the
+# question-specific part at the end of the conversation varies.
+ANSWER_SYSTEM_PROMPT = (
+    "You are a bot auto applying for jobs on behalf of the candidate described below and answer job application "
+    "questions professionally and concisely, using the candidate's background information and resume to personalize "
+    "responses. It is 2025 and candidate has 6 years experience of software so reference that if hesistant on anything. "
+    "Lean a bit on the embelishment side so for front end technologies say 5+ years experience for example."
+)
+
+ANSWER_INSTRUCTIONS = {
+    "text": "Answer this job application question professionally and concisely.",
+    "numeric": "Based on the candidate's experience, provide a single number as your response. No explanation needed.",
+    "choice": "Select the most appropriate answer choice based on the candidate's background by returning only its index number. No explanation needed. If necessary make a guess of most likely answer."
+}
+
+JOB_FIT_SYSTEM_PROMPT = """You are evaluating job fit for technical roles. 
+            Recommend APPLY if:
+            - Candidate meets 65 percent of the core requirements
+            - Experience gap is 2 years or less
+            - Has relevant transferable skills
+            
+            Return SKIP if:
+            - Experience gap is greater than 2 years
+            - Missing multiple core requirements
+            - Role is clearly more senior
+            - The role is focused on an uncommon technology or skill that is required and that the candidate does not have experience with
+            - The role is a leadership role or a role that requires managing people and the candidate has no experience leading or managing people
+
+            """
+#Consider the candidate's education level when evaluating whether they meet the core requirements. Having higher education than required should allow for greater flexibility in the required experience.
+
 class AIResponseGenerator:
-    def __init__(self, api_key, personal_info, experience, languages, resume_path, text_resume_path=None, debug=False):
+    def __init__(self, api_key, personal_info, experience, languages, resume_path, text_resume_path=None, debug=False, cache=None, fit_cache=None, resume_cache=None):
         self.personal_info = personal_info
         self.experience = experience
         self.languages = languages
         self.pdf_resume_path = resume_path
         self.text_resume_path = text_resume_path
         self._resume_content = None
-        self._client = OpenAI(api_key=api_key) if api_key else None
+        self._resume_prompt_text = None
+        self.resume_cache = resume_cache
+        # The OpenAI client (and the openai package) is only loaded when the first AI call is made
+        self.api_key = api_key
+        self.enabled = bool(api_key)
+        self._client = None
+        self._lock = threading.RLock()
         self.debug = debug
+        self.cache = cache
+        self.fit_cache = fit_cache
+        self._candidate_context = None
+        self._candidate_hash = None
+        self._context_signature = None
+        self.ai_calls = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+
+    @property
+    def client(self):
+        with self._lock:
+            if self._client is None:
+                from openai import OpenAI
+                self._client = OpenAI(api_key=self.api_key)
+            return self._client
+
+    def warm_up(self):
+        """Create the OpenAI client and build the candidate context ahead of the first question."""
+        if self.enabled:
+            self.client
+            self.candidate_context
+
     @property
     def resume_content(self):
         if self._resume_content is None:
-            # First try to read from text resume if available
-            if self.text_resume_path:
-                try:
-                    with open(self.text_resume_path, 'r', encoding='utf-8') as f:
-                        self._resume_content = f.read()
-                        print("Successfully loaded text resume")
-                        return self._resume_content
-                except Exception as e:
-                    print(f"Could not read text resume: {str(e)}")
+            self._load_resume()
+        return self._resume_content
 
-            # Fall back to PDF resume if text resume fails or isn't available
+    @property
+    def resume_prompt_text(self):
+        """The resume text with whitespace collapsed, as sent in prompts."""
+        if self._resume_prompt_text is None:
+            self._load_resume()
+        return self._resume_prompt_text
+
+    def _load_resume(self):
+        # The text resume is preferred when it exists; otherwise the PDF resume is parsed
+        for path, pdf in ((self.text_resume_path, False), (self.pdf_resume_path, True)):
+            if not path or (not pdf and not os.path.isfile(path)):
+                continue
+            kind = "PDF" if pdf else "text"
             try:
-                content = []
-                reader = PdfReader(self.pdf_resume_path)
-                for page in reader.pages:
-                    content.append(page.extract_text())
-                self._resume_content = "\n".join(content)
-                print("Successfully loaded PDF resume")
+                if self.resume_cache:
+                    text, normalized, cached = self.resume_cache.load(path, pdf)
+                else:
+                    text = extract_resume_text(path, pdf)
+                    normalized, cached = normalize_resume_text(text), False
+                self._resume_content, self._resume_prompt_text = text, normalized
+                print(f"Successfully loaded {kind} resume" + (" (cached text)" if cached else ""))
+                return
             except Exception as e:
-                print(f"Could not extract text from resume PDF: {str(e)}")
-                self._resume_content = ""
-        return self._resume_content
+                print(f"Could not extract text from {kind} resume: {str(e)}")
+        self._resume_content, self._resume_prompt_text = "", ""
+
+    def _resume_signature(self):
+        signature = []
+        for path in (self.text_resume_path, self.pdf_resume_path):
+            try:
+                stat = os.stat(path)
+                signature.append((path, stat.st_mtime_ns, stat.st_size))
+            except (OSError, TypeError):
+                signature.append((path, None, None))
+        return tuple(signature)
+
+    @property
+    def candidate_context(self):
+        """The candidate context, built once and rebuilt only when a resume file changes on disk."""
+        signature = self._resume_signature()
+        with self._lock:
+            if self._candidate_context is None or signature != self._context_signature:
+                if self._context_signature is not None:
+                    print("Resume changed on disk, rebuilding candidate context")
+                    self._resume_content = None
+                    self._resume_prompt_text = None
+                self._context_signature = signature
+                self._candidate_context = self._build_context()
+                self._candidate_hash = context_hash(self._candidate_context)
+            return self._candidate_context
+
+    @property
+    def candidate_hash(self):
+        self.candidate_context  # (re)builds the context and its hash if needed
+        return self._candidate_hash
+
+    def _complete(self, model, system_prompt, user_content, max_tokens, temperature):
+        """Send a chat completion and record latency and prompt/cached token usage."""
+        started = time.time()
+        response = self.client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_content}
+            ],
+            max_tokens=max_tokens,
+            temperature=temperature
+        )
+        elapsed = time.time() - started
+
+        usage = getattr(response, 'usage', None)
+        prompt_tokens = getattr(usage, 'prompt_tokens', 0) or 0
+        cached_tokens = getattr(getattr(usage, 'prompt_tokens_details', None), 'cached_tokens', 0) or 0
+        self.ai_calls += 1
+        self.prompt_tokens += prompt_tokens
+        self.cached_tokens += cached_tokens
+        print(f"AI call to {model}: {prompt_tokens} prompt tokens ({cached_tokens} cached) in {elapsed:.2f}s")
+        return response.choices[0].message.content.strip()
 
     def _build_context(self):
         return f"""
@@ -61,7 +385,7 @@ class AIResponseGenerator:
         - Citizenship: {self.personal_info.get('citizenship', 'Not Specified')}
 
         Resume Content (Give the greatest weight to this information, if specified):
-        {self.resume_content}
+        {self.resume_prompt_text}
         """
 
     def generate_response(self, question_text, response_type="text", options=None, max_tokens=100):
@@ -79,91 +403,93 @@ class AIResponseGenerator:
             - For numeric: Integer value or None
             - For choice: Integer index of selected option or None
         """
-        if not self._client:
+        if not self.enabled:
             return None
             
         try:
-            context = self._build_context()
+            context = self.candidate_context
+            candidate_hash = self.candidate_hash
+            if self.cache:
+                hit, cached_answer = self.cache.get(question_text, response_type, options, candidate_hash)
+                if hit:
+                    print(f"AI response (cached): {cached_answer}")
+                    return cached_answer
             
-            system_prompt = {
-                "text": "You are a helpful assistant answering job application questions professionally and concisely. Use the candidate's background information and resume to personalize responses.",
-                "numeric": "You are a helpful assistant providing numeric answers to job application questions. Based on the candidate's experience, provide a single number as your response. No explanation needed.",
-                "choice": "You are a bot helpfull auto applying for jobs and must select the most appropriate answer choice for job application questions. Based on the candidate's background, select the best option by returning only its index number. No explanation needed. If necessary make a guess of most likely answer. "
-            }[response_type]
-
-            user_content = f"Using this candidate's background and resume:\n{context}\n\n Please answer this job application question: {question_text}\n\n It is 2025 and candidate has 6 years experience of software so reference that if hesistant on anything. Lean a bit on the embelishment side so for front end technologies say 5+ years experience for example."
+            # Static prefix first (instructions + candidate context), per-question part last
+            system_prompt = f"{ANSWER_SYSTEM_PROMPT}\n\nCandidate background and resume:\n{context}"
+            user_content = f"{ANSWER_INSTRUCTIONS[response_type]}\n\nJob application question: {question_text}"
             if response_type == "choice" and options:
                 options_text = "\n".join([f"{idx}: {text}" for idx, text in options])
                 user_content += f"\n\nSelect the most appropriate answer by providing its index number from these options:\n{options_text}"
 
-            response = self._client.chat.completions.create(
-                model="gpt-4.1-2025-04-14",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_content}
-                ],
-                max_tokens=max_tokens,
-                temperature=0.7
-            )
-            
-            answer = response.choices[0].message.content.strip()
+            answer = self._complete("gpt-4.1-2025-04-14", system_prompt, user_content, max_tokens, temperature=0.7)
             print(f"AI response: {answer}")  # TODO: Put logging behind a debug flag
             
             if response_type == "numeric":
                 # Extract first number from response
                 numbers = re.findall(r'\d+', answer)
-                if numbers:
-                    return int(numbers[0])
-                return 0
+                answer = int(numbers[0]) if numbers else 0
             elif response_type == "choice":
                 # Extract the index number from the response
                 numbers = re.findall(r'\d+', answer)
+                answer = None  # None if the index is not within the valid range
                 if numbers and options:
                     index = int(numbers[0])
                     # Ensure index is within valid range
                     if 0 <= index < len(options):
-                        return index
-                return None  # Return None if the index is not within the valid range
-                
+                        answer = index
+
+            if self.cache and answer is not None:
+                self.cache.put(question_text, response_type, options, candidate_hash, answer)
             return answer
             
         except Exception as e:
             print(f"Error using AI to generate response: {str(e)}")
             return None
 
-    def evaluate_job_fit(self, job_title, job_description):
+    def cached_job_fit(self, job_id):
+        """
+        Look up a previous job-fit verdict for a job ID without reading its description
+
+        Returns:
+            bool or None: True/False for a cached APPLY/SKIP, None if the job was never evaluated
+        """
+        if not self.enabled or not self.fit_cache or job_id is None:
+            return None
+        verdict = self.fit_cache.get(self.candidate_hash, job_id=job_id)
+        if verdict is None:
+            return None
+        apply, reason = verdict
+        print(f"AI evaluation (cached): {reason or ('APPLY' if apply else 'SKIP')}")
+        return apply
+
+    def evaluate_job_fit(self, job_title, job_description, job_id=None):
         """
         Evaluate whether a job is worth applying to based on the candidate's experience and the job requirements
         
         Args:
             job_title: The title of the job posting
             job_description: The full job description text
+            job_id: The LinkedIn job ID, used to cache the verdict across searches and runs
             
         Returns:
             bool: True if should apply, False if should skip
         """
-        if not self._client:
+        if not self.enabled:
             return True  # Proceed with application if AI not available
             
         try:
-            context = self._build_context()
-            
-            system_prompt = """You are evaluating job fit for technical roles. 
-            Recommend APPLY if:
-            - Candidate meets 65 percent of the core requirements
-            - Experience gap is 2 years or less
-            - Has relevant transferable skills
-            
-            Return SKIP if:
-            - Experience gap is greater than 2 years
-            - Missing multiple core requirements
-            - Role is clearly more senior
-            - The role is focused on an uncommon technology or skill that is required and that the candidate does not have experience with
-            - The role is a leadership role or a role that requires managing people and the candidate has no experience leading or managing people
-
-            """
-            #Consider the candidate's education level when evaluating whether they meet the core requirements. Having higher education than required should allow for greater flexibility in the required experience.
+            context = self.candidate_context
+            candidate_hash = self.candidate_hash
+            description_hash = FitVerdictCache.description_hash(job_title, job_description)
+            if self.fit_cache:
+                verdict = self.fit_cache.get(candidate_hash, job_id=job_id, description_hash=description_hash)
+                if verdict is not None:
+                    apply, reason = verdict
+                    print(f"AI evaluation (cached): {reason or ('APPLY' if apply else 'SKIP')}")
+                    return apply
             
+            system_prompt = JOB_FIT_SYSTEM_PROMPT
             if self.debug:
                 system_prompt += """
                 You are in debug mode. Return a detailed explanation of your reasoning for each requirement.
@@ -173,43 +499,64 @@ class AIResponseGenerator:
                 Format response as: APPLY/SKIP: [brief reason]"""
             else:
                 system_prompt += """Return only APPLY or SKIP."""
+            # Candidate context goes into the static prefix, the job description last
+            system_prompt += f"\n\nCandidate:\n{context}"
 
-            response = self._client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": f"Job: {job_title}\n{job_description}\n\nCandidate:\n{context}"}
-                ],
+            answer = self._complete(
+                "gpt-3.5-turbo", system_prompt, f"Job: {job_title}\n{job_description}",
                 max_tokens=250 if self.debug else 1,  # Allow more tokens when debug is enabled
                 temperature=0.2  # Lower temperature for more consistent decisions
             )
-            
-            answer = response.choices[0].message.content.strip()
             print(f"AI evaluation: {answer}")
-            return answer.upper().startswith('A')  # True for APPLY, False for SKIP
+            apply = answer.upper().startswith('A')  # True for APPLY, False for SKIP
+            if self.fit_cache:
+                self.fit_cache.put(candidate_hash, job_id, description_hash, apply, answer if self.debug else None)
+            return apply
             
         except Exception as e:
             print(f"Error evaluating job fit: {str(e)}")
             return True  # Proceed with application if evaluation fails
 
 class LinkedinEasyApply:
-    def __init__(self, parameters, driver):
+    def __init__(self, parameters, driver, job_store=None, pacer=None, metrics=None, ledger=None):
         self.browser = driver
         self.email = parameters['email']
         # self.email = parameters['lastName']
         self.password = parameters['password']
         self.openai_api_key = parameters.get('openaiApiKey', '')  # Get API key with empty default
         self.disable_lock = parameters['disableAntiLock']
+        self.headless = (parameters.get('browser') or {}).get('profile', 'standard') == 'lean'
         self.company_blacklist = parameters.get('companyBlacklist', []) or []
         self.title_blacklist = parameters.get('titleBlacklist', []) or []
         self.poster_blacklist = parameters.get('posterBlacklist', []) or []
+        self.blacklist = BlacklistIndex(self.company_blacklist, self.title_blacklist, self.poster_blacklist)
         self.positions = parameters.get('positions', [])
         self.locations = parameters.get('locations', [])
         self.residency = parameters.get('residentStatus', [])
+        self.base_url = (parameters.get('linkedinBaseUrl') or 'https://www.linkedin.com').rstrip('/')
         self.base_search_url = self.get_base_search_url(parameters)
-        self.seen_jobs = []
-        self.file_name = "output"
-        self.unprepared_questions_file_name = "unprepared_questions"
+        self.job_store = job_store or JobStore(parameters.get('jobStoreFile') or 'seen_jobs.db')
+        self.applications = 0
+        self.pages_avoided = 0
+        self.card_extraction = parameters.get('cardExtraction', 'script')
+        self.form_fill = parameters.get('formFill', 'script')
+        self._pending_fills = None
+        self.discovery = parameters.get('discovery', 'browser')
+        self.discovery_connections = parameters.get('discoveryConnections', 4)
+        self.harvester = None
+        self.pipeline = parameters.get('pipeline', False)
+        self.pipeline_queue_size = parameters.get('pipelineQueueSize', 20)
+        self.fit_evaluators = parameters.get('fitEvaluators', 2)
+        self.command_profiler = CommandProfiler(self.browser) if parameters.get('commandProfile') else None
+        self.command_profile_file = parameters.get('commandProfileFile') or 'command_profile.json'
+        self.command_counter = self.command_profiler or CommandCounter(self.browser)
+        self.metrics = metrics or metrics_from_parameters(parameters)
+        pacing = parameters.get('pacing') or {}
+        self.waits = WaitEngine(self.browser, min_delay=pacing.get('minDelay', 0.5), max_delay=pacing.get('maxDelay', 1.5),
+                                timeout=pacing.get('timeout', 10), metrics=self.metrics,
+                                scroll_budget=pacing.get('scrollBudget', 3))
+        self.pacer = pacer or RunPacer(max_applications_per_hour=pacing.get('maxApplicationsPerHour'))
+        self.ledger = ledger or ledger_from_parameters(parameters)
         self.output_file_directory = parameters['outputFileDirectory']
         self.resume_dir = parameters['uploads']['resume']
         self.text_resume = parameters.get('textResume', '')
@@ -226,10 +573,11 @@ class LinkedinEasyApply:
         self.personal_info = parameters.get('personalInfo', [])
         self.eeo = parameters.get('eeo', [])
         self.experience_default = int(self.experience['default'])
+        self.question_rules = QuestionRuleEngine((parameters.get('questionRules') or []) + DEFAULT_QUESTION_RULES, parameters)
+        self.question_catalog = QuestionCatalog(parameters.get('questionCatalogFile') or 'question_catalog.db')
         self.debug = parameters.get('debug', False)
         self.evaluate_job_fit = parameters.get('evaluateJobFit', True)
         self.test_single_url = parameters.get('testSingleUrl', None)
-        self.hiring_team_file_name = "hiring_team_contacts"
         self.ai_response_generator = AIResponseGenerator(
             api_key=self.openai_api_key,
             personal_info=self.personal_info,
@@ -237,19 +585,35 @@ class LinkedinEasyApply:
             languages=self.languages,
             resume_path=self.resume_dir,
             text_resume_path=self.text_resume,
-            debug=self.debug
+            debug=self.debug,
+            cache=ResponseCache(
+                parameters.get('aiCacheFile') or 'ai_cache.db',
+                ttl_days=parameters.get('aiCacheTtlDays', 90),
+                max_entries=parameters.get('aiCacheMaxEntries', 5000)
+            ) if parameters.get('aiCache', True) else None,
+            fit_cache=FitVerdictCache(parameters.get('aiCacheFile') or 'ai_cache.db') if parameters.get('aiCache', True) else None,
+            resume_cache=ResumeTextCache(parameters.get('aiCacheFile') or 'ai_cache.db') if parameters.get('resumeCache', True) else None
         )
 
     def login(self):
         try:
-            # Check if the "chrome_bot" directory exists
             print("Attempting to restore previous session...")
-            if os.path.exists("chrome_bot"):
-                self.browser.get("https://www.linkedin.com/feed/")
-                time.sleep(random.uniform(5, 10))
+            logged_in = self.session_state()
+            if logged_in:
+                print("Session cookie is valid, already logged in.")
+            elif logged_in is False:
+                print("No valid session, proceeding to login.")
+                self.load_login_page_and_login()
+            # The session could not be checked over HTTP, so look at where the feed ends up
+            elif os.path.exists("chrome_bot"):
+                self.browser.get(self.base_url + "/feed/")
+                # An expired session redirects away from the feed; wait for the page to settle instead of a fixed sleep
+                self.waits.until(lambda driver: driver.execute_script("return document.readyState") != 'loading',
+                                 "the feed to load")
+                self.waits.pause()
 
                 # Check if the current URL is the feed page
-                if self.browser.current_url != "https://www.linkedin.com/feed/":
+                if not self.browser.current_url.startswith(self.base_url + "/feed/"):
                     print("Feed page not loaded, proceeding to login.")
                     self.load_login_page_and_login()
             else:
@@ -261,8 +625,36 @@ class LinkedinEasyApply:
             self.security_check()
             # raise Exception("Could not login!")
 
+    def session_cookies(self):
+        """The browser's LinkedIn cookies, read through DevTools so that no page has to be open."""
+        try:
+            return self.browser.execute_cdp_cmd('Network.getCookies', {'urls': [self.base_url]})['cookies']
+        except Exception:
+            return self.browser.get_cookies()
+
+    def session_state(self):
+        """
+        Whether the browser is logged in, without loading the feed: False if there is no unexpired
+        li_at session cookie, otherwise the answer of one small request made with the browser's
+        cookies (True, False, or None if that request did not tell).
+        """
+        cookies = self.session_cookies()
+        session = next((cookie for cookie in cookies if cookie['name'] == 'li_at' and cookie['value']), None)
+        if session is None:
+            return False
+        # DevTools reports session cookies with expires -1; WebDriver leaves expiry out
+        expires = session.get('expires', session.get('expiry', -1))
+        if 0 < expires < time.time():
+            return False
+        from discovery import JobHarvester
+        user_agent = self.browser.execute_script("return navigator.userAgent")
+        return JobHarvester(self.base_url, cookies, user_agent, connections=1).logged_in()
+
     def security_check(self):
         current_url = self.browser.current_url
+        if current_url.startswith(self.base_url + "/feed/"):
+            # Logged in; no need to download the whole page source
+            return
         page_source = self.browser.page_source
 
         if '/checkpoint/challenge/' in current_url or 'security check' in page_source or 'quick verification' in page_source:
@@ -270,7 +662,7 @@ class LinkedinEasyApply:
             time.sleep(random.uniform(5.5, 10.5))
 
     def load_login_page_and_login(self):
-        self.browser.get("https://www.linkedin.com/login")
+        self.browser.get(self.base_url + "/login")
 
         # Wait for the username field to be present
         WebDriverWait(self.browser, 10).until(
@@ -283,18 +675,20 @@ class LinkedinEasyApply:
 
         # Wait for the feed page to load after login
         WebDriverWait(self.browser, 10).until(
-            EC.url_contains("https://www.linkedin.com/feed/")
+            EC.url_contains(self.base_url + "/feed/")
         )
 
-        time.sleep(random.uniform(5, 10))
+        self.waits.pause()
 
     def start_applying(self):
         # --- Modification for single URL testing ---
         if self.test_single_url:
             print(f"--- Running in Single URL Test Mode for: {self.test_single_url} ---")
             self.browser.get(self.test_single_url)
-            time.sleep(random.uniform(3, 6)) # Allow page to load
+            self.waits.until(self.waits.details_loaded(parse_job_id(self.test_single_url)), "the job page to load", timeout=15)
+            self.waits.pause()
             success = self.apply_single_job(self.test_single_url)
+            self.question_catalog.finish_job(success)
             status = "successfully" if success else "unsuccessfully"
             print(f"--- Single URL Test Mode finished {status}. Exiting. ---")
             return # Stop execution after testing the single URL
@@ -303,319 +697,558 @@ class LinkedinEasyApply:
         searches = list(product(self.positions, self.locations))
         random.shuffle(searches)
 
-        page_sleep = 0
-        minimum_time = 60 * 2  # minimum time bot should run before taking a break
-        minimum_page_time = time.time() + minimum_time
+        if self.pipeline:
+            JobPipeline(self, queue_size=self.pipeline_queue_size, evaluators=self.fit_evaluators).run(searches)
+        else:
+            for (position, location) in searches:
+                self.run_search(position, location)
+
+        self.print_run_summary()
 
-        for (position, location) in searches:
-            location_url = "&location=" + location
-            job_page_number = -1
+    def run_search(self, position, location):
+        """Apply to the jobs on every results page of one position/location search."""
+        if self.discovery == 'http':
+            return self.run_harvested_search(position, location)
 
-            print("Starting the search for " + position + " in " + location + ".")
+        location_url = "&location=" + location
+        job_page_number = -1
 
+        print("Starting the search for " + position + " in " + location + ".")
+
+        applications = self.applications
+        with self.metrics.phase('search', position=position, location=location) as search:
             try:
                 while True:
-                    page_sleep += 1
+                    self.pacer.start_page(self.waits)
                     job_page_number += 1
                     print("Going to job page " + str(job_page_number))
-                    self.next_job_page(position, location_url, job_page_number)
-                    time.sleep(random.uniform(1.5, 3.5))
+                    with self.metrics.phase('results_page', page=job_page_number):
+                        self.open_results_page(position, location_url, job_page_number)
+                    self.waits.pause()
                     print("Starting the application process for this page...")
-                    self.apply_jobs(location)
+                    results = self.apply_jobs(location)
                     print("Job applications on this page have been successfully completed.")
+                    if self.is_last_results_page(job_page_number, results):
+                        print(f"Page {job_page_number} was the last page of results for this search, not loading another.")
+                        self.pages_avoided += 1
+                        search['pages_avoided'] = 1
+                        break
+                    self.pacer.rest(self.waits)
+            except:
+                traceback.print_exc()
+                pass
+            search['pages'] = job_page_number + 1
+            search['applications'] = self.applications - applications
+
+        self.pacer.rest(self.waits, end_of_search=True)
 
-                    time_left = minimum_page_time - time.time()
-                    if time_left > 0:
-                        print("Sleeping for " + str(time_left) + " seconds.")
-                        time.sleep(time_left)
-                        minimum_page_time = time.time() + minimum_time
-                    if page_sleep % 5 == 0:
-                        sleep_time = random.randint(180, 300)  # Changed from 500, 900 {seconds}
-                        print("Sleeping for " + str(sleep_time / 60) + " minutes.")
-                        time.sleep(sleep_time)
-                        page_sleep += 1
+    def run_harvested_search(self, position, location):
+        """
+        Like run_search, but the results pages and job descriptions are fetched over HTTP. Seen,
+        blacklisted and unfit jobs are filtered out before the browser is involved, and only the
+        remaining jobs are opened in the browser to go through Easy Apply.
+        """
+        print("Discovering jobs for " + position + " in " + location + ".")
+
+        applications, pages = self.applications, 0
+        with self.metrics.phase('search', position=position, location=location, discovery='http') as search:
+            try:
+                for jobs in self.harvested_pages(position, location):
+                    print(f"Discovered {len(jobs)} jobs on results page {pages}")
+                    pages += 1
+                    self.apply_harvested_jobs(jobs, location)
             except:
                 traceback.print_exc()
                 pass
+            search['pages'] = pages
+            search['applications'] = self.applications - applications
 
-            time_left = minimum_page_time - time.time()
-            if time_left > 0:
-                print("Sleeping for " + str(time_left) + " seconds.")
-                time.sleep(time_left)
-                minimum_page_time = time.time() + minimum_time
-            if page_sleep % 5 == 0:
-                sleep_time = random.randint(500, 900)
-                print("Sleeping for " + str(sleep_time / 60) + " minutes.")
-                time.sleep(sleep_time)
-                page_sleep += 1
+        self.pacer.rest(self.waits, end_of_search=True)
 
-    def apply_jobs(self, location):
-        no_jobs_text = ""
-        try:
-            no_jobs_element = self.browser.find_element(By.CLASS_NAME, 'jobs-search-two-pane__no-results-banner--expand')
-            no_jobs_text = no_jobs_element.text
-        except:
-            pass
-        if 'No matching jobs found' in no_jobs_text:
-            raise Exception("No more jobs on this page.")
+    def harvested_pages(self, position, location):
+        """Yield the jobs of each results page of a search, fetched over HTTP and paced like browsed pages."""
+        harvester = self.get_harvester()
+        query = self.base_search_url + "&keywords=" + position + "&location=" + location
+        start, page = 0, 0
+        while True:
+            self.pacer.start_page(self.waits)
+            with self.metrics.phase('results_page', page=page, discovery='http'):
+                jobs, listed = harvester.search(query, start)
+            if not listed:
+                return
+            for job in jobs:
+                job['search_location'] = location
+            if jobs:
+                yield jobs
+            # Offsets and the last-page check go by the results listed, including any left out of jobs
+            start += listed
+            page += 1
+            if listed < harvester.page_size or start >= MAX_SEARCH_RESULTS:
+                print(f"Results page {page - 1} was the last page of results for this search, not fetching another.")
+                self.pages_avoided += 1
+                return
+            self.pacer.rest(self.waits)
 
-        if 'unfortunately, things are' in self.browser.page_source.lower():
-            raise Exception("No more jobs on this page.")
+    def get_harvester(self):
+        """Return the HTTP job harvester, creating it from the browser's session on first use."""
+        if self.harvester is None:
+            from discovery import JobHarvester  # requests is only needed for HTTP discovery
+            self.harvester = JobHarvester.from_browser(self.browser, self.base_url, self.discovery_connections)
+        return self.harvester
+
+    def iter_jobs(self, searches=None):
+        """
+        Lazily yield the jobs found by the searches (all shuffled position/location pairs by
+        default) as job card dicts with the search location added. Results pages are fetched over
+        HTTP one at a time, only when the consumer asks for more jobs; nothing is filtered.
+        """
+        if searches is None:
+            searches = list(product(self.positions, self.locations))
+            random.shuffle(searches)
+        for position, location in searches:
+            print("Discovering jobs for " + position + " in " + location + ".")
+            for jobs in self.harvested_pages(position, location):
+                yield from jobs
+            self.pacer.rest(self.waits, end_of_search=True)
+
+    def apply_harvested_jobs(self, jobs, location):
+        """Filter discovered jobs, fetch the postings of the rest and apply to the ones that still qualify."""
+        candidates = []
+        for job in jobs:
+            if job['job_id'] in self.job_store:
+                print(f"Job {job['job_id']} for {job['company']} skipped because it was already {self.job_store.status(job['job_id'])}.")
+                continue
+            reasons = self.blacklist_reasons(job)
+            if reasons:
+                print(f"Job for {job['company']} skipped because " + " and ".join(reasons) + ".")
+                continue
+            candidates.append(job)
+
+        with self.metrics.phase('job_postings', jobs=len(candidates)):
+            self.harvester.add_postings(candidates)
+
+        for job in candidates:
+            self.track_job(self.apply_harvested_job, job, location)
+        print(f"Processed all discovered jobs ({self.harvester.requests} HTTP requests so far).")
+
+    def apply_harvested_job(self, job, location):
+        """Check a discovered job's poster and fit, then open it in the browser and apply."""
+        job_id = job['job_id']
+        job_title = job['title']
+        link = job['link']
+        company = job['company']
+
+        # The poster is only known once the posting has been fetched
+        reasons = self.blacklist_reasons(job)
+        if reasons:
+            print(f"Job for {company} by {job['poster']} skipped because " + " and ".join(reasons) + ".")
+            return
+
+        if self.evaluate_job_fit:
+            fits = job.get('fits')
+            if fits is None:
+                fits = self.ai_response_generator.cached_job_fit(job_id)
+            if fits is None and job.get('description'):
+                with self.metrics.phase('job_fit', job_id=job_id) as fit:
+                    fits = self.ai_response_generator.evaluate_job_fit(job_title, job['description'], job_id)
+                    fit['outcome'] = 'apply' if fits else 'skip'
+            if fits is False:
+                print("Skipping application: Job requirements not aligned with candidate profile per AI evaluation.")
+                self.job_store.record(job_id, JobStore.SKIPPED, company, job_title, link)
+                self.write_to_file(company, job_title, link, job['location'], location, JobStore.SKIPPED)
+                return
+
+        if not self.job_store.claim(job_id):
+            print(f"Job {job_id} for {company} skipped because another worker is applying to it.")
+            return
+
+        with self.metrics.phase('details_pane', job_id=job_id, discovery='http') as details:
+            self.browser.get(link)
+            if not self.waits.until(self.waits.details_loaded(job_id), f"the page of job {job_id}"):
+                details['outcome'] = 'timeout'
+        self.waits.pause()
 
-        job_results_header = ""
-        maybe_jobs_crap = ""
+        # The posting could not be fetched over HTTP, so judge the fit from the page instead
+        if self.evaluate_job_fit and fits is None:
+            try:
+                job_description = self.browser.find_element(By.ID, 'job-details').text
+                with self.metrics.phase('job_fit', job_id=job_id) as fit:
+                    fits = self.ai_response_generator.evaluate_job_fit(job_title, job_description, job_id)
+                    fit['outcome'] = 'apply' if fits else 'skip'
+                if not fits:
+                    print("Skipping application: Job requirements not aligned with candidate profile per AI evaluation.")
+                    self.job_store.record(job_id, JobStore.SKIPPED, company, job_title, link)
+                    self.write_to_file(company, job_title, link, job['location'], location, JobStore.SKIPPED)
+                    return
+            except Exception:
+                print("Could not load job description")
+
+        self.pacer.application_slot(self.waits)
         try:
-            job_results_header = self.browser.find_element(By.CLASS_NAME, "jobs-search-results-list__text")
-            maybe_jobs_crap = job_results_header.text
-        except:
-            pass
+            done_applying = self.apply_to_job()
+        except Exception as apply_exc:
+            print(f"Failed during apply_to_job for {job_title} at {company}: {apply_exc}. Link: {link}")
+            traceback.print_exc()
+            done_applying = False
+
+        if done_applying:
+            print(f"Application sent to {company} for the position of {job_title}.")
+            self.job_store.record(job_id, JobStore.APPLIED, company, job_title, link)
+            self.applications += 1
+            self.write_to_file(company, job_title, link, job['location'], location)
+        else:
+            self.job_store.record(job_id, JobStore.FAILED, company, job_title, link)
+            self.write_to_file(company, job_title, link, job['location'], location, JobStore.FAILED)
+
+    def is_last_results_page(self, job_page, results):
+        """
+        Whether no page after job_page can hold results, judged by the result count in the results
+        header or, when the header shows none, by the page holding fewer cards than a full page.
+        """
+        if results['total'] is not None:
+            return (job_page + 1) * RESULTS_PAGE_SIZE >= min(results['total'], MAX_SEARCH_RESULTS)
+        return 0 < results['cards'] < RESULTS_PAGE_SIZE
+
+    def print_run_summary(self):
+        print(self.waits.summary())
+        if self.pages_avoided:
+            print(f"Pagination: {self.pages_avoided} empty results page loads or fetches avoided by stopping at the last page of results.")
+        print(self.metrics.summary())
+        self.metrics.write_prometheus()
+        ai = self.ai_response_generator
+        if ai.cache:
+            print(f"AI answer cache: {ai.cache.hits} hits, {ai.cache.misses} misses this run.")
+        if ai.ai_calls:
+            print(f"AI calls: {ai.ai_calls}, {ai.prompt_tokens} prompt tokens of which {ai.cached_tokens} were served from the provider's prompt cache.")
+        if self.command_profiler:
+            print(self.command_profiler.run_summary())
+            self.command_profiler.dump(self.command_profile_file)
+            print(f"Saved the WebDriver command profile to {self.command_profile_file}.")
+
+    def apply_jobs(self, location):
+        """Apply to the jobs on the current results page. Returns the page's result count (total) and number of cards."""
+        results_state = self.browser.execute_script(RESULTS_STATE_SCRIPT)
+        if results_state['no_results'] or results_state['unavailable']:
+            raise Exception("No more jobs on this page.")
 
-        if 'Jobs you may be interested in' in maybe_jobs_crap:
+        if results_state['suggestions_only']:
             raise Exception("Nothing to do here, moving forward...")
 
-        processed_jobs = 0
-        while True:
+        self.command_counter.reset_page()
+        with self.metrics.phase('card_extraction') as extraction:
+            job_cards = self.extract_job_cards()
+            extraction['cards'] = len(job_cards)
+        extraction_commands = self.command_counter.page
+        print(f"Found {len(job_cards)} jobs on this page")
+
+        for job_card in job_cards:
+            self.track_job(self.apply_job_card, job_card, location)
+
+        print("Processed all jobs on this page.")
+        print(f"WebDriver commands on this page: {self.command_counter.page} "
+              f"({extraction_commands} for extracting {len(job_cards)} job cards).")
+        return {'total': results_state['total'], 'cards': len(job_cards)}
+
+    def track_job(self, apply, job_card, location):
+        """Run apply(job_card, location) for one job, recording it as a 'job' phase and releasing its claim afterwards."""
+        if self.command_profiler:
+            self.command_profiler.start_job(job_card['job_id'] or job_card['title'])
+        applications = self.applications
+        try:
+            with self.metrics.phase('job', job_id=job_card['job_id'], company=job_card['company']) as job:
+                seen = job_card['job_id'] in self.job_store
+                apply(job_card, location)
+                if seen:
+                    job['outcome'] = 'seen'
+                elif self.applications > applications:
+                    job['outcome'] = JobStore.APPLIED
+                else:
+                    job['outcome'] = self.job_store.status(job_card['job_id']) or JobStore.SKIPPED
+        except Exception as e:
+            traceback.print_exc()
+            print(f"An unexpected error occurred: {e}")
+        finally:
+            self.job_store.release(job_card['job_id'])
+            self.question_catalog.finish_job(self.applications > applications)
+            if self.command_profiler:
+                print(self.command_profiler.end_job())
+
+    def extract_job_cards(self):
+        """
+        Extract every job card on the current results page as a list of dicts with the keys
+        job_id, title, link, company, poster, location, apply_method, badges and index.
+
+        Uses a single injected script unless cardExtraction is set to 'legacy' or the script
+        finds no cards, in which case the per-element WebDriver extraction is used instead.
+        """
+        job_cards = []
+        if self.card_extraction != 'legacy':
             try:
-                # Re-fetch job list dynamically
-                ul_element_class = self.get_job_list_class()  # Get the current UL class
-                WebDriverWait(self.browser, 10).until(
-                    EC.presence_of_element_located((By.CLASS_NAME, ul_element_class))
-                )
-                job_list = self.browser.find_elements(By.CLASS_NAME, ul_element_class)[0].find_elements(
-                    By.CLASS_NAME, 'scaffold-layout__list-item'
-                )
-                print(f"Found {len(job_list)} jobs on this page")
+                job_cards = self.browser.execute_async_script(JOB_CARDS_SCRIPT) or []
+            except Exception as e:
+                print(f"Warning: Script-based job card extraction failed: {e}")
+            if not job_cards:
+                print("Warning: Script-based job card extraction found no cards, falling back to legacy extraction.")
+        if not job_cards:
+            job_cards = self._extract_job_cards_legacy()
+
+        for job_card in job_cards:
+            job_card['job_id'] = parse_job_id(job_card.get('link')) or (int(job_card['job_id']) if job_card.get('job_id') else None)
+            job_card['title'] = job_card.get('title') or "UNKNOWN_TITLE"
+            job_card['link'] = job_card.get('link') or "UNKNOWN_LINK"
+            job_card['company'] = job_card.get('company') or "UNKNOWN_COMPANY"
+            if self.debug:
+                print(f"Job card: {job_card}")
+        return job_cards
 
-                if processed_jobs >= len(job_list):
-                    print("Processed all jobs on this page.")
-                    break
+    def _extract_job_cards_legacy(self):
+        """Extract job cards one WebDriver command at a time (several round trips per card)."""
+        job_cards = []
+        ul_element_class = self.get_job_list_class()  # Get the current UL class
+        WebDriverWait(self.browser, 10).until(
+            EC.presence_of_element_located((By.CLASS_NAME, ul_element_class))
+        )
+        job_list = self.browser.find_elements(By.CLASS_NAME, ul_element_class)[0].find_elements(
+            By.CLASS_NAME, 'scaffold-layout__list-item'
+        )
 
-                job_tile = job_list[processed_jobs]
-                print(job_tile)
+        for index, job_tile in enumerate(job_list):
+            job_title, company, poster, job_location, apply_method, link = "", "", "", "", "", ""
+            try:
+                # Find the container for the job card data first for stability
+                job_card_base = job_tile.find_element(By.CSS_SELECTOR, '.job-card-container, .job-card-list') # Try common container classes
 
-                # Extract job details
-                job_title, company, poster, job_location, apply_method, link = "", "", "", "", "", ""
                 try:
-                    # Find the container for the job card data first for stability
-                    job_card_base = job_tile.find_element(By.CSS_SELECTOR, '.job-card-container, .job-card-list') # Try common container classes
-                    
-                    try:
-                        job_title_element = job_card_base.find_element(By.CSS_SELECTOR, '.job-card-list__title, .job-card-container__title') # Try common title classes
-                        job_title = job_title_element.text.strip()
-                        link = job_title_element.get_attribute('href').split('?')[0]
-                        if not job_title:
-                             print(f"Warning: Extracted empty job title string for card. Link: {link}")
-                    except NoSuchElementException:
-                         print("Warning: Could not extract job title/link using standard selectors.")
-                         # Fallback: Try finding any link within the job tile
-                         try:
-                             link_element = job_tile.find_element(By.TAG_NAME, 'a')
-                             link = link_element.get_attribute('href').split('?')[0]
-                             job_title = link_element.text.strip() # Maybe title is in the link text
-                             print(f"Recovered link: {link}, Title: {job_title}")
-                             if not job_title:
-                                 job_title = "UNKNOWN_TITLE (Recovered Link Only)"
-                         except Exception as fallback_e:
-                            print(f"Could not recover link/title using fallback: {fallback_e}")
-                            link = "UNKNOWN_LINK"
-                            job_title = "UNKNOWN_TITLE"
-                    except Exception as title_link_e:
-                        print(f"Warning: Unexpected error extracting job title/link: {title_link_e}")
-                        link = link or "UNKNOWN_LINK"
-                        job_title = job_title or "UNKNOWN_TITLE"
-
+                    job_title_element = job_card_base.find_element(By.CSS_SELECTOR, '.job-card-list__title, .job-card-container__title') # Try common title classes
+                    job_title = job_title_element.text.strip()
+                    link = job_title_element.get_attribute('href').split('?')[0]
+                    if not job_title:
+                         print(f"Warning: Extracted empty job title string for card. Link: {link}")
                 except NoSuchElementException:
-                    print("Warning: Could not find base job card container. Skipping detail extraction.")
-                    # Assign defaults if base container not found
-                    link = "UNKNOWN_LINK"
-                    job_title = "UNKNOWN_TITLE"
-                    company = "UNKNOWN_COMPANY"
+                     print("Warning: Could not extract job title/link using standard selectors.")
+                     # Fallback: Try finding any link within the job tile
+                     try:
+                         link_element = job_tile.find_element(By.TAG_NAME, 'a')
+                         link = link_element.get_attribute('href').split('?')[0]
+                         job_title = link_element.text.strip() # Maybe title is in the link text
+                         print(f"Recovered link: {link}, Title: {job_title}")
+                         if not job_title:
+                             job_title = "UNKNOWN_TITLE (Recovered Link Only)"
+                     except Exception as fallback_e:
+                        print(f"Could not recover link/title using fallback: {fallback_e}")
+                except Exception as title_link_e:
+                    print(f"Warning: Unexpected error extracting job title/link: {title_link_e}")
 
-                try:
-                    # Use a more general selector that might catch different company name structures
-                    company_element = job_tile.find_element(By.CSS_SELECTOR, '[class*="job-card-container__primary-description"], [class*="job-card-container__company-name"], .artdeco-entity-lockup__subtitle')
-                    company = company_element.text.strip()
-                    if not company:
-                        print("Warning: Extracted empty company name string.")
-                        company = "UNKNOWN_COMPANY (Empty String)"
-                except NoSuchElementException:
-                     print("Warning: Could not extract company name using combined selector.")
-                     company = "UNKNOWN_COMPANY"
-                except Exception as company_e:
-                    print(f"Warning: Unexpected error extracting company name: {company_e}")
-                    company = "UNKNOWN_COMPANY"
+            except NoSuchElementException:
+                print("Warning: Could not find base job card container. Skipping detail extraction.")
 
-                # (Keep existing poster, location, apply_method extraction for now)
-                try:
-                    hiring_line = job_tile.find_element(By.XPATH, '//span[contains(.,\" is hiring for this\")]')
-                    hiring_line_text = hiring_line.text
-                    name_terminating_index = hiring_line_text.find(' is hiring for this')
-                    if name_terminating_index != -1:
-                        poster = hiring_line_text[:name_terminating_index]
-                except:
-                    pass
+            try:
+                # Use a more general selector that might catch different company name structures
+                company_element = job_tile.find_element(By.CSS_SELECTOR, '[class*="job-card-container__primary-description"], [class*="job-card-container__company-name"], .artdeco-entity-lockup__subtitle')
+                company = company_element.text.strip()
+                if not company:
+                    print("Warning: Extracted empty company name string.")
+                    company = "UNKNOWN_COMPANY (Empty String)"
+            except NoSuchElementException:
+                 print("Warning: Could not extract company name using combined selector.")
+            except Exception as company_e:
+                print(f"Warning: Unexpected error extracting company name: {company_e}")
 
-                try:
-                    job_location = job_tile.find_element(By.CLASS_NAME, 'job-card-container__metadata-item').text
-                except:
-                    pass
+            try:
+                hiring_line = job_tile.find_element(By.XPATH, './/span[contains(.,\" is hiring for this\")]')
+                hiring_line_text = hiring_line.text
+                name_terminating_index = hiring_line_text.find(' is hiring for this')
+                if name_terminating_index != -1:
+                    poster = hiring_line_text[:name_terminating_index]
+            except:
+                pass
+
+            try:
+                job_location = job_tile.find_element(By.CLASS_NAME, 'job-card-container__metadata-item').text
+            except:
+                pass
+
+            try:
+                apply_method = job_tile.find_element(By.CLASS_NAME, 'job-card-container__apply-method').text
+            except:
+                pass
+
+            job_cards.append({
+                'index': index,
+                'job_id': None,
+                'title': job_title,
+                'link': link,
+                'company': company,
+                'poster': poster,
+                'location': job_location,
+                'apply_method': apply_method,
+                'badges': [],
+            })
+        return job_cards
+
+    def click_job_card(self, job_card):
+        """Click a job card on the results page, locating it by job ID (or position) in a single lookup."""
+        job_id = job_card['job_id']
+        max_retries = 3
+        retries = 0
+        while retries < max_retries:
+            try:
+                if job_id is not None:
+                    job_el = self.browser.find_element(By.CSS_SELECTOR,
+                        f'li[data-occludable-job-id="{job_id}"] .job-card-job-posting-card-wrapper__card-link, '
+                        f'li[data-occludable-job-id="{job_id}"] a[href*="/jobs/view/"], '
+                        f'[data-job-id="{job_id}"] a[href*="/jobs/view/"]')
+                else:
+                    job_tile = self.browser.find_elements(By.CLASS_NAME, 'scaffold-layout__list-item')[job_card['index']]
+                    job_el = job_tile.find_element(By.CSS_SELECTOR, '.job-card-job-posting-card-wrapper__card-link, a')
+                job_el.click()
+                return True
+            except StaleElementReferenceException:
+                retries += 1
+                time.sleep(1)
+        print("Failed to click job after retries due to StaleElementReferenceException")
+        return False
+
+    def blacklist_reasons(self, job_card):
+        """Return why a job card is blacklisted (by title keyword, company or poster), or an empty list."""
+        return self.blacklist.reasons(job_card['title'], job_card['company'], job_card['poster'])
+
+    def apply_job_card(self, job_card, location):
+        """Run the blacklist checks, open the job details and apply to a single extracted job card."""
+        job_id = job_card['job_id']
+        job_title = job_card['title']
+        link = job_card['link']
+        company = job_card['company']
+        poster = job_card['poster']
+        job_location = job_card['location']
+
+        if job_id is not None and job_id in self.job_store:
+            print(f"Job {job_id} for {company} skipped because it was already {self.job_store.status(job_id)}.")
+            return
+
+        reasons = self.blacklist_reasons(job_card)
+        if reasons:
+            print(f"Job for {company} by {poster} skipped because " + " and ".join(reasons) + ".")
+            return
+
+        cached_fit = self.ai_response_generator.cached_job_fit(job_id) if self.evaluate_job_fit else None
+        if cached_fit is False:
+            print("Skipping application: Job requirements not aligned with candidate profile per cached AI evaluation.")
+            self.job_store.record(job_id, JobStore.SKIPPED, company, job_title, link)
+            self.write_to_file(company, job_title, link, job_location, location, JobStore.SKIPPED)
+            return
+
+        if not self.job_store.claim(job_id):
+            print(f"Job {job_id} for {company} skipped because another worker is applying to it.")
+            return
+
+        try:
+            with self.metrics.phase('details_pane', job_id=job_id) as details:
+                if not self.click_job_card(job_card):
+                    details['outcome'] = 'error'
+                    return
+
+                # Wait for the details pane to show this job, then a short human-like pause
+                if not self.waits.until(self.waits.details_loaded(job_id), f"the details pane of job {job_id}"):
+                    details['outcome'] = 'timeout'
+            self.waits.pause()
+
+            # --- Extract Canonical Job URL from Details Pane ---
+            canonical_job_url = link # Default to card link as fallback
+            try:
+                # Wait for the job title link in the details pane to be present
+                job_details_title_selector = (By.CSS_SELECTOR, ".job-details-jobs-unified-top-card__job-title h1 a")
+                WebDriverWait(self.browser, 10).until(
+                    EC.presence_of_element_located(job_details_title_selector)
+                )
+                title_link_element = self.browser.find_element(*job_details_title_selector)
+                extracted_href = title_link_element.get_attribute('href')
+                if extracted_href:
+                    # Construct absolute URL if href is relative
+                    if extracted_href.startswith('/'):
+                         canonical_job_url = self.base_url + extracted_href.split('?')[0]
+                    else:
+                         canonical_job_url = extracted_href.split('?')[0]
+                    print(f"DEBUG: Found canonical job URL: {canonical_job_url}")
+                else:
+                     print("Warning: Found title link element but href was empty. Falling back to card link.")
+            except TimeoutException:
+                print("Warning: Timed out waiting for job title link in details pane. Falling back to card link.")
+            except NoSuchElementException:
+                print("Warning: Could not find job title link in details pane using selector. Falling back to card link.")
+            except Exception as e_canon_url:
+                print(f"Warning: Error extracting canonical job URL: {e_canon_url}. Falling back to card link.")
+            # --- End Canonical URL Extraction ---
 
+            if self.evaluate_job_fit and cached_fit is None:
                 try:
-                    apply_method = job_tile.find_element(By.CLASS_NAME, 'job-card-container__apply-method').text
+                    job_description = self.browser.find_element(By.ID, 'job-details').text
+                    with self.metrics.phase('job_fit', job_id=job_id) as fit:
+                        fits = self.ai_response_generator.evaluate_job_fit(job_title, job_description, job_id)
+                        fit['outcome'] = 'apply' if fits else 'skip'
+                    if not fits:
+                        print("Skipping application: Job requirements not aligned with candidate profile per AI evaluation.")
+                        self.job_store.record(job_id, JobStore.SKIPPED, company, job_title, canonical_job_url)
+                        self.write_to_file(company, job_title, canonical_job_url, job_location, location, JobStore.SKIPPED)
+                        return
                 except:
-                    pass
-
-                contains_blacklisted_keywords = False
-                blacklisted_word_found = ""
-                job_title_parsed = job_title.lower().split(' ')
-                for word in self.title_blacklist:
-                    if word.lower() in job_title_parsed:
-                        contains_blacklisted_keywords = True
-                        blacklisted_word_found = word
-                        break
+                    print("Could not load job description")
+
+            try:
+                self.pacer.application_slot(self.waits)
+                done_applying = self.apply_to_job()
+                if done_applying:
+                    print(f"Application sent to {company} for the position of {job_title}.")
+                    self.job_store.record(job_id, JobStore.APPLIED, company, job_title, canonical_job_url)
+                    self.applications += 1
+                    # Get the current URL after successful application
+                    try:
+                        current_job_url = self.browser.current_url.split('?')[0]
+                    except Exception as e_url:
+                        print(f"Warning: Could not get current job URL: {e_url}")
+                        current_job_url = canonical_job_url # Fallback to the canonical URL if needed
 
-                if (company.lower() not in [word.lower() for word in self.company_blacklist] and
-                    poster.lower() not in [word.lower() for word in self.poster_blacklist] and
-                    contains_blacklisted_keywords is False):
+                    # Check for hiring team after successful application
                     try:
-                        max_retries = 3
-                        retries = 0
-                        while retries < max_retries:
-                            try:
-                                job_el = job_tile.find_element(By.CLASS_NAME, 'job-card-job-posting-card-wrapper__card-link')
-                                job_el.click()
-                                break
-                            except StaleElementReferenceException:
-                                retries += 1
-                                time.sleep(1)
-                                continue
-                        else:
-                            print("Failed to click job after retries due to StaleElementReferenceException")
-                            processed_jobs += 1
-                            continue
-
-                        time.sleep(random.uniform(3, 5)) # Wait for details pane to load
-
-                        # --- Extract Canonical Job URL from Details Pane ---
-                        canonical_job_url = link # Default to card link as fallback
-                        try:
-                            # Wait for the job title link in the details pane to be present
-                            job_details_title_selector = (By.CSS_SELECTOR, ".job-details-jobs-unified-top-card__job-title h1 a")
-                            WebDriverWait(self.browser, 10).until(
-                                EC.presence_of_element_located(job_details_title_selector)
-                            )
-                            title_link_element = self.browser.find_element(*job_details_title_selector)
-                            extracted_href = title_link_element.get_attribute('href')
-                            if extracted_href:
-                                # Construct absolute URL if href is relative
-                                if extracted_href.startswith('/'):
-                                     canonical_job_url = "https://www.linkedin.com" + extracted_href.split('?')[0]
+                        # Use normalize-space() for robust text matching
+                        hiring_team_header = self.browser.find_elements(By.XPATH, "//h2[normalize-space()='Meet the hiring team']")
+                        if hiring_team_header:
+                            print("Found 'Meet the hiring team' section.")
+                            recruiter_link_element = self.browser.find_element(By.CSS_SELECTOR, ".hirer-card__hirer-information a")
+                            recruiter_profile_url = recruiter_link_element.get_attribute('href')
+                            if recruiter_profile_url:
+                                # Use the canonical job URL extracted from the details pane
+                                print(f"DEBUG: Writing hiring team contact with: Company='{company}', Title='{job_title}', JobLink='{canonical_job_url}', Recruiter='{recruiter_profile_url}'")
+                                if not company or not job_title or not canonical_job_url or "UNKNOWN" in canonical_job_url or "UNKNOWN" in job_title or "UNKNOWN" in company:
+                                     print(f"Warning: Missing or unknown data (Company: {company}, Title: {job_title}, Link: {canonical_job_url}). Skipping hiring team write.")
                                 else:
-                                     canonical_job_url = extracted_href.split('?')[0]
-                                print(f"DEBUG: Found canonical job URL: {canonical_job_url}")
-                            else:
-                                 print("Warning: Found title link element but href was empty. Falling back to card link.")
-                        except TimeoutException:
-                            print("Warning: Timed out waiting for job title link in details pane. Falling back to card link.")
-                        except NoSuchElementException:
-                            print("Warning: Could not find job title link in details pane using selector. Falling back to card link.")
-                        except Exception as e_canon_url:
-                            print(f"Warning: Error extracting canonical job URL: {e_canon_url}. Falling back to card link.")
-                        # --- End Canonical URL Extraction ---
-
-                        if self.evaluate_job_fit:
-                            try:
-                                job_description = self.browser.find_element(By.ID, 'job-details').text
-                                if not self.ai_response_generator.evaluate_job_fit(job_title, job_description):
-                                    print("Skipping application: Job requirements not aligned with candidate profile per AI evaluation.")
-                                    processed_jobs += 1
-                                    continue
-                            except:
-                                print("Could not load job description")
-
-                        try:
-                            done_applying = self.apply_to_job()
-                            if done_applying:
-                                print(f"Application sent to {company} for the position of {job_title}.")
-                                # Get the current URL after successful application
-                                try:
-                                    current_job_url = self.browser.current_url.split('?')[0]
-                                except Exception as e_url:
-                                    print(f"Warning: Could not get current job URL: {e_url}")
-                                    current_job_url = canonical_job_url # Fallback to the canonical URL if needed
-
-                                # Check for hiring team after successful application
-                                try:
-                                    # Use normalize-space() for robust text matching
-                                    hiring_team_header = self.browser.find_elements(By.XPATH, "//h2[normalize-space()='Meet the hiring team']")
-                                    if hiring_team_header:
-                                        print("Found 'Meet the hiring team' section.")
-                                        recruiter_link_element = self.browser.find_element(By.CSS_SELECTOR, ".hirer-card__hirer-information a")
-                                        recruiter_profile_url = recruiter_link_element.get_attribute('href')
-                                        if recruiter_profile_url:
-                                            # Use the canonical job URL extracted from the details pane
-                                            print(f"DEBUG: Writing hiring team contact with: Company='{company}', Title='{job_title}', JobLink='{canonical_job_url}', Recruiter='{recruiter_profile_url}'")
-                                            if not company or not job_title or not canonical_job_url or "UNKNOWN" in canonical_job_url or "UNKNOWN" in job_title or "UNKNOWN" in company:
-                                                 print(f"Warning: Missing or unknown data (Company: {company}, Title: {job_title}, Link: {canonical_job_url}). Skipping hiring team write.")
-                                            else:
-                                                 self.write_hiring_team_contact(company, job_title, canonical_job_url, recruiter_profile_url)
-                                except NoSuchElementException:
-                                    print("Could not find recruiter link within 'Meet the hiring team' section.")
-                                except Exception as ht_e:
-                                    print(f"Error processing 'Meet the hiring team' section: {ht_e}")
-                            else:
-                                print(f"Could not apply or Easy Apply button not found for {company}.") # Updated else message
-                        except Exception as apply_exc:
-                            temp = self.file_name
-                            self.file_name = "failed"
-                            # Use the extracted link here for bug report
-                            print(f"Failed during apply_to_job for {job_title} at {company}: {apply_exc}. Link: {canonical_job_url}")
-                            traceback.print_exc() # Print stacktrace for apply_exc
-                            try:
-                                # Ensure company/title/link are usable before writing failure
-                                company_to_write = company if company and "UNKNOWN" not in company else "UNKNOWN_COMPANY"
-                                title_to_write = job_title if job_title and "UNKNOWN" not in job_title else "UNKNOWN_TITLE"
-                                # Use canonical_job_url for logging failures too
-                                link_to_write = canonical_job_url if canonical_job_url and "UNKNOWN" not in canonical_job_url else "UNKNOWN_LINK"
-                                self.write_to_file(company_to_write, title_to_write, link_to_write, job_location, location)
-                            except Exception as write_fail_e:
-                                print(f"Additionally failed to write failure log: {write_fail_e}")
-                            self.file_name = temp
-                            # print(f'Updated {temp}.csv.') # Already printed inside write_to_file usually
-
-                        # Log success to output.csv
-                        try:
-                             # Ensure company/title/link are usable before writing success
-                             company_to_write = company if company and "UNKNOWN" not in company else "UNKNOWN_COMPANY"
-                             title_to_write = job_title if job_title and "UNKNOWN" not in job_title else "UNKNOWN_TITLE"
-                             # Use canonical_job_url for logging success too
-                             link_to_write = canonical_job_url if canonical_job_url and "UNKNOWN" not in canonical_job_url else "UNKNOWN_LINK"
-                             self.write_to_file(company_to_write, title_to_write, link_to_write, job_location, location)
-                        except Exception as write_e:
-                            print(f"Unable to save the job information to {self.file_name}.csv for {title_to_write} at {company_to_write}. Link: {link_to_write}. Error: {write_e}")
-                            # traceback.print_exc() # Optional: De-clutter logs unless needed
-
-                        processed_jobs += 1
-
-                    except Exception as e:
-                        traceback.print_exc()
-                        print(f"Could not apply to the job in {company}: {e}")
-                        processed_jobs += 1
-                        continue
+                                     self.write_hiring_team_contact(company, job_title, canonical_job_url, recruiter_profile_url)
+                    except NoSuchElementException:
+                        print("Could not find recruiter link within 'Meet the hiring team' section.")
+                    except Exception as ht_e:
+                        print(f"Error processing 'Meet the hiring team' section: {ht_e}")
                 else:
-                    reasons = []
-                    if contains_blacklisted_keywords:
-                        reasons.append(f"job title contains blacklisted keyword '{blacklisted_word_found}'")
-                    if link in self.seen_jobs:
-                        reasons.append("job has already been seen")
-                    print(f"Job for {company} by {poster} skipped because " + " and ".join(reasons) + ".")
-                    processed_jobs += 1
+                    print(f"Could not apply or Easy Apply button not found for {company}.") # Updated else message
+                    self.job_store.record(job_id, JobStore.FAILED, company, job_title, canonical_job_url)
+            except Exception as apply_exc:
+                self.job_store.record(job_id, JobStore.FAILED, company, job_title, canonical_job_url)
+                done_applying = False
+                # Use the extracted link here for bug report
+                print(f"Failed during apply_to_job for {job_title} at {company}: {apply_exc}. Link: {canonical_job_url}")
+                traceback.print_exc() # Print stacktrace for apply_exc
+
+            # Log the application and its outcome to the ledger
+            # Ensure company/title/link are usable before writing
+            company_to_write = company if company and "UNKNOWN" not in company else "UNKNOWN_COMPANY"
+            title_to_write = job_title if job_title and "UNKNOWN" not in job_title else "UNKNOWN_TITLE"
+            # Use canonical_job_url for logging
+            link_to_write = canonical_job_url if canonical_job_url and "UNKNOWN" not in canonical_job_url else "UNKNOWN_LINK"
+            self.write_to_file(company_to_write, title_to_write, link_to_write, job_location, location,
+                               JobStore.APPLIED if done_applying else JobStore.FAILED)
 
-                self.seen_jobs.append(link)
-
-            except Exception as e:
-                print(f"An unexpected error occurred: {e}")
-                break
+        except Exception as e:
+            traceback.print_exc()
+            print(f"Could not apply to the job in {company}: {e}")
     
     def get_job_list_class(self):
         """Helper method to fetch the UL element class dynamically."""
@@ -674,8 +1307,7 @@ class LinkedinEasyApply:
         try:
             job_description_area = self.browser.find_element(By.ID, "job-details")
             print (f"{job_description_area}")
-            self.scroll_slow(job_description_area, end=1600)
-            self.scroll_slow(job_description_area, end=1600, step=400, reverse=True)
+            self.waits.scroll(job_description_area, distance=1600)
         except:
             pass
 
@@ -685,85 +1317,78 @@ class LinkedinEasyApply:
         button_text = ""
         submit_application_text = 'submit application'
         while submit_application_text not in button_text.lower():
+            step_started = time.time()
+            phase, step = 'modal_step', ''
             try:
                 self.fill_up()
                 next_button = self.browser.find_element(By.CLASS_NAME, "artdeco-button--primary")
                 button_text = next_button.text.lower()
                 if submit_application_text in button_text:
+                    phase = 'submit'
                     try:
                         self.unfollow()
                     except:
                         print("Failed to unfollow company.")
-                time.sleep(random.uniform(1.5, 2.5))
+                step_signature = self.waits.modal_state()['signature']
+                step = step_signature.split('|')[0]
+                self.waits.pause()
                 next_button.click()
-                time.sleep(random.uniform(3.0, 5.0))
-
-                # Newer error handling
-                error_messages = [
-                    'enter a valid',
-                    'enter a decimal',
-                    'Enter a whole number'
-                    'Enter a whole number between 0 and 99',
-                    'file is required',
-                    'whole number',
-                    'make a selection',
-                    'select checkbox to proceed',
-                    'saisissez un numéro',
-                    '请输入whole编号',
-                    '请输入decimal编号',
-                    '长度超过 0.0',
-                    'Numéro de téléphone',
-                    'Introduce un número de whole entre',
-                    'Inserisci un numero whole compreso',
-                    'Preguntas adicionales',
-                    'Insira um um número',
-                    'Cuántos años'
-                    'use the format',
-                    'A file is required',
-                    '请选择',
-                    '请 选 择',
-                    'Inserisci',
-                    'wholenummer',
-                    'Wpisz liczb',
-                    'zakresu od',
-                    'tussen'
-                ]
-
-                if any(error in self.browser.page_source.lower() for error in error_messages):
+                self.waits.until(self.waits.modal_changed(step_signature), "the next Easy Apply step")
+
+                form_errors = self.form_errors()
+                if form_errors:
+                    for error in form_errors:
+                        print(f"Validation error on '{error['field'] or error['id'] or 'unknown field'}': {error['message']}")
                     raise Exception("Failed answering required questions or uploading required files.")
+                self.metrics.record(phase, time.time() - step_started, step=step)
             except:
+                self.metrics.record(phase, time.time() - step_started, outcome='error', step=step)
                 traceback.print_exc()
                 self.browser.find_element(By.CLASS_NAME, 'artdeco-modal__dismiss').click()
-                time.sleep(random.uniform(3, 5))
+                self.waits.until(lambda driver: driver.find_elements(By.CLASS_NAME, 'artdeco-modal__confirm-dialog-btn'),
+                                 "the discard confirmation dialog")
+                self.waits.pause()
                 self.browser.find_elements(By.CLASS_NAME, 'artdeco-modal__confirm-dialog-btn')[0].click()
-                time.sleep(random.uniform(3, 5))
+                self.waits.until(self.waits.modal_closed(), "the Easy Apply modal to close")
                 raise Exception("Failed to apply to job!")
 
         closed_notification = False
-        time.sleep(random.uniform(3, 5))
-        try:
-            self.browser.find_element(By.CLASS_NAME, 'artdeco-modal__dismiss').click()
-            closed_notification = True
-        except:
-            pass
-        try:
-            self.browser.find_element(By.CLASS_NAME, 'artdeco-toast-item__dismiss').click()
-            closed_notification = True
-        except:
-            pass
-        try:
-            self.browser.find_element(By.CSS_SELECTOR, 'button[data-control-name="save_application_btn"]').click()
-            closed_notification = True
-        except:
-            pass
+        with self.metrics.phase('confirmation') as confirmation:
+            self.waits.until(self.waits.confirmation_shown(), "the application confirmation")
+            self.waits.pause()
+            try:
+                self.browser.find_element(By.CLASS_NAME, 'artdeco-modal__dismiss').click()
+                closed_notification = True
+            except:
+                pass
+            try:
+                self.browser.find_element(By.CLASS_NAME, 'artdeco-toast-item__dismiss').click()
+                closed_notification = True
+            except:
+                pass
+            try:
+                self.browser.find_element(By.CSS_SELECTOR, 'button[data-control-name="save_application_btn"]').click()
+                closed_notification = True
+            except:
+                pass
+            confirmation['outcome'] = 'ok' if closed_notification else 'error'
 
-        time.sleep(random.uniform(3, 5))
+        self.waits.pause()
 
         if closed_notification is False:
             raise Exception("Could not close the applied confirmation window!")
 
         return True
 
+    def form_errors(self):
+        """
+        Return the validation errors shown in the Easy Apply modal as dicts with message, field
+        (label text) and id (input id). Inline field errors always count; other alerts only when
+        they match one of the known validation messages.
+        """
+        return [error for error in self.browser.execute_script(FORM_ERRORS_SCRIPT)
+                if error['inline'] or VALIDATION_ERROR_PATTERN.search(error['message'].lower())]
+
     def home_address(self, form):
         print("Trying to fill up home address fields")
         # pdb.set_trace()  # Pause execution here for debugging
@@ -777,8 +1402,10 @@ class LinkedinEasyApply:
                     if 'street' in lb:
                         self.enter_text(input_field, self.personal_info['Street address'])
                     elif 'city' in lb:
-                        self.enter_text(input_field, self.personal_info['City'])
-                        time.sleep(3)
+                        # The city typeahead only offers suggestions for typed text
+                        self.enter_text(input_field, self.personal_info['City'], typed=True)
+                        self.waits.until(lambda driver: driver.find_elements(By.CSS_SELECTOR, '.basic-typeahead__selectable, [role="listbox"] [role="option"]'),
+                                         "city suggestions", timeout=5)
                         input_field.send_keys(Keys.DOWN)
                         input_field.send_keys(Keys.RETURN)
                     elif 'zip' in lb or 'zip / postal code' in lb or 'postal' in lb:
@@ -799,7 +1426,7 @@ class LinkedinEasyApply:
     def additional_questions(self, form):
         print("Trying to fill up additional questions")
 
-        questions = form.find_elements(By.CLASS_NAME, 'fb-dash-form-element')
+        questions = self.question_descriptors(form)
         if not questions:
             print("No additional questions found in form")
             return
@@ -814,7 +1441,7 @@ class LinkedinEasyApply:
         }
 
         for question in questions:
-            question_type, question_element = self._identify_question_type(question)
+            question_type = question['type']
             if question_type is None:
                 if self.debug:
                     print(f"Debug: Could not identify question type for element")
@@ -823,7 +1450,7 @@ class LinkedinEasyApply:
             try:
                 handler = question_handlers.get(question_type)
                 if handler:
-                    handler(question_element)
+                    handler(question)
                 else:
                     if self.debug:
                         print(f"Debug: No handler defined for question type: {question_type}")
@@ -831,34 +1458,26 @@ class LinkedinEasyApply:
                 if self.debug:
                     print(f"Error processing {question_type} question: {str(e)}")
 
-    def _identify_question_type(self, question):
-        """Identify the type of question based on its structure."""
+    def question_descriptors(self, form):
+        """
+        Describe every question of the form in a single script call (see QUESTIONS_SCRIPT), so the
+        handlers decide on plain data and only touch the DOM to enter their answers.
+        """
         try:
-            if question.find_elements(By.TAG_NAME, 'fieldset'):
-                return 'radio', question
-            if question.find_elements(By.TAG_NAME, 'input') or question.find_elements(By.TAG_NAME, 'textarea'):
-                return 'text', question
-            if question.find_elements(By.CLASS_NAME, 'artdeco-datepicker__input'):
-                return 'date', question
-            if question.find_elements(By.TAG_NAME, 'select'):
-                return 'dropdown', question
-            if question.find_elements(By.XPATH, ".//label[input[@type='checkbox']]"):
-                return 'checkbox', question
-        except:
-            pass
-        return None, None
+            return self.browser.execute_script(QUESTIONS_SCRIPT, form) or []
+        except Exception as e:
+            print(f"Could not read the questions of the form: {str(e)}")
+            return []
 
     def _handle_radio_question(self, question):
         """Handle radio button questions."""
         try:
-            radio_fieldset = question.find_element(By.TAG_NAME, 'fieldset')
-            question_span = radio_fieldset.find_element(By.CLASS_NAME, 'fb-dash-form-element__label').find_elements(By.TAG_NAME, 'span')[0]
-            radio_text = question_span.text.lower()
+            radio_text = question['label'].lower()
             if self.debug:
                 print(f"Radio question text: {radio_text}")
 
-            radio_labels = radio_fieldset.find_elements(By.TAG_NAME, 'label')
-            radio_options = [(i, text.text.lower()) for i, text in enumerate(radio_labels)]
+            radio_labels = question['choices']
+            radio_options = [(i, text.lower()) for i, text in enumerate(question['options'])]
             if self.debug:
                 print(f"Radio options: {[opt[1] for opt in radio_options]}")
 
@@ -868,9 +1487,9 @@ class LinkedinEasyApply:
             answer = self._get_radio_answer(radio_text, radio_options)
             to_select = None
             if answer:
-                for i, radio in enumerate(radio_labels):
-                    if answer in radio.text.lower():
-                        to_select = radio_labels[i]
+                for i, option in radio_options:
+                    if answer in option:
+                        to_select = i
                         break
                 if to_select is None and self.debug:
                     print(f"Debug: Answer '{answer}' not found in radio options")
@@ -878,15 +1497,16 @@ class LinkedinEasyApply:
             if to_select is None:
                 if self.debug:
                     print(f"Debug: No predefined answer for radio question: {radio_text}")
-                self.record_unprepared_question("radio", radio_text)
+                question_key = self.record_unprepared_question("radio", radio_text, [option[1] for option in radio_options])
                 ai_response = self.ai_response_generator.generate_response(
                     radio_text, response_type="choice", options=radio_options
                 )
-                to_select = radio_labels[ai_response] if ai_response is not None else radio_labels[-1]
+                to_select = ai_response if ai_response is not None else len(radio_labels) - 1
+                self.question_catalog.answered(question_key, radio_options[to_select][1], 'ai' if ai_response is not None else 'fallback')
 
             if self.debug:
-                print(f"Selecting radio option: {to_select.text}")
-            to_select.click()
+                print(f"Selecting radio option: {question['options'][to_select]}")
+            self.click_label(radio_labels[to_select])
         except Exception as e:
             if self.debug:
                 print(f"Error in radio question handling: {str(e)}")
@@ -894,85 +1514,41 @@ class LinkedinEasyApply:
 
     def _get_radio_answer(self, radio_text, radio_options):
         """Determine the answer for a radio question."""
-        if 'driver\'s licence' in radio_text or 'driver\'s license' in radio_text:
-            return self.get_answer('driversLicence')
-        elif any(keyword in radio_text.lower() for keyword in [
-            'aboriginal', 'native', 'indigenous', 'tribe', 'first nations',
-            'native american', 'native hawaiian', 'inuit', 'metis', 'maori',
-            'aborigine', 'ancestral', 'native peoples', 'original people',
-            'first people', 'gender', 'race', 'disability', 'latino', 'torres',
-            'do you identify'
-        ]):
-            negative_keywords = ['prefer', 'decline', 'don\'t', 'specified', 'none', 'no']
-            for option in radio_options:
-                if any(neg_keyword in option[1].lower() for neg_keyword in negative_keywords):
-                    return option[1]
-        elif 'assessment' in radio_text:
-            return self.get_answer("assessment")
-        elif 'clearance' in radio_text:
-            return self.get_answer("securityClearance")
-        elif 'north korea' in radio_text:
-            return 'no'
-        elif 'previously employ' in radio_text or 'previous employ' in radio_text:
-            return 'no'
-        elif any(keyword in radio_text.lower() for keyword in [
-            'certified', 'certificate', 'cpa', 'chartered accountant', 'qualification'
-        ]):
-            return self.get_answer('certifiedProfessional')
-        elif 'urgent' in radio_text:
-            return self.get_answer('urgentFill')
-        elif 'commut' in radio_text or 'on-site' in radio_text or 'hybrid' in radio_text or 'onsite' in radio_text:
-            return self.get_answer('commute')
-        elif 'remote' in radio_text:
-            return self.get_answer('remote')
-        elif 'background check' in radio_text:
-            return self.get_answer('backgroundCheck')
-        elif 'drug test' in radio_text:
-            return self.get_answer('drugTest')
-        elif 'level of education' in radio_text:
-            for degree in self.checkboxes['degreeCompleted']:
-                if degree.lower() in radio_text:
-                    return "yes"
-        elif 'data retention' in radio_text:
-            return 'no'
-        return None
+        return self.question_rules.answer(radio_text, 'radio', [option[1] for option in radio_options])
 
     def _handle_text_question(self, question):
         """Handle text or numeric input questions."""
         try:
-            question_text = question.find_element(By.TAG_NAME, 'label').text.lower()
+            question_text = question['label'].lower()
             if self.debug:
                 print(f"Text question text: {question_text}")
 
-            try:
-                txt_field = question.find_element(By.TAG_NAME, 'input')
-            except:
-                txt_field = question.find_element(By.TAG_NAME, 'textarea')
-
             # Check if field is pre-populated
-            current_value = txt_field.get_attribute('value').strip()
+            current_value = question['value'].strip()
             if current_value:
                 if self.debug:
                     print(f"Field pre-populated with: {current_value}. Skipping.")
                 return
 
-            text_field_type = 'numeric' if 'numeric' in txt_field.get_attribute('id').lower() else 'text'
+            text_field_type = 'numeric' if 'numeric' in question['id'].lower() else 'text'
             to_enter = self._get_text_answer(question_text, text_field_type)
 
             if to_enter is None:
                 if self.debug:
                     print(f"Debug: No predefined answer for text question: {question_text}")
-                self.record_unprepared_question(text_field_type, question_text)
+                question_key = self.record_unprepared_question(text_field_type, question_text)
                 response_type = "numeric" if text_field_type == 'numeric' else "text"
                 print(f"Requesting AI {response_type} response for: {question_text}")
                 to_enter = self.ai_response_generator.generate_response(
                     question_text, response_type=response_type
                 )
+                source = 'ai' if to_enter is not None else 'fallback'
                 to_enter = to_enter if to_enter is not None else (0 if text_field_type == 'numeric' else " ‏‏‎ ")
+                self.question_catalog.answered(question_key, to_enter, source)
 
             if self.debug:
                 print(f"Entering text: {to_enter}")
-            self.enter_text(txt_field, str(to_enter))
+            self.enter_text(question['field'], str(to_enter))
         except Exception as e:
             if self.debug:
                 print(f"Error in text question handling: {str(e)}")
@@ -980,41 +1556,17 @@ class LinkedinEasyApply:
 
     def _get_text_answer(self, question_text, text_field_type):
         """Determine the answer for a text or numeric question."""
-        if 'grade point average' in question_text:
-            return self.university_gpa
-        elif 'first name' in question_text and 'last name' not in question_text:
-            return self.personal_info['First Name']
-        elif 'last name' in question_text and 'first name' not in question_text:
-            return self.personal_info['Last Name']
-        elif 'location' in question_text:
-            return 'Houston, Texas, United States'
-        elif 'name' in question_text:
-            return self.personal_info['First Name'] + " " + self.personal_info['Last Name']
-        elif 'pronouns' in question_text:
-            return self.personal_info['Pronouns']
-        elif 'phone' in question_text:
-            return self.personal_info['Mobile Phone Number']
-        elif 'linkedin' in question_text:
-            return self.personal_info['Linkedin']
-        elif 'message to hiring' in question_text or 'cover letter' in question_text:
-            return self.personal_info['MessageToManager']
-        elif 'website' in question_text or 'github' in question_text or 'portfolio' in question_text:
-            return self.personal_info['Website']
-        elif 'notice' in question_text or 'weeks' in question_text:
-            return int(self.notice_period) if text_field_type == 'numeric' else str(self.notice_period)
-        elif 'salary' in question_text or 'expectation' in question_text or 'compensation' in question_text or 'CTC' in question_text:
-            return int(self.salary_minimum) if text_field_type == 'numeric' else float(self.salary_minimum)
-        return None
+        return self.question_rules.answer(question_text, text_field_type)
 
     def _handle_date_question(self, question):
         """Handle date picker questions."""
         try:
-            date_picker = question.find_element(By.CLASS_NAME, 'artdeco-datepicker__input')
+            date_picker = question['field']
             date_picker.clear()
             date_picker.send_keys(date.today().strftime("%m/%d/%y"))
-            time.sleep(3)
+            self.waits.pause()
             date_picker.send_keys(Keys.RETURN)
-            time.sleep(2)
+            self.waits.pause()
             if self.debug:
                 print("Filled date picker with today's date")
         except Exception as e:
@@ -1025,13 +1577,11 @@ class LinkedinEasyApply:
     def _handle_dropdown_question(self, question):
         """Handle dropdown questions."""
         try:
-            question_text = question.find_element(By.TAG_NAME, 'label').text.lower()
-            dropdown_field = question.find_element(By.TAG_NAME, 'select')
+            question_text = question['label'].lower()
             if self.debug:
                 print(f"Dropdown question text: {question_text}")
 
-            select = Select(dropdown_field)
-            options = [option.text for option in select.options]
+            options = question['options']
             if self.debug:
                 print(f"Dropdown options: {options}")
 
@@ -1039,16 +1589,17 @@ class LinkedinEasyApply:
             if choice is None:
                 if self.debug:
                     print(f"Debug: No predefined answer for dropdown question: {question_text}")
-                self.record_unprepared_question("dropdown", question_text)
+                question_key = self.record_unprepared_question("dropdown", question_text, options)
                 choices = [(i, option) for i, option in enumerate(options)]
                 ai_response = self.ai_response_generator.generate_response(
                     question_text, response_type="choice", options=choices
                 )
                 choice = options[ai_response] if ai_response is not None else options[-1]
+                self.question_catalog.answered(question_key, choice, 'ai' if ai_response is not None else 'fallback')
 
             if self.debug:
                 print(f"Selecting dropdown option: {choice}")
-            self.select_dropdown(dropdown_field, choice)
+            self.select_dropdown(question['field'], choice)
         except Exception as e:
             if self.debug:
                 print(f"Error in dropdown question handling: {str(e)}")
@@ -1056,45 +1607,18 @@ class LinkedinEasyApply:
 
     def _get_dropdown_answer(self, question_text, options):
         """Determine the answer for a dropdown question."""
-        if 'proficiency' in question_text:
-            for language in self.languages:
-                if language.lower() in question_text:
-                    return self.languages[language]
-        elif 'clearance' in question_text or 'assessment' in question_text or 'commut' in question_text or 'on-site' in question_text or 'hybrid' in question_text or 'onsite' in question_text:
-            answer = self.get_answer('securityClearance' if 'clearance' in question_text else 'assessment' if 'assessment' in question_text else 'commute')
-            for option in options:
-                if answer.lower() in option.lower():
-                    return option
-        elif 'country code' in question_text:
-            return self.personal_info['Phone Country Code']
-        elif 'north korea' in question_text or 'previously employed' in question_text or 'previous employment' in question_text:
-            for option in options:
-                if 'no' in option.lower():
-                    return option
-        elif 'above 18' in question_text:
-            for option in options:
-                if 'yes' in option.lower():
-                    return option
-            return options[0]
-        elif any(keyword in question_text.lower() for keyword in [
-            'aboriginal', 'native', 'indigenous', 'tribe', 'first nations',
-            'native american', 'native hawaiian', 'inuit', 'metis', 'maori',
-            'aborigine', 'ancestral', 'native peoples', 'original people',
-            'first people', 'gender', 'race', 'disability', 'latino'
-        ]):
-            negative_keywords = ['prefer', 'decline', 'don\'t', 'specified', 'none']
-            for option in options:
-                if any(neg_keyword in option.lower() for neg_keyword in negative_keywords):
-                    return option
-        return None
+        return self.question_rules.answer(question_text, 'dropdown', options)
 
     def _handle_checkbox_question(self, question):
         """Handle checkbox questions (e.g., terms and service)."""
         try:
-            clickable_checkbox = question.find_element(By.TAG_NAME, 'label')
+            if question['value']:
+                if self.debug:
+                    print(f"Checkbox already checked: {question['label']}")
+                return
             if self.debug:
-                print(f"Clicking checkbox: {clickable_checkbox.text}")
-            clickable_checkbox.click()
+                print(f"Clicking checkbox: {question['label']}")
+            self.click_label(question['choices'][0])
         except Exception as e:
             if self.debug:
                 print(f"Error in checkbox question handling: {str(e)}")
@@ -1130,14 +1654,55 @@ class LinkedinEasyApply:
             print("Failed to upload resume or cover letter!")
             pass
 
-    def enter_text(self, element, text):
+    def enter_text(self, element, text, typed=False):
+        if self._pending_fills is not None and not typed:
+            self._pending_fills.append((element, 'text', text))
+            return
         element.clear()
         element.send_keys(text)
 
     def select_dropdown(self, element, text):
+        if self._pending_fills is not None:
+            self._pending_fills.append((element, 'select', text))
+            return
         select = Select(element)
         select.select_by_visible_text(text)
 
+    def click_label(self, label):
+        if self._pending_fills is not None:
+            self._pending_fills.append((label, 'click', label.text))
+            return
+        label.click()
+
+    def apply_fills(self):
+        """
+        Apply the answers queued by enter_text, select_dropdown and click_label during a form step
+        in a single script call, then redo each field whose value did not stick (widgets that
+        ignore values set from a script) the typed way.
+        """
+        fills, self._pending_fills = self._pending_fills, None
+        if not fills:
+            return
+        try:
+            filled = self.browser.execute_script(FILL_FIELDS_SCRIPT, [[element, kind, value] for element, kind, value in fills])
+        except Exception as e:
+            print(f"Could not fill the form step in one script call, typing instead: {str(e)}")
+            filled = [False] * len(fills)
+        for (element, kind, value), ok in zip(fills, filled):
+            if ok:
+                continue
+            if self.debug:
+                print(f"Debug: {kind} field rejected '{value}' set by script, filling it the typed way")
+            try:
+                if kind == 'text':
+                    self.enter_text(element, value)
+                elif kind == 'select':
+                    self.select_dropdown(element, value)
+                else:
+                    element.click()
+            except Exception as e:
+                print(f"Could not fill field with '{value}': {str(e)}")
+
     # Radio Select
     def radio_select(self, element, label_text, clickLast=False):
         label = element.find_element(By.TAG_NAME, 'label')
@@ -1191,77 +1756,55 @@ class LinkedinEasyApply:
             form = easy_apply_modal_content.find_element(By.TAG_NAME, 'form')
             try:
                 label = form.find_element(By.TAG_NAME, 'h3').text.lower()
-                if 'home address' in label:
-                    self.home_address(form)
-                elif 'contact info' in label:
-                    self.contact_info(form)
-                elif 'resume' in label:
-                    self.send_resume()
-                else:
-                    self.additional_questions(form)
+                # With formFill 'script' the answers of this step are only queued here and applied together below
+                self._pending_fills = [] if self.form_fill == 'script' else None
+                try:
+                    if 'home address' in label:
+                        self.home_address(form)
+                    elif 'contact info' in label:
+                        self.contact_info(form)
+                    elif 'resume' in label:
+                        self.send_resume()
+                    else:
+                        self.additional_questions(form)
+                finally:
+                    self.apply_fills()
             except Exception as e:
                 print("An exception occurred while filling up the form:")
                 print(e)
         except:
             print("An exception occurred while searching for form in modal")
 
-    def write_to_file(self, company, job_title, link, location, search_location):
-        to_write = [company, job_title, link, location, search_location, datetime.now()]
-        file_path = self.file_name + ".csv"
-        print(f'updated {file_path}.')
-
-        with open(file_path, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(to_write)
+    def write_to_file(self, company, job_title, link, location, search_location, status=JobStore.APPLIED):
+        """Record an application and its outcome (applied, failed or skipped) in the ledger."""
+        self.ledger.application(status, company, job_title, link, location, search_location)
+        print(f'Recorded {status} application to {company} in the ledger.')
 
-    def record_unprepared_question(self, answer_type, question_text):
-        to_write = [answer_type, question_text]
-        file_path = self.unprepared_questions_file_name + ".csv"
-
-        try:
-            with open(file_path, 'a') as f:
-                writer = csv.writer(f)
-                writer.writerow(to_write)
-                print(f'Updated {file_path} with {to_write}.')
-        except:
-            print(
-                "Special characters in questions are not allowed. Failed to update unprepared questions log.")
-            print(question_text)
+    def record_unprepared_question(self, answer_type, question_text, options=None):
+        """Count a question no rule answered in the question catalog and return its fingerprint."""
+        print(f'Recorded unprepared question {[answer_type, question_text]}.')
+        return self.question_catalog.record(question_text, answer_type, options)
 
     def write_hiring_team_contact(self, company, job_title, job_link, recruiter_profile_link):
-        """Writes recruiter contact info found on job page."""
-        to_write = [company, job_title, job_link, recruiter_profile_link, datetime.now()]
-        file_path = self.hiring_team_file_name + ".csv"
-        print(f'Saving hiring team contact to {file_path}.')
-
-        # Ensure the directory exists
-        os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
-
-        # Check if file exists to write header
-        file_exists = os.path.isfile(file_path)
-
-        try:
-            with open(file_path, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                if not file_exists:
-                    writer.writerow(['Company', 'Job Title', 'Job Link', 'Recruiter Profile Link', 'Timestamp']) # Write header if new file
-                writer.writerow(to_write)
-        except Exception as e:
-            print(f"Failed to write hiring team contact to {file_path}: {e}")
-
-    def scroll_slow(self, scrollable_element, start=0, end=3600, step=100, reverse=False):
-        if reverse:
-            start, end = end, start
-            step = -step
-
-        for i in range(start, end, step):
-            self.browser.execute_script("arguments[0].scrollTo(0, {})".format(i), scrollable_element)
-            time.sleep(random.uniform(0.1, .6))
+        """Records recruiter contact info found on job page."""
+        print('Saving hiring team contact to the ledger.')
+        self.ledger.contact(company, job_title, job_link, recruiter_profile_link)
 
     def avoid_lock(self):
         if self.disable_lock:
             return
 
+        if self.headless:
+            # No display to keep awake: mark the page's user as active and send the Escape key
+            # through the DevTools protocol instead of the OS keyboard
+            self.browser.execute_cdp_cmd('Emulation.setIdleOverride', {'isUserActive': True, 'isScreenUnlocked': True})
+            for event in ('keyDown', 'keyUp'):
+                self.browser.execute_cdp_cmd('Input.dispatchKeyEvent', {
+                    'type': event, 'key': 'Escape', 'code': 'Escape', 'windowsVirtualKeyCode': 27})
+            return
+
+        # Imported here because pyautogui needs a display as soon as it is imported
+        import pyautogui
         pyautogui.keyDown('ctrl')
         pyautogui.press('esc')
         pyautogui.keyUp('ctrl')
@@ -1318,10 +1861,15 @@ class LinkedinEasyApply:
 
         return extra_search_terms_str
 
+    def open_results_page(self, position, location, job_page):
+        """Go to a page of search results and wait for the job list to show."""
+        self.next_job_page(position, location, job_page)
+        return self.waits.until(self.waits.results_loaded(), "the search results to load")
+
     def next_job_page(self, position, location, job_page):
         # Restore original dynamic URL construction
-        self.browser.get("https://www.linkedin.com/jobs/search/" + self.base_search_url +
-                         "&keywords=" + position + location + "&start=" + str(job_page * 25))
+        self.browser.get(self.base_url + "/jobs/search/" + self.base_search_url +
+                         "&keywords=" + position + location + "&start=" + str(job_page * RESULTS_PAGE_SIZE))
 
         # Remove hardcoded URL logic
         # hardcoded_url = "https://www.linkedin.com/jobs/view/4201303600/?alternateChannel=search&refId=NotAvailable&trackingId=hope%2BbQ1RxG0tPtF4xby9A%3D%3D&trk=d_flagship3_search_srp_jobs"
@@ -1345,6 +1893,7 @@ class LinkedinEasyApply:
         """Handles applying to a single job when navigated directly to its page."""
         print(f"Attempting to apply to single job at: {job_url}")
         job_title, company, job_location = "", "", ""
+        job_id = parse_job_id(job_url)
         try:
             # Extract job details from the single job view page
             try:
@@ -1378,17 +1927,24 @@ class LinkedinEasyApply:
 
 
             # --- Optional: AI Job Fit Evaluation ---
-            if self.evaluate_job_fit:
+            cached_fit = self.ai_response_generator.cached_job_fit(job_id) if self.evaluate_job_fit else None
+            if cached_fit is False:
+                print("Skipping application: Job requirements not aligned with candidate profile per cached AI evaluation.")
+                self.job_store.record(job_id, JobStore.SKIPPED, company, job_title, job_url)
+                self.write_to_file(company, job_title, job_url, job_location, "SingleJobSkip", JobStore.SKIPPED)
+                return False
+            if self.evaluate_job_fit and cached_fit is None:
                 try:
                     # Ensure job details element exists before accessing text
                     WebDriverWait(self.browser, 10).until(
                         EC.presence_of_element_located((By.ID, 'job-details'))
                     )
                     job_description = self.browser.find_element(By.ID, 'job-details').text
-                    if not self.ai_response_generator.evaluate_job_fit(job_title, job_description):
+                    if not self.ai_response_generator.evaluate_job_fit(job_title, job_description, job_id):
                         print("Skipping application: Job requirements not aligned with candidate profile per AI evaluation.")
                         # Record the skip? Or just return? For now, just return.
-                        self.write_to_file(company, job_title, job_url, job_location, "SingleJobSkip")
+                        self.job_store.record(job_id, JobStore.SKIPPED, company, job_title, job_url)
+                        self.write_to_file(company, job_title, job_url, job_location, "SingleJobSkip", JobStore.SKIPPED)
                         return False # Indicate skipped
                 except Exception as e:
                     print(f"Could not perform AI job fit evaluation: {e}")
@@ -1403,20 +1959,19 @@ class LinkedinEasyApply:
                     # apply_to_job returns False if Easy Apply button isn't found
                     print(f"Could not find Easy Apply button for {job_title} at {company}.")
                     # Log as failed or skipped? Let's log as failed for now.
-                    self.file_name = "failed"
-                    self.write_to_file(company, job_title, job_url, job_location, "SingleJobFail")
-                    self.file_name = "output" # Reset filename
+                    self.job_store.record(job_id, JobStore.FAILED, company, job_title, job_url)
+                    self.write_to_file(company, job_title, job_url, job_location, "SingleJobFail", JobStore.FAILED)
                     return False
 
             except Exception as e:
-                self.file_name = "failed"
+                self.job_store.record(job_id, JobStore.FAILED, company, job_title, job_url)
                 print(f"Failed during the application process for {job_title} at {company}: {e}")
                 traceback.print_exc()
-                self.write_to_file(company, job_title, job_url, job_location, "SingleJobFail")
-                self.file_name = "output" # Reset filename
+                self.write_to_file(company, job_title, job_url, job_location, "SingleJobFail", JobStore.FAILED)
                 return False # Indicate failure
 
             # --- Log Success ---
+            self.job_store.record(job_id, JobStore.APPLIED, company, job_title, job_url)
             try:
                 self.write_to_file(company, job_title, job_url, job_location, "SingleJobSuccess")
             except Exception as e:
@@ -1431,7 +1986,5 @@ class LinkedinEasyApply:
             print(f"An error occurred in apply_single_job: {e}")
             traceback.print_exc()
             # Log failure if details couldn't even be extracted
-            self.file_name = "failed"
-            self.write_to_file("Unknown", "Unknown", job_url, "Unknown", "SingleJobError")
-            self.file_name = "output"
+            self.write_to_file("Unknown", "Unknown", job_url, "Unknown", "SingleJobError", JobStore.FAILED)
             return False # Indicate failure
\ No newline at end of file
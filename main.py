@@ -1,44 +1,132 @@
-import yaml, os
+import time
+STARTED = time.time()  # taken before the imports below, so --measure-startup includes them
+import yaml, os, argparse, random, shutil, threading, traceback, urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from validate_email import validate_email
-from webdriver_manager.chrome import ChromeDriverManager
 from linkedineasyapply import LinkedinEasyApply
+from ai_cache import ResponseCache, ResumeTextCache
+from question_catalog import QuestionCatalog
+from worker_pool import WorkerPool
+from startup import StartupTimer, resolve_chromedriver
 
-def init_browser():
+BASE_PROFILE = "chrome_bot"
+BASE_DEBUGGING_PORT = 9222
+
+# URL patterns blocked through the DevTools protocol in the lean profile: images, fonts, media and analytics
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*.mp4', '*.webm', '*.mp3', '*.m4a',
+    '*media.licdn.com*', '*static.licdn.com/aero-v1/sc/h/*.woff*',
+    '*/li/track*', '*/tscp-serving/*', '*px.ads.linkedin.com*', '*snap.licdn.com*',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+]
+
+def debugger_listening(debugging_port):
+    """True if a Chrome is already running with remote debugging on this port."""
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{debugging_port}/json/version", timeout=1):
+            return True
+    except OSError:
+        return False
+
+def init_browser(profile=BASE_PROFILE, debugging_port=BASE_DEBUGGING_PORT, settings=None, driver_cache=True):
+    """
+    Start Chrome. settings is the 'browser' section of config.yaml: the 'standard' profile is a
+    maximized, headed browser; the 'lean' profile runs headless with a small fixed viewport, the
+    'eager' page load strategy and images, fonts, media and analytics blocked. With driver_cache,
+    the chromedriver resolved for the installed Chrome version is reused across runs.
+
+    With 'attach', a Chrome already listening on debugging_port (e.g. left running by a previous
+    run) is reused instead of starting a new one, and a newly started Chrome is left running
+    when the bot exits, so the next run can attach to it.
+    """
+    settings = settings or {}
+    lean = settings.get('profile', 'standard') == 'lean'
+    service = Service(resolve_chromedriver(use_cache=driver_cache))
     browser_options = Options()
+    if lean:
+        # Return control once the DOM is parsed; the bot waits on the elements it needs anyway
+        browser_options.page_load_strategy = 'eager'
+    attached = settings.get('attach', False) and debugger_listening(debugging_port)
+    if attached:
+        browser_options.add_experimental_option('debuggerAddress', f"127.0.0.1:{debugging_port}")
+        driver = webdriver.Chrome(service=service, options=browser_options)
+        print(f"Attached to the Chrome running on debugging port {debugging_port}.")
+    else:
+        driver = webdriver.Chrome(service=service, options=launch_options(browser_options, profile, debugging_port, settings))
+    driver.implicitly_wait(1)  # Wait time in seconds to allow loading of elements
+    if lean:
+        # DevTools settings last as long as the session, so they are applied again after attaching
+        if settings.get('blockResources', True):
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        # Headless Chrome announces itself in the user agent
+        user_agent = driver.execute_script("return navigator.userAgent").replace('HeadlessChrome', 'Chrome')
+        driver.execute_cdp_cmd('Network.setUserAgentOverride', {'userAgent': user_agent})
+    elif not attached:
+        driver.set_window_position(0, 0)
+        driver.maximize_window()
+    return driver
+
+def launch_options(browser_options, profile, debugging_port, settings):
+    """Chrome command line options for a new browser with the given profile and settings."""
+    lean = settings.get('profile', 'standard') == 'lean'
     options = [
         '--disable-blink-features',
         '--no-sandbox',
-        '--start-maximized',
         '--disable-extensions',
         '--ignore-certificate-errors',
         '--disable-blink-features=AutomationControlled',
-        '--remote-debugging-port=9222'
+        f'--remote-debugging-port={debugging_port}'
     ]
+    if lean:
+        width, height = str(settings.get('windowSize', '1280x900')).lower().split('x')
+        options += [
+            '--headless=new',
+            f'--window-size={width},{height}',
+            '--disable-gpu',
+            '--disable-dev-shm-usage',
+            '--mute-audio',
+            '--blink-settings=imagesEnabled=false',
+        ]
+    else:
+        options.append('--start-maximized')
+    if settings.get('attach', False):
+        # Keep Chrome running after the bot (or chromedriver) exits
+        browser_options.add_experimental_option('detach', True)
 
     # Restore session if possible (avoids login everytime)
-    user_data_dir = os.path.join(os.getcwd(), "chrome_bot")
+    user_data_dir = os.path.join(os.getcwd(), profile)
     browser_options.add_argument(f"user-data-dir={user_data_dir}")
 
     for option in options:
         browser_options.add_argument(option)
+    return browser_options
 
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=browser_options)
-    driver.implicitly_wait(1)  # Wait time in seconds to allow loading of elements
-    driver.set_window_position(0, 0)
-    driver.maximize_window()
-    return driver
+def init_worker_browser(index, settings=None):
+    """Launch the browser of a pool worker with its own profile (copied from the main one) and debugging port."""
+    profile = f"{BASE_PROFILE}_worker{index}"
+    if not os.path.exists(profile) and os.path.exists(BASE_PROFILE):
+        # Copy the logged-in session, leaving out the files Chrome uses to lock a running profile
+        shutil.copytree(BASE_PROFILE, profile, ignore=shutil.ignore_patterns('Singleton*', 'lockfile', '*.lock'))
+    return init_browser(profile, BASE_DEBUGGING_PORT + 1 + index, settings)
 
-def validate_yaml():
+def load_yaml():
     with open("config.yaml", 'r', encoding='utf-8') as stream:
         try:
-            parameters = yaml.safe_load(stream)
+            return yaml.safe_load(stream)
         except yaml.YAMLError as exc:
             raise exc
 
+def validate_yaml(parameters=None):
+    if parameters is None:
+        parameters = load_yaml()
+
     mandatory_params = ['email',
                         'password',
                         'disableAntiLock',
@@ -144,11 +232,139 @@ def validate_yaml():
 
     return parameters
 
+def manage_ai_cache(args):
+    with open("config.yaml", 'r', encoding='utf-8') as stream:
+        parameters = yaml.safe_load(stream) or {}
+    cache = ResponseCache(parameters.get('aiCacheFile') or 'ai_cache.db')
+
+    if args.ai_cache == 'stats':
+        for name, value in cache.stats().items():
+            print(f"{name}: {value}")
+    elif args.ai_cache == 'list':
+        for question, response_type, answer, hits, last_used in cache.entries(args.limit, args.match):
+            print(f"[{response_type}] {question} -> {answer} ({hits} hits)")
+    elif args.ai_cache == 'purge':
+        deleted = cache.purge(args.older_than, args.match)
+        print(f"Deleted {deleted} cached AI answers.")
+    cache.close()
+
+def export_questions(limit):
+    """Print the most frequent unprepared questions as questionRules entries for config.yaml."""
+    parameters = load_yaml() or {}
+    catalog = QuestionCatalog(parameters.get('questionCatalogFile') or 'question_catalog.db')
+    rules = catalog.export_rules(limit)
+    catalog.close()
+    print(rules or "No unprepared questions recorded yet.")
+
+def warm_resume(parameters=None):
+    """Extract the resume text into the shared cache, so runs (and parallel workers) start without parsing the PDF."""
+    if parameters is None:
+        parameters = load_yaml() or {}
+    cache = ResumeTextCache(parameters.get('aiCacheFile') or 'ai_cache.db')
+    resumes = [(parameters.get('textResume'), False), ((parameters.get('uploads') or {}).get('resume'), True)]
+    for path, pdf in resumes:
+        if not path or not os.path.isfile(path):
+            continue
+        started = time.time()
+        text, normalized, cached = cache.load(path, pdf)
+        state = "already cached" if cached else f"extracted in {time.time() - started:.2f}s"
+        print(f"{path}: {len(text)} characters ({len(normalized)} normalized), {state}")
+    cache.close()
+
+def warm_up(parameters):
+    """Load the OpenAI package and the resume text while the browser starts."""
+    try:
+        if parameters.get('openaiApiKey'):
+            import openai
+        if parameters.get('resumeCache', True):
+            warm_resume(parameters)
+    except Exception:
+        traceback.print_exc()
+
+def start_browser(config, timer=None, serial=False):
+    """
+    Validate config (as loaded from config.yaml) and launch the browser. Unless serial, Chrome
+    is launched in the background first and the config is validated and the resume and OpenAI
+    package warmed up while it starts. Returns (parameters, browser).
+    """
+    mark = timer.mark if timer else (lambda name: None)
+    if serial:
+        parameters = validate_yaml(config)
+        mark("config validated")
+        warm_up(parameters)
+        mark("resume and AI warm-up")
+        browser = init_browser(settings=parameters.get('browser'), driver_cache=False)
+        mark("browser launched")
+        return parameters, browser
+
+    executor = ThreadPoolExecutor(max_workers=2)
+    launch = executor.submit(init_browser, settings=config.get('browser'))
+    try:
+        parameters = validate_yaml(config)
+        mark("config validated")
+        executor.submit(warm_up, parameters)
+        browser = launch.result()
+        mark("browser launched")
+    except BaseException:
+        if launch.done() and not launch.exception():
+            launch.result().quit()
+        raise
+    finally:
+        # The warm-up keeps running during login
+        executor.shutdown(wait=False)
+    return parameters, browser
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="LinkedIn Easy Apply bot")
+    parser.add_argument('--ai-cache', choices=['stats', 'list', 'purge'],
+                        help="Inspect or purge the cached AI answers instead of running the bot")
+    parser.add_argument('--match', help="Only list/purge cached answers whose question contains this text")
+    parser.add_argument('--older-than', type=float, metavar='DAYS', help="Only purge cached answers older than DAYS")
+    parser.add_argument('--limit', type=int, default=50, help="Maximum number of cached answers to list")
+    parser.add_argument('--warm-resume', action='store_true',
+                        help="Extract the resume text into the cache (aiCacheFile) and exit")
+    parser.add_argument('--export-questions', type=int, nargs='?', const=20, metavar='N',
+                        help="Print the N (default 20) most frequent unanswered questions as questionRules entries and exit")
+    parser.add_argument('--measure-startup', action='store_true',
+                        help="Start up, log in, open the first search page, print how long each step took and exit")
+    parser.add_argument('--serial-startup', action='store_true',
+                        help="Start up step by step without the chromedriver cache (the old startup, for comparison)")
+    return parser.parse_args()
+
 if __name__ == '__main__':
-    parameters = validate_yaml()
-    browser = init_browser()
+    args = parse_args()
+    if args.ai_cache:
+        manage_ai_cache(args)
+        raise SystemExit
+    if args.warm_resume:
+        warm_resume()
+        raise SystemExit
+    if args.export_questions:
+        export_questions(args.export_questions)
+        raise SystemExit
+
+    timer = StartupTimer(STARTED, 'serial' if args.serial_startup else 'overlapped') if args.measure_startup else None
+    config = load_yaml() or {}
+    workers = int(config.get('workers') or 1)
+    if workers > 1 and not timer:
+        parameters = validate_yaml(config)
+        searches = list(product(parameters['positions'], parameters['locations']))
+        random.shuffle(searches)
+        WorkerPool(parameters, lambda index: init_worker_browser(index, parameters.get('browser')), workers).run(searches)
+        raise SystemExit
+
+    parameters, browser = start_browser(config, timer, serial=args.serial_startup)
 
     bot = LinkedinEasyApply(parameters, browser)
+    # Create the OpenAI client and the candidate context during login instead of on the first question
+    threading.Thread(target=bot.ai_response_generator.warm_up, name="ai-warm-up", daemon=True).start()
     bot.login()
     bot.security_check()
+    if timer:
+        timer.mark("logged in")
+        bot.open_results_page(parameters['positions'][0], "&location=" + parameters['locations'][0], 0)
+        timer.mark("first search page")
+        timer.report()
+        browser.quit()
+        raise SystemExit
     bot.start_applying()
\ No newline at end of file
@@ -0,0 +1,153 @@
+import json, os, random, threading, time
+from contextlib import contextmanager
+
+# Upper bounds (seconds) of the Prometheus histogram buckets for phase durations
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+# Durations kept per phase for the summary's percentiles: a uniform random sample of the whole run
+SAMPLE_SIZE = 1000
+
+
+class PhaseMetrics:
+    """
+    Structured timing of the phases of a run (results page load, card extraction, details pane,
+    job fit, each Easy Apply step, submit, confirmation, and each job and search as a whole).
+
+    Every phase is appended to jsonl_path as one JSON event. Durations are also kept as a
+    histogram per phase, and outcome counts per phase, and written to prometheus_path in the
+    Prometheus text format (for node_exporter's textfile collector) every prometheus_interval
+    seconds by a background thread, so the file stays fresh through long breaks. Either path
+    may be empty to turn that output off. The summary's percentiles come from a reservoir of
+    at most SAMPLE_SIZE durations per phase, so memory stays flat on long runs.
+    """
+
+    def __init__(self, jsonl_path=None, prometheus_path=None, prometheus_interval=60):
+        self.prometheus_path = prometheus_path
+        self.prometheus_interval = prometheus_interval
+        self.started = time.time()
+        self.samples = {}
+        self.sample_counts = {}
+        self.histograms = {}
+        self.outcomes = {}
+        self.waits = {}
+        self._lock = threading.Lock()
+        self._jsonl = open(jsonl_path, 'a', encoding='utf-8', buffering=1) if jsonl_path else None
+        self._stopped = threading.Event()
+        self._writer = None
+        if prometheus_path:
+            self._writer = threading.Thread(target=self._write_periodically, name="metrics-writer", daemon=True)
+            self._writer.start()
+
+    @contextmanager
+    def phase(self, name, **fields):
+        """
+        Time the enclosed block as phase name. The yielded dict holds the event's fields and can
+        be updated inside the block, e.g. to set its 'outcome' (default 'ok', or 'error' if the
+        block raises).
+        """
+        started = time.time()
+        outcome = 'ok'
+        try:
+            yield fields
+        except BaseException:
+            outcome = 'error'
+            raise
+        finally:
+            fields.setdefault('outcome', outcome)
+            self.record(name, time.time() - started, **fields)
+
+    def record(self, name, seconds, outcome='ok', **fields):
+        with self._lock:
+            samples = self.samples.setdefault(name, [])
+            seen = self.sample_counts[name] = self.sample_counts.get(name, 0) + 1
+            if len(samples) < SAMPLE_SIZE:
+                samples.append(seconds)
+            else:
+                # Reservoir sampling: every duration so far has the same chance of being kept
+                slot = random.randrange(seen)
+                if slot < SAMPLE_SIZE:
+                    samples[slot] = seconds
+            histogram = self.histograms.setdefault(name, [0] * (len(BUCKETS) + 1) + [0.0])
+            for index, bound in enumerate(BUCKETS):
+                if seconds <= bound:
+                    histogram[index] += 1
+            histogram[len(BUCKETS)] += 1
+            histogram[-1] += seconds
+            self.outcomes[(name, outcome)] = self.outcomes.get((name, outcome), 0) + 1
+            if self._jsonl:
+                event = {'ts': round(time.time(), 3), 'phase': name, 'seconds': round(seconds, 4), 'outcome': outcome}
+                event.update(fields)
+                self._jsonl.write(json.dumps(event, default=str) + "\n")
+
+    def count_wait(self, kind, seconds):
+        """Add time spent in a WaitEngine wait of this kind (conditions, jitter, breaks or scrolling)."""
+        with self._lock:
+            self.waits[kind] = self.waits.get(kind, 0.0) + seconds
+
+    def applications_per_hour(self):
+        hours = (time.time() - self.started) / 3600
+        return self.outcomes.get(('job', 'applied'), 0) / hours if hours else 0
+
+    def _write_periodically(self):
+        while not self._stopped.wait(self.prometheus_interval):
+            try:
+                self.write_prometheus()
+            except OSError as e:
+                print(f"Could not write the Prometheus metrics to {self.prometheus_path}: {e}")
+
+    def write_prometheus(self):
+        if not self.prometheus_path:
+            return
+        with self._lock:
+            lines = ["# HELP easyapply_phase_seconds Time spent in each phase of the run.",
+                     "# TYPE easyapply_phase_seconds histogram"]
+            for name, histogram in sorted(self.histograms.items()):
+                for bound, count in zip(BUCKETS, histogram):
+                    lines.append(f'easyapply_phase_seconds_bucket{{phase="{name}",le="{bound}"}} {count}')
+                lines.append(f'easyapply_phase_seconds_bucket{{phase="{name}",le="+Inf"}} {histogram[len(BUCKETS)]}')
+                lines.append(f'easyapply_phase_seconds_sum{{phase="{name}"}} {histogram[-1]:.4f}')
+                lines.append(f'easyapply_phase_seconds_count{{phase="{name}"}} {histogram[len(BUCKETS)]}')
+            lines += ["# HELP easyapply_phase_outcomes_total Completed phases by outcome (phase=\"job\" counts applications).",
+                      "# TYPE easyapply_phase_outcomes_total counter"]
+            for (name, outcome), count in sorted(self.outcomes.items()):
+                lines.append(f'easyapply_phase_outcomes_total{{phase="{name}",outcome="{outcome}"}} {count}')
+            lines += ["# HELP easyapply_wait_seconds_total Time spent waiting, by kind (conditions, jitter, breaks, scrolling).",
+                      "# TYPE easyapply_wait_seconds_total counter"]
+            for kind, seconds in sorted(self.waits.items()):
+                lines.append(f'easyapply_wait_seconds_total{{kind="{kind}"}} {seconds:.4f}')
+            lines += ["# HELP easyapply_applications_per_hour Applications sent per hour since the run started.",
+                      "# TYPE easyapply_applications_per_hour gauge",
+                      f"easyapply_applications_per_hour {self.applications_per_hour():.3f}",
+                      "# HELP easyapply_run_start_time_seconds Unix time the run started.",
+                      "# TYPE easyapply_run_start_time_seconds gauge",
+                      f"easyapply_run_start_time_seconds {self.started:.0f}"]
+        # Write then rename, so the collector never reads a half-written file
+        temporary = f"{self.prometheus_path}.{threading.get_ident()}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(temporary, self.prometheus_path)
+
+    def summary(self):
+        lines = [f"Phase timings ({self.applications_per_hour():.1f} applications/hour):",
+                 f"  {'phase':<18}{'count':>7}{'p50 s':>9}{'p95 s':>9}{'total s':>10}"]
+        with self._lock:
+            for name, samples in sorted(self.samples.items()):
+                ordered = sorted(samples)
+                histogram = self.histograms[name]
+                lines.append(f"  {name:<18}{histogram[len(BUCKETS)]:>7}{ordered[len(ordered) // 2]:>9.2f}"
+                             f"{ordered[max(int(len(ordered) * 0.95) - 1, 0)]:>9.2f}{histogram[-1]:>10.1f}")
+        return "\n".join(lines)
+
+    def close(self):
+        self._stopped.set()
+        if self._writer:
+            self._writer.join()
+        self.write_prometheus()
+        if self._jsonl:
+            self._jsonl.close()
+            self._jsonl = None
+
+
+def metrics_from_parameters(parameters):
+    """Build PhaseMetrics from the 'metrics' section of config.yaml."""
+    settings = parameters.get('metrics') or {}
+    return PhaseMetrics(settings.get('jsonlFile'), settings.get('prometheusFile'), settings.get('prometheusInterval', 60))
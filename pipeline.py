@@ -0,0 +1,157 @@
+import queue, threading, traceback
+from job_store import JobStore
+
+# Marks the end of a stage's output
+DONE = object()
+
+
+class JobPipeline:
+    """
+    Runs discovery, filtering, job-fit evaluation and applying as stages connected by bounded
+    queues, so the browser applies to one job while the next ones are fetched and evaluated.
+
+    - discover + filter (one thread): bot.iter_jobs() records that are new, not blacklisted and
+      accepted by every function in filters (each takes a job dict and returns True to keep it)
+    - evaluate (evaluators threads): fetch the posting over HTTP and run the AI job-fit check
+    - apply (calling thread): open the job in the browser and go through Easy Apply
+
+    A full queue blocks the stage feeding it. Stopping (the apply stage finishing, an error or
+    Ctrl+C) sets a shared event that every stage checks between jobs.
+    """
+
+    def __init__(self, bot, filters=(), queue_size=20, evaluators=2):
+        self.bot = bot
+        self.filters = list(filters)
+        self.evaluators = evaluators
+        self.candidates = queue.Queue(maxsize=queue_size)
+        self.ready = queue.Queue(maxsize=queue_size)
+        self.stop = threading.Event()
+        self.counts = {'discovered': 0, 'filtered': 0, 'rejected': 0, 'applied': 0}
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def run(self, searches=None):
+        # Created here so the browser is only ever used from the calling thread
+        self.bot.get_harvester()
+        threads = [threading.Thread(target=self._discover, args=(searches,), name="pipeline-discover", daemon=True)]
+        threads += [threading.Thread(target=self._evaluate, name=f"pipeline-evaluate-{index}", daemon=True)
+                    for index in range(self.evaluators)]
+        for thread in threads:
+            thread.start()
+
+        finished = 0
+        try:
+            while finished < self.evaluators:
+                job = self._get(self.ready)
+                if job is None:
+                    continue
+                if job is DONE:
+                    finished += 1
+                    continue
+                # Breaks scheduled by discovery pause the browser too, not just the fetching
+                self.bot.pacer.wait_turn(self.bot.waits)
+                applications = self.bot.applications
+                self.bot.track_job(self.bot.apply_harvested_job, job, job['search_location'])
+                self._count('applied', self.bot.applications - applications)
+        finally:
+            self.stop.set()
+            for thread in threads:
+                thread.join(timeout=5)
+                if thread.is_alive():
+                    # Discovery may be in the middle of a break between results pages
+                    print(f"{thread.name} will stop after its current wait.")
+            print(f"Pipeline: {self.counts['discovered']} jobs discovered, {self.counts['filtered']} filtered out, "
+                  f"{self.counts['rejected']} rejected after reading the posting, {self.counts['applied']} applications sent.")
+
+    def accept(self, job):
+        """Cheap checks done before anything is fetched: duplicates, seen jobs, blacklists and custom filters."""
+        job_id = job['job_id']
+        if job_id in self._seen:
+            return False
+        self._seen.add(job_id)
+        if job_id in self.bot.job_store:
+            print(f"Job {job_id} for {job['company']} skipped because it was already {self.bot.job_store.status(job_id)}.")
+            return False
+        reasons = self.bot.blacklist_reasons(job)
+        if reasons:
+            print(f"Job for {job['company']} skipped because " + " and ".join(reasons) + ".")
+            return False
+        return all(accept(job) for accept in self.filters)
+
+    def prepare(self, job):
+        """Fetch the posting and evaluate the job's fit. Returns False if the job should not be applied to."""
+        bot = self.bot
+        if not (bot.evaluate_job_fit or bot.poster_blacklist):
+            return True
+        job.update(bot.harvester.posting(job['job_id']))
+        reasons = bot.blacklist_reasons(job)
+        if reasons:
+            print(f"Job for {job['company']} by {job['poster']} skipped because " + " and ".join(reasons) + ".")
+            return False
+        if bot.evaluate_job_fit:
+            fits = bot.ai_response_generator.cached_job_fit(job['job_id'])
+            if fits is None and job.get('description'):
+                with bot.metrics.phase('job_fit', job_id=job['job_id']) as fit:
+                    fits = bot.ai_response_generator.evaluate_job_fit(job['title'], job['description'], job['job_id'])
+                    fit['outcome'] = 'apply' if fits else 'skip'
+            if fits is False:
+                print(f"Skipping {job['title']} at {job['company']}: job requirements not aligned with candidate profile per AI evaluation.")
+                bot.job_store.record(job['job_id'], JobStore.SKIPPED, job['company'], job['title'], job['link'])
+                bot.write_to_file(job['company'], job['title'], job['link'], job['location'], job['search_location'], JobStore.SKIPPED)
+                return False
+            # Without a description (fetch failed) fits stays None and the apply stage evaluates the job itself
+            job['fits'] = fits
+        return True
+
+    def _discover(self, searches):
+        try:
+            for job in self.bot.iter_jobs(searches):
+                if self.stop.is_set():
+                    break
+                self._count('discovered')
+                if self.accept(job):
+                    self._put(self.candidates, job)
+                else:
+                    self._count('filtered')
+        except Exception:
+            traceback.print_exc()
+        finally:
+            for _ in range(self.evaluators):
+                self._put(self.candidates, DONE)
+
+    def _evaluate(self):
+        try:
+            while not self.stop.is_set():
+                job = self._get(self.candidates)
+                if job is None:
+                    continue
+                if job is DONE:
+                    break
+                try:
+                    if self.prepare(job):
+                        self._put(self.ready, job)
+                    else:
+                        self._count('rejected')
+                except Exception:
+                    traceback.print_exc()
+        finally:
+            self._put(self.ready, DONE)
+
+    def _put(self, stage_queue, item):
+        while not self.stop.is_set():
+            try:
+                stage_queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, stage_queue):
+        try:
+            return stage_queue.get(timeout=0.5)
+        except queue.Empty:
+            return None
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self.counts[name] += amount
@@ -0,0 +1,123 @@
+import hashlib, json, sqlite3, threading, time
+from ai_cache import normalize_question
+
+CHOICE_FIELDS = {'radio', 'dropdown'}
+
+
+def fingerprint(question_text, field_type, options=None):
+    """Identify a question by its normalized text, field type and set of options (order ignored)."""
+    option_texts = sorted({str(option).strip().lower() for option in options or []})
+    raw = json.dumps([normalize_question(question_text), field_type, option_texts])
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:32]
+
+
+class QuestionCatalog:
+    """
+    Every question the answer rules did not cover, counted instead of logged once per sighting.
+
+    Each distinct question (see fingerprint) keeps its options, hit count, first and last time
+    seen, the answer finally used (from the AI or the fallback) and how many of the applications
+    it appeared in were submitted. export_rules() turns the most frequent ones into questionRules
+    entries for config.yaml, so they are answered without an AI call next time.
+    """
+
+    def __init__(self, path="question_catalog.db"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._job_questions = {}
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS questions ("
+            "fingerprint TEXT PRIMARY KEY, "
+            "question TEXT NOT NULL, "
+            "field_type TEXT NOT NULL, "
+            "options TEXT, "
+            "hits INTEGER NOT NULL DEFAULT 0, "
+            "first_seen REAL NOT NULL, "
+            "last_seen REAL NOT NULL, "
+            "answer TEXT, "
+            "answer_source TEXT, "
+            "applied INTEGER NOT NULL DEFAULT 0, "
+            "not_applied INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS questions_hits ON questions (hits)")
+        self._conn.commit()
+
+    def record(self, question_text, field_type, options=None):
+        """Count a sighting of an unprepared question and return its fingerprint."""
+        key = fingerprint(question_text, field_type, options)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO questions (fingerprint, question, field_type, options, hits, first_seen, last_seen) "
+                "VALUES (?, ?, ?, ?, 1, ?, ?) "
+                "ON CONFLICT(fingerprint) DO UPDATE SET hits = hits + 1, last_seen = excluded.last_seen",
+                (key, normalize_question(question_text), field_type,
+                 json.dumps([str(option) for option in options]) if options else None, now, now)
+            )
+            self._conn.commit()
+            # Questions are attributed to the job being applied to in this thread (one per worker)
+            self._job_questions.setdefault(threading.get_ident(), set()).add(key)
+        return key
+
+    def answered(self, key, answer, source):
+        """Store the answer that was entered for the question (source: 'ai' or 'fallback')."""
+        with self._lock:
+            self._conn.execute("UPDATE questions SET answer = ?, answer_source = ? WHERE fingerprint = ?",
+                               (json.dumps(answer), source, key))
+            self._conn.commit()
+
+    def finish_job(self, applied):
+        """Credit the questions seen during the current job with its outcome."""
+        with self._lock:
+            keys = self._job_questions.pop(threading.get_ident(), set())
+            if keys:
+                column = 'applied' if applied else 'not_applied'
+                self._conn.executemany(f"UPDATE questions SET {column} = {column} + 1 WHERE fingerprint = ?",
+                                       [(key,) for key in keys])
+                self._conn.commit()
+
+    def top(self, limit=20):
+        """Return the most frequent questions as dicts, most hits first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT question, field_type, options, hits, first_seen, last_seen, answer, answer_source, applied, "
+                "not_applied FROM questions ORDER BY hits DESC, last_seen DESC LIMIT ?", (limit,)).fetchall()
+        columns = ('question', 'field_type', 'options', 'hits', 'first_seen', 'last_seen', 'answer', 'answer_source',
+                   'applied', 'not_applied')
+        entries = []
+        for row in rows:
+            entry = dict(zip(columns, row))
+            entry['options'] = json.loads(entry['options']) if entry['options'] else []
+            entry['answer'] = json.loads(entry['answer']) if entry['answer'] is not None else None
+            entries.append(entry)
+        return entries
+
+    def export_rules(self, limit=20):
+        """
+        Return the top questions as YAML questionRules entries, ready to paste under questionRules
+        in config.yaml. Each answer is the one last used; review it before pasting.
+        """
+        import yaml
+        lines = []
+        for entry in self.top(limit):
+            outcome = f"{entry['applied']}/{entry['applied'] + entry['not_applied']} applications submitted"
+            lines.append(f" # Seen {entry['hits']} times ({outcome}), last {time.strftime('%Y-%m-%d', time.localtime(entry['last_seen']))}"
+                         + (f", options: {', '.join(entry['options'])}" if entry['options'] else ""))
+            if entry['answer'] is None:
+                lines.append(" # (no answer recorded yet)")
+                continue
+            answer = {'value': entry['answer']}
+            if entry['field_type'] in CHOICE_FIELDS:
+                answer['matchOption'] = True
+            rule = {'name': entry['question'][:60], 'fields': [entry['field_type']], 'keywords': [entry['question']],
+                    'answer': answer}
+            if entry['answer_source'] != 'ai':
+                lines.append(f" # Answered by the {entry['answer_source']} answer, check it")
+            text = yaml.safe_dump([rule], sort_keys=False, default_flow_style=None, allow_unicode=True, width=1000)
+            lines += [" " + line for line in text.splitlines()]
+        return "\n".join(lines)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
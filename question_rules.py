@@ -0,0 +1,282 @@
+import re
+
+FIELD_TYPES = {'radio', 'text', 'numeric', 'dropdown'}
+
+EEO_KEYWORDS = [
+    'aboriginal', 'native', 'indigenous', 'tribe', 'first nations',
+    'native american', 'native hawaiian', 'inuit', 'metis', 'maori',
+    'aborigine', 'ancestral', 'native peoples', 'original people',
+    'first people', 'gender', 'race', 'disability', 'latino'
+]
+DECLINE_OPTION_KEYWORDS = ['prefer', 'decline', 'don\'t', 'specified', 'none']
+
+# Default rules, in the order the old if/elif chains checked them. A rule applies to a question
+# when any of its keywords occurs in the lowercased question text and none of its "exclude"
+# keywords do; among applicable rules the lowest (priority, position) wins, even if its answer
+# turns out to be None. Keys of "answer":
+#   checkbox: <checkboxes key>      -> 'yes' / 'no'
+#   value: <literal>                -> the literal
+#   personal: <key or list of keys> -> personalInfo value(s), joined with a space
+#   setting: universityGpa | noticePeriod | salaryMinimum
+#   degree: true                    -> 'yes' if a completed degree is named in the question
+#   language: true                  -> configured level for the language named in the question
+#   optionContaining: [words]       -> first option containing any of the words
+#   matchOption: true               -> return the first option containing the computed value
+#   fallback: first                 -> first option when nothing else matched
+DEFAULT_QUESTION_RULES = [
+    # Radio buttons
+    {'name': 'drivers licence', 'fields': ['radio'], 'keywords': ['driver\'s licence', 'driver\'s license'],
+     'answer': {'checkbox': 'driversLicence'}},
+    {'name': 'eeo', 'fields': ['radio'], 'keywords': EEO_KEYWORDS + ['torres', 'do you identify'],
+     'answer': {'optionContaining': DECLINE_OPTION_KEYWORDS + ['no']}},
+    {'name': 'assessment', 'fields': ['radio'], 'keywords': ['assessment'], 'answer': {'checkbox': 'assessment'}},
+    {'name': 'clearance', 'fields': ['radio'], 'keywords': ['clearance'], 'answer': {'checkbox': 'securityClearance'}},
+    {'name': 'north korea', 'fields': ['radio'], 'keywords': ['north korea'], 'answer': {'value': 'no'}},
+    {'name': 'previous employment', 'fields': ['radio'], 'keywords': ['previously employ', 'previous employ'],
+     'answer': {'value': 'no'}},
+    {'name': 'certification', 'fields': ['radio'],
+     'keywords': ['certified', 'certificate', 'cpa', 'chartered accountant', 'qualification'],
+     'answer': {'checkbox': 'certifiedProfessional'}},
+    {'name': 'urgent', 'fields': ['radio'], 'keywords': ['urgent'], 'answer': {'checkbox': 'urgentFill'}},
+    {'name': 'commute', 'fields': ['radio'], 'keywords': ['commut', 'on-site', 'hybrid', 'onsite'],
+     'answer': {'checkbox': 'commute'}},
+    {'name': 'remote', 'fields': ['radio'], 'keywords': ['remote'], 'answer': {'checkbox': 'remote'}},
+    {'name': 'background check', 'fields': ['radio'], 'keywords': ['background check'],
+     'answer': {'checkbox': 'backgroundCheck'}},
+    {'name': 'drug test', 'fields': ['radio'], 'keywords': ['drug test'], 'answer': {'checkbox': 'drugTest'}},
+    {'name': 'education', 'fields': ['radio'], 'keywords': ['level of education'], 'answer': {'degree': True}},
+    {'name': 'data retention', 'fields': ['radio'], 'keywords': ['data retention'], 'answer': {'value': 'no'}},
+
+    # Text and numeric inputs
+    {'name': 'gpa', 'fields': ['text', 'numeric'], 'keywords': ['grade point average'],
+     'answer': {'setting': 'universityGpa'}},
+    {'name': 'first name', 'fields': ['text', 'numeric'], 'keywords': ['first name'], 'exclude': ['last name'],
+     'answer': {'personal': 'First Name'}},
+    {'name': 'last name', 'fields': ['text', 'numeric'], 'keywords': ['last name'], 'exclude': ['first name'],
+     'answer': {'personal': 'Last Name'}},
+    {'name': 'location', 'fields': ['text', 'numeric'], 'keywords': ['location'],
+     'answer': {'value': 'Houston, Texas, United States'}},
+    {'name': 'full name', 'fields': ['text', 'numeric'], 'keywords': ['name'],
+     'answer': {'personal': ['First Name', 'Last Name']}},
+    {'name': 'pronouns', 'fields': ['text', 'numeric'], 'keywords': ['pronouns'], 'answer': {'personal': 'Pronouns'}},
+    {'name': 'phone', 'fields': ['text', 'numeric'], 'keywords': ['phone'],
+     'answer': {'personal': 'Mobile Phone Number'}},
+    {'name': 'linkedin', 'fields': ['text', 'numeric'], 'keywords': ['linkedin'], 'answer': {'personal': 'Linkedin'}},
+    {'name': 'message to manager', 'fields': ['text', 'numeric'], 'keywords': ['message to hiring', 'cover letter'],
+     'answer': {'personal': 'MessageToManager'}},
+    {'name': 'website', 'fields': ['text', 'numeric'], 'keywords': ['website', 'github', 'portfolio'],
+     'answer': {'personal': 'Website'}},
+    {'name': 'notice period', 'fields': ['text', 'numeric'], 'keywords': ['notice', 'weeks'],
+     'answer': {'setting': 'noticePeriod'}},
+    {'name': 'salary', 'fields': ['text', 'numeric'], 'keywords': ['salary', 'expectation', 'compensation', 'ctc'],
+     'answer': {'setting': 'salaryMinimum'}},
+
+    # Dropdowns
+    {'name': 'language proficiency', 'fields': ['dropdown'], 'keywords': ['proficiency'], 'answer': {'language': True}},
+    {'name': 'clearance', 'fields': ['dropdown'], 'keywords': ['clearance'],
+     'answer': {'checkbox': 'securityClearance', 'matchOption': True}},
+    {'name': 'assessment', 'fields': ['dropdown'], 'keywords': ['assessment'],
+     'answer': {'checkbox': 'assessment', 'matchOption': True}},
+    {'name': 'commute', 'fields': ['dropdown'], 'keywords': ['commut', 'on-site', 'hybrid', 'onsite'],
+     'answer': {'checkbox': 'commute', 'matchOption': True}},
+    {'name': 'country code', 'fields': ['dropdown'], 'keywords': ['country code'],
+     'answer': {'personal': 'Phone Country Code'}},
+    {'name': 'previous employment', 'fields': ['dropdown'],
+     'keywords': ['north korea', 'previously employed', 'previous employment'],
+     'answer': {'optionContaining': ['no']}},
+    {'name': 'above 18', 'fields': ['dropdown'], 'keywords': ['above 18'],
+     'answer': {'optionContaining': ['yes'], 'fallback': 'first'}},
+    {'name': 'eeo', 'fields': ['dropdown'], 'keywords': EEO_KEYWORDS,
+     'answer': {'optionContaining': DECLINE_OPTION_KEYWORDS}},
+]
+
+ANSWER_SOURCES = {'checkbox', 'value', 'personal', 'setting', 'degree', 'language', 'optionContaining'}
+SETTINGS = {'universityGpa', 'noticePeriod', 'salaryMinimum'}
+DEFAULT_PRIORITY = 100
+# The same questions come back on most applications, so resolved matches are memoized
+MATCH_CACHE_SIZE = 10000
+_NOT_CACHED = object()
+
+
+def _trie_pattern(keywords):
+    """Build a regex matching the longest of the keywords, with alternatives nested as a trie."""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return '(?:' + body + ')?' if '' in node else body
+
+    return build(trie)
+
+
+def squash(text):
+    """Lowercase and collapse runs of whitespace (labels often hold line breaks or double spaces)."""
+    text = str(text).lower()
+    if '  ' in text or '\n' in text or '\t' in text or '\r' in text:
+        return " ".join(text.split())
+    return text
+
+
+class QuestionRule:
+    def __init__(self, definition, position):
+        self.name = definition.get('name', f'rule {position}')
+        self.fields = set(definition.get('fields') or FIELD_TYPES)
+        self.keywords = [squash(keyword) for keyword in definition.get('keywords', [])]
+        self.exclude = [squash(keyword) for keyword in definition.get('exclude', [])]
+        self.answer = definition.get('answer', {})
+        self.rank = (definition.get('priority', DEFAULT_PRIORITY), position)
+
+        if not self.keywords:
+            raise ValueError(f"Question rule '{self.name}' has no keywords.")
+        if not self.fields <= FIELD_TYPES:
+            raise ValueError(f"Question rule '{self.name}' has unknown field types: {self.fields - FIELD_TYPES}")
+        sources = ANSWER_SOURCES & set(self.answer)
+        if len(sources) != 1:
+            raise ValueError(f"Question rule '{self.name}' must define exactly one of {sorted(ANSWER_SOURCES)} as answer.")
+        if 'setting' in self.answer and self.answer['setting'] not in SETTINGS:
+            raise ValueError(f"Question rule '{self.name}' refers to unknown setting '{self.answer['setting']}'.")
+
+
+class _FieldMatcher:
+    """
+    The rules of one field type, in priority order, compiled into one trie-shaped regex over all
+    their keywords and excludes.
+
+    A scan reports every keyword the question contains (substring semantics, like the old `in`
+    checks): each match also credits the keywords contained in it, and the scan resumes inside
+    a match only where another keyword could begin and run past its end. Most questions contain
+    no keyword at all and cost a single regex search; most of the others contain exactly one.
+    """
+
+    def __init__(self, rules):
+        self.rules = rules
+        keywords = {keyword for rule in rules for keyword in rule.keywords + rule.exclude}
+        self.pattern = re.compile(_trie_pattern(keywords)) if keywords else None
+        self.contained = {keyword: frozenset(other for other in keywords if other in keyword) for keyword in keywords}
+        # Where to resume scanning after a match: at the end of it, or earlier when a suffix of
+        # the match is the start of another keyword that could run past the match.
+        self.resume = {}
+        for keyword in keywords:
+            self.resume[keyword] = next((i for i in range(1, len(keyword))
+                                         if any(other not in keyword and other.startswith(keyword[i:])
+                                                for other in keywords)), len(keyword))
+        # matched keyword -> indexes of the rules triggered by it or by a keyword contained in it
+        self.candidates = {keyword: tuple(index for index, rule in enumerate(rules)
+                                          if not self.contained[keyword].isdisjoint(rule.keywords))
+                           for keyword in keywords}
+        # matched keyword -> the rule that applies when it is the only keyword in the question
+        self.alone = {keyword: self._first(self.candidates[keyword], self.contained[keyword]) for keyword in keywords}
+
+    def _first(self, indexes, found):
+        for index in indexes:
+            if found.isdisjoint(self.rules[index].exclude):
+                return self.rules[index]
+        return None
+
+    def match(self, question_text):
+        if self.pattern is None:
+            return None
+        match = self.pattern.search(question_text)
+        if match is None:
+            return None
+        keyword = match.group()
+        following = self.pattern.search(question_text, match.start() + self.resume[keyword])
+        if following is None:
+            return self.alone[keyword]
+
+        matched = [keyword]
+        while following is not None:
+            keyword = following.group()
+            matched.append(keyword)
+            following = self.pattern.search(question_text, following.start() + self.resume[keyword])
+        found = frozenset().union(*(self.contained[keyword] for keyword in matched))
+        return self._first(sorted({index for keyword in matched for index in self.candidates[keyword]}), found)
+
+
+class QuestionRuleEngine:
+    """
+    Resolves application questions to configured answers with a single regex scan per question.
+
+    The rules are compiled per field type into a _FieldMatcher; the highest-priority rule whose
+    keywords the question contains (and whose excludes it does not) wins. Resolved matches are
+    also memoized, as the same questions come back on most applications.
+    """
+
+    def __init__(self, rules, parameters):
+        self.rules = sorted((QuestionRule(rule, i) for i, rule in enumerate(rules)), key=lambda rule: rule.rank)
+        self.checkboxes = parameters.get('checkboxes', {}) or {}
+        self.personal_info = parameters.get('personalInfo', {}) or {}
+        self.languages = parameters.get('languages', {}) or {}
+        self.settings = {setting: parameters.get(setting) for setting in SETTINGS}
+        self._matches = {}
+        self._matchers = {field: _FieldMatcher([rule for rule in self.rules if field in rule.fields])
+                          for field in FIELD_TYPES}
+
+    def match(self, question_text, field_type):
+        """Return the highest-priority rule applying to the question, or None."""
+        key = (question_text, field_type)
+        rule = self._matches.get(key, _NOT_CACHED)
+        if rule is _NOT_CACHED:
+            rule = self._matchers[field_type].match(squash(question_text))
+            if len(self._matches) >= MATCH_CACHE_SIZE:
+                self._matches.clear()
+            self._matches[key] = rule
+        return rule
+
+    def answer(self, question_text, field_type, options=None):
+        """Return the configured answer for a question, or None if no rule resolves it."""
+        rule = self.match(question_text, field_type)
+        if rule is None:
+            return None
+        return self._resolve(rule.answer, question_text, field_type, options or [])
+
+    def _resolve(self, answer, question_text, field_type, options):
+        value = None
+        if 'checkbox' in answer:
+            value = 'yes' if self.checkboxes.get(answer['checkbox']) else 'no'
+        elif 'value' in answer:
+            value = answer['value']
+        elif 'personal' in answer:
+            keys = answer['personal'] if isinstance(answer['personal'], list) else [answer['personal']]
+            value = " ".join(str(self.personal_info[key]) for key in keys)
+        elif 'setting' in answer:
+            value = self._setting(answer['setting'], field_type)
+        elif 'degree' in answer:
+            question_text = squash(question_text)
+            for degree in self.checkboxes.get('degreeCompleted', []) or []:
+                if degree.lower() in question_text:
+                    value = 'yes'
+                    break
+        elif 'language' in answer:
+            question_text = squash(question_text)
+            for language in self.languages:
+                if language.lower() in question_text:
+                    value = self.languages[language]
+                    break
+        elif 'optionContaining' in answer:
+            for option in options:
+                if any(word in option.lower() for word in answer['optionContaining']):
+                    value = option
+                    break
+
+        if value is not None and answer.get('matchOption'):
+            value = next((option for option in options if str(value).lower() in option.lower()), None)
+        if value is None and answer.get('fallback') == 'first' and options:
+            value = options[0]
+        return value
+
+    def _setting(self, setting, field_type):
+        value = self.settings[setting]
+        if setting == 'noticePeriod':
+            return int(value) if field_type == 'numeric' else str(value)
+        if setting == 'salaryMinimum':
+            return int(value) if field_type == 'numeric' else float(value)
+        return value
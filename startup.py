@@ -0,0 +1,93 @@
+import json, os, re, subprocess, sys, threading, time
+
+DRIVER_CACHE_FILE = "chromedriver_cache.json"
+STARTUP_LOG_FILE = "startup_times.jsonl"
+
+# Where Chrome keeps its version without starting the browser
+CHROME_VERSION_COMMANDS = {
+    'linux': [['google-chrome', '--version'], ['google-chrome-stable', '--version'], ['chromium', '--version'],
+              ['chromium-browser', '--version']],
+    'darwin': [['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome', '--version']],
+    'win32': [['reg', 'query', r'HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon', '/v', 'version'],
+              ['reg', 'query', r'HKEY_LOCAL_MACHINE\Software\Google\Chrome\BLBeacon', '/v', 'version']],
+}
+
+
+def chrome_version():
+    """Return the installed Chrome's version (e.g. '126.0.6478.126'), or None if it cannot be found."""
+    for command in CHROME_VERSION_COMMANDS.get(sys.platform, CHROME_VERSION_COMMANDS['linux']):
+        try:
+            output = subprocess.run(command, capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        version = re.search(r'\d+\.\d+\.\d+\.\d+', output)
+        if version:
+            return version.group(0)
+    return None
+
+
+def resolve_chromedriver(cache_file=DRIVER_CACHE_FILE, use_cache=True):
+    """
+    Return the path of a chromedriver matching the installed Chrome.
+
+    webdriver_manager looks the matching driver up online on every call, so the path it returns
+    is remembered per Chrome version in cache_file and reused while the binary exists. A Chrome
+    update changes the version and resolves a new driver.
+    """
+    version = chrome_version() if use_cache else None
+    cache = {}
+    if version and os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        if os.path.isfile(cache.get(version) or ''):
+            return cache[version]
+
+    from webdriver_manager.chrome import ChromeDriverManager  # only needed when the driver is not cached
+    path = ChromeDriverManager().install()
+    if version:
+        cache[version] = path
+        # Parallel workers may resolve at the same time; write then rename so the file is never half-written
+        temporary = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
+        os.replace(temporary, cache_file)
+    return path
+
+
+class StartupTimer:
+    """Records how long each startup step took since the process started, for --measure-startup."""
+
+    def __init__(self, started, mode):
+        self.started = started
+        self.mode = mode
+        self.marks = []
+
+    def mark(self, name):
+        self.marks.append((name, time.time() - self.started))
+
+    def report(self, log_file=STARTUP_LOG_FILE):
+        """Print the steps, append them to log_file and compare with the last run of the other mode."""
+        print(f"Startup ({self.mode}):")
+        previous = 0.0
+        for name, elapsed in self.marks:
+            print(f"  {name:<24}{elapsed - previous:>8.2f}s  (at {elapsed:.2f}s)")
+            previous = elapsed
+
+        other = None
+        if os.path.exists(log_file):
+            with open(log_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    entry = json.loads(line)
+                    if entry['mode'] != self.mode:
+                        other = entry
+        with open(log_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'ts': round(time.time()), 'mode': self.mode, 'marks': dict(self.marks)}) + "\n")
+
+        total = self.marks[-1][1] if self.marks else 0.0
+        print(f"Time to first search page: {total:.2f}s")
+        if other:
+            other_total = list(other['marks'].values())[-1]
+            print(f"Last {other['mode']} startup: {other_total:.2f}s ({total - other_total:+.2f}s)")
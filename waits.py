@@ -0,0 +1,252 @@
+import random, threading, time
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+
+# Observes the Easy Apply modal (re-attaching when a new one opens) to record when it last changed,
+# and returns a signature of its current step plus the time since its last mutation. Only the modal
+# is observed, so feed updates, toasts and other activity elsewhere on the page do not count.
+MODAL_STATE_SCRIPT = """
+const modal = document.querySelector('.jobs-easy-apply-modal, .artdeco-modal');
+if (window.__easyApplyObserved !== modal) {
+    if (window.__easyApplyObserver) window.__easyApplyObserver.disconnect();
+    window.__easyApplyObserver = null;
+    window.__easyApplyObserved = modal;
+    window.__easyApplyLastMutation = performance.now();
+    if (modal) {
+        window.__easyApplyObserver = new MutationObserver(() => { window.__easyApplyLastMutation = performance.now(); });
+        window.__easyApplyObserver.observe(modal, {childList: true, subtree: true, attributes: true, characterData: true});
+    }
+}
+let signature = '';
+if (modal) {
+    const header = modal.querySelector('form h3');
+    const progress = modal.querySelector('progress, [role="progressbar"]');
+    const primary = modal.querySelector('.artdeco-button--primary');
+    signature = [
+        header ? header.innerText : '',
+        progress ? (progress.getAttribute('value') || progress.getAttribute('aria-valuenow') || '') : '',
+        primary ? primary.innerText : '',
+        modal.querySelectorAll('input, select, textarea').length
+    ].join('|');
+}
+return {
+    modal: !!modal,
+    signature: signature,
+    errors: modal ? modal.querySelectorAll('.artdeco-inline-feedback--error').length : 0,
+    quiet: performance.now() - window.__easyApplyLastMutation
+};
+"""
+
+DETAILS_LOADED_SCRIPT = """
+const jobId = arguments[0];
+const link = document.querySelector('.job-details-jobs-unified-top-card__job-title a, .job-details-jobs-unified-top-card__job-title h1 a');
+const description = document.getElementById('job-details');
+if (!description || !description.innerText.trim()) return false;
+if (!jobId) return !!link;
+return (!!link && link.href.indexOf('/jobs/view/' + jobId) !== -1) || location.href.indexOf('currentJobId=' + jobId) !== -1 || location.href.indexOf('/jobs/view/' + jobId) !== -1;
+"""
+
+# True once the application toast or the post-apply dialog is shown. Other dialogs (such as the
+# discard confirmation) also have a dismiss button, so the dialog is matched by its id or its header.
+CONFIRMATION_SCRIPT = """
+if (document.querySelector('.artdeco-toast-item, .artdeco-toast-item__dismiss, button[data-control-name="save_application_btn"]')) return true;
+if (document.querySelector('#post-apply, [data-test-modal-id="post-apply-modal"], .jobs-post-apply')) return true;
+return Array.from(document.querySelectorAll('.artdeco-modal:not(.jobs-easy-apply-modal) h2, .artdeco-modal:not(.jobs-easy-apply-modal) h3'))
+    .some(header => /application (was )?sent|applied to/i.test(header.innerText));
+"""
+
+# Scrolls arguments[0] down by up to arguments[1] pixels and back to the top, eased and driven by
+# requestAnimationFrame, over arguments[2] milliseconds; reports the time taken. A timer finishes the
+# scroll if frames stop (hidden or throttled tabs), so the call never outlives its budget by much.
+SCROLL_SCRIPT = """
+const [el, distance, duration, done] = arguments;
+const bottom = Math.min(distance, el.scrollHeight - el.clientHeight);
+const started = performance.now();
+let finished = false;
+const finish = () => { if (!finished) { finished = true; el.scrollTop = 0; done(performance.now() - started); } };
+if (bottom <= 0 || duration <= 0) { finish(); return; }
+const down = duration * (0.6 + Math.random() * 0.2);
+const ease = t => t < 0.5 ? 2 * t * t : 1 - Math.pow(2 - 2 * t, 2) / 2;
+const frame = now => {
+    if (finished) return;
+    const t = now - started;
+    if (t >= duration) return finish();
+    el.scrollTop = t < down ? bottom * ease(t / down) : bottom * (1 - ease((t - down) / (duration - down)));
+    requestAnimationFrame(frame);
+};
+requestAnimationFrame(frame);
+setTimeout(finish, duration + 250);
+"""
+
+
+class WaitEngine:
+    """
+    Waits on concrete DOM conditions instead of fixed sleeps, and applies human-like pacing
+    as a separate, bounded random delay (min_delay..max_delay seconds).
+
+    Time is accounted per run: 'conditions' is time spent waiting for the page to reach a
+    state, 'jitter' is deliberate pacing, 'breaks' are the long pauses between result pages and
+    'scrolling' is the human-like scroll through each job description.
+    """
+
+    def __init__(self, driver, min_delay=0.5, max_delay=1.5, timeout=10, quiet_period=0.25, metrics=None,
+                 scroll_budget=3.0):
+        self.browser = driver
+        self.metrics = metrics
+        self.min_delay = min_delay
+        self.max_delay = max(max_delay, min_delay)
+        self.timeout = timeout
+        self.quiet_period = quiet_period
+        self.scroll_budget = scroll_budget
+        self.totals = {'conditions': 0.0, 'jitter': 0.0, 'breaks': 0.0, 'scrolling': 0.0}
+        self.counts = {'conditions': 0, 'jitter': 0, 'breaks': 0, 'scrolling': 0, 'timeouts': 0}
+
+    def pause(self, min_delay=None, max_delay=None):
+        """Sleep for a random human-like delay within the configured floor and ceiling."""
+        low = self.min_delay if min_delay is None else min_delay
+        high = self.max_delay if max_delay is None else max(max_delay, low)
+        self.sleep(random.uniform(low, high), 'jitter')
+
+    def sleep(self, seconds, kind='breaks'):
+        time.sleep(seconds)
+        self._count(kind, seconds)
+
+    def scroll(self, element, distance=1600):
+        """
+        Scroll element down by up to distance pixels and back up in a single script call that
+        animates inside the page, taking between 70% and 100% of scroll_budget seconds. A budget
+        of 0 skips scrolling.
+        """
+        if not self.scroll_budget:
+            return
+        started = time.time()
+        try:
+            self.browser.execute_async_script(SCROLL_SCRIPT, element, distance,
+                                              random.uniform(0.7, 1.0) * self.scroll_budget * 1000)
+        finally:
+            self._count('scrolling', time.time() - started)
+
+    def _count(self, kind, seconds):
+        self.totals[kind] += seconds
+        self.counts[kind] += 1
+        if self.metrics:
+            self.metrics.count_wait(kind, seconds)
+
+    def until(self, condition, description, timeout=None):
+        """Wait until condition(driver) is truthy. Returns its value, or False on timeout."""
+        started = time.time()
+        try:
+            return WebDriverWait(self.browser, timeout or self.timeout, poll_frequency=0.1).until(condition)
+        except TimeoutException:
+            self.counts['timeouts'] += 1
+            print(f"Timed out after {timeout or self.timeout}s waiting for {description}.")
+            return False
+        finally:
+            self._count('conditions', time.time() - started)
+
+    def details_loaded(self, job_id):
+        """Condition: the job details pane shows the job with this ID (any job if job_id is None)."""
+        return lambda driver: driver.execute_script(DETAILS_LOADED_SCRIPT, str(job_id) if job_id else '')
+
+    def results_loaded(self):
+        """Condition: the search results list (or the no-results banner) is shown."""
+        return lambda driver: driver.find_elements(By.CSS_SELECTOR, 'li.scaffold-layout__list-item, .jobs-search-two-pane__no-results-banner--expand')
+
+    def modal_state(self):
+        return self.browser.execute_script(MODAL_STATE_SCRIPT)
+
+    def modal_changed(self, previous_signature, settle=1.0):
+        """
+        Condition: the Easy Apply modal closed, or moved past the step with previous_signature (or
+        is showing validation errors) and has been quiet for quiet_period. A modal that keeps
+        changing counts as settled settle seconds after the new step was first seen.
+        """
+        changed_at = []
+
+        def condition(driver):
+            state = driver.execute_script(MODAL_STATE_SCRIPT)
+            if not state['modal']:
+                return True
+            if state['signature'] == previous_signature and not state['errors']:
+                return False
+            if not changed_at:
+                changed_at.append(time.time())
+            return state['quiet'] >= self.quiet_period * 1000 or time.time() - changed_at[0] >= settle
+        return condition
+
+    def modal_closed(self):
+        return lambda driver: not driver.execute_script(MODAL_STATE_SCRIPT)['modal']
+
+    def confirmation_shown(self):
+        """Condition: the post-submit toast or confirmation dialog is visible."""
+        return lambda driver: driver.execute_script(CONFIRMATION_SCRIPT)
+
+    def summary(self):
+        waited = self.totals['conditions']
+        slept = self.totals['jitter'] + self.totals['breaks']
+        return (f"Waiting summary: {waited:.1f}s on {self.counts['conditions']} page conditions "
+                f"({self.counts['timeouts']} timed out), {self.totals['jitter']:.1f}s of pacing jitter "
+                f"over {self.counts['jitter']} pauses, {self.totals['breaks']:.1f}s in breaks, "
+                f"{self.totals['scrolling']:.1f}s scrolling {self.counts['scrolling']} job descriptions; "
+                f"{slept / (slept + waited) * 100 if slept + waited else 0:.0f}% of waiting was deliberate sleep.")
+
+
+class RunPacer:
+    """
+    Run-wide pacing between result pages, shared by every browser working on the run.
+
+    Each results page counts towards a break every five pages, and a run must last at least
+    minimum_time seconds between breaks. A break sets a common resume time, so with several
+    workers all of them pause, not just the one that triggered it. Applications can also be
+    spaced globally with max_applications_per_hour.
+    """
+
+    def __init__(self, minimum_time=60 * 2, max_applications_per_hour=None):
+        self._lock = threading.Lock()
+        self.pages = 0
+        self.minimum_time = minimum_time
+        self.minimum_page_time = time.time() + minimum_time
+        self.resume_at = 0
+        self.application_interval = 3600 / max_applications_per_hour if max_applications_per_hour else 0
+        self.next_application_at = 0
+
+    def start_page(self, waits):
+        """Wait out any pending break, then count a new results page."""
+        self.wait_turn(waits)
+        with self._lock:
+            self.pages += 1
+
+    def rest(self, waits, end_of_search=False):
+        """Schedule the minimum-time and every-five-pages breaks, then wait them out."""
+        with self._lock:
+            now = max(time.time(), self.resume_at)
+            time_left = self.minimum_page_time - now
+            if time_left > 0:
+                print("Sleeping for " + str(time_left) + " seconds.")
+                now = self.minimum_page_time
+                self.minimum_page_time = now + self.minimum_time
+            if self.pages % 5 == 0:
+                sleep_time = random.randint(500, 900) if end_of_search else random.randint(180, 300)
+                print("Sleeping for " + str(sleep_time / 60) + " minutes.")
+                now += sleep_time
+                self.pages += 1
+            self.resume_at = max(self.resume_at, now)
+        self.wait_turn(waits)
+
+    def wait_turn(self, waits):
+        time_left = self.resume_at - time.time()
+        if time_left > 0:
+            waits.sleep(time_left)
+
+    def application_slot(self, waits):
+        """Block until this worker may start another application under the global rate limit."""
+        if not self.application_interval:
+            return
+        with self._lock:
+            slot = max(time.time(), self.next_application_at)
+            self.next_application_at = slot + self.application_interval
+        time_left = slot - time.time()
+        if time_left > 0:
+            print(f"Rate limit: waiting {time_left:.0f} seconds before the next application.")
+            waits.sleep(time_left)
@@ -0,0 +1,90 @@
+import queue, threading, time, traceback
+from linkedineasyapply import LinkedinEasyApply
+from job_store import JobStore
+from waits import RunPacer
+from metrics import metrics_from_parameters
+from ledger import ledger_from_parameters
+
+
+class WorkerPool:
+    """
+    Runs the position/location searches across several isolated browsers.
+
+    Searches are handed out through a shared queue. All workers share one JobStore, so a job
+    claimed by one worker is skipped by the others, one RunPacer, so page breaks and the
+    application rate limit apply to the whole run rather than to each browser, and one Ledger.
+    """
+
+    def __init__(self, parameters, browser_factory, workers):
+        self.parameters = parameters
+        self.browser_factory = browser_factory
+        self.workers = workers
+        pacing = parameters.get('pacing') or {}
+        self.job_store = JobStore(parameters.get('jobStoreFile') or 'seen_jobs.db')
+        self.pacer = RunPacer(max_applications_per_hour=pacing.get('maxApplicationsPerHour'))
+        self.metrics = metrics_from_parameters(parameters)
+        self.ledger = ledger_from_parameters(parameters)
+        self.searches = queue.Queue()
+        self.stats = {}
+        self._login_lock = threading.Lock()
+
+    def run(self, searches):
+        for search in searches:
+            self.searches.put(search)
+
+        threads = [threading.Thread(target=self._work, args=(index,), name=f"worker-{index}")
+                   for index in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.print_throughput()
+        self.metrics.close()
+        self.ledger.close()
+
+    def _work(self, index):
+        started = time.time()
+        bot = None
+        searches_done = 0
+        try:
+            browser = self.browser_factory(index)
+            bot = LinkedinEasyApply(self.parameters, browser, job_store=self.job_store, pacer=self.pacer,
+                                    metrics=self.metrics, ledger=self.ledger)
+            # Logins (and any security check prompt on the console) happen one worker at a time
+            with self._login_lock:
+                bot.login()
+                bot.security_check()
+
+            while True:
+                try:
+                    position, location = self.searches.get_nowait()
+                except queue.Empty:
+                    break
+                print(f"[worker {index}] Starting the search for {position} in {location}.")
+                bot.run_search(position, location)
+                searches_done += 1
+        except Exception:
+            print(f"[worker {index}] Stopped after an unexpected error:")
+            traceback.print_exc()
+        finally:
+            self.stats[index] = {
+                'applications': bot.applications if bot else 0,
+                'searches': searches_done,
+                'hours': (time.time() - started) / 3600,
+            }
+            if bot:
+                bot.print_run_summary()
+                try:
+                    bot.browser.quit()
+                except Exception:
+                    pass
+
+    def print_throughput(self):
+        total = 0
+        for index, stats in sorted(self.stats.items()):
+            rate = stats['applications'] / stats['hours'] if stats['hours'] else 0
+            total += stats['applications']
+            print(f"Worker {index}: {stats['applications']} applications over {stats['searches']} searches "
+                  f"in {stats['hours']:.2f} h ({rate:.1f} applications/hour)")
+        hours = max((stats['hours'] for stats in self.stats.values()), default=0)
+        print(f"All workers: {total} applications ({total / hours if hours else 0:.1f} applications/hour)")